@@ -1,5 +1,10 @@
 #!/bin/bash
 
+# Metrics of all the gunicorn workers are merged through this directory.
+export PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus_multiproc
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 alembic revision --autogenerate
 alembic upgrade head
-gunicorn src.main:app --worker-class uvicorn.workers.UvicornWorker --bind=0.0.0.0:8000
+gunicorn src.main:app --config infra/gunicorn.conf.py --worker-class uvicorn.workers.UvicornWorker --bind=0.0.0.0:8000
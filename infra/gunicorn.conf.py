@@ -0,0 +1,8 @@
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):
+    """
+    Dropping the live gauges of an exited worker from the metrics.
+    """
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,58 @@
+from typing import (
+    Annotated,
+    Generic,
+    TypeVar,
+)
+
+from fastapi import (
+    Depends,
+    Query,
+)
+from pydantic import BaseModel
+
+from src.config.config import settings
+from src.exceptions.batch import TooManyIdsException
+
+T = TypeVar("T")
+
+
+class BaseBatchResponse(BaseModel, Generic[T]):
+    items: dict[int, T]
+    missing_ids: list[int]
+
+
+def get_batch_ids(
+    ids: str = Query(
+        pattern=r"^\d+(,\d+)*$",
+        description="Comma separated IDs",
+    ),
+) -> list[int]:
+    """
+    Parsing the requested IDs without duplicates.
+    :param ids: Comma separated IDs.
+    :return: List of IDs in the requested order.
+    :raises TooManyIdsException: If there are more IDs than allowed.
+    """
+    batch_ids = list(dict.fromkeys(int(obj_id) for obj_id in ids.split(",")))
+    if len(batch_ids) > settings.api.BATCH_MAX_SIZE:
+        raise TooManyIdsException
+    return batch_ids
+
+
+def get_batch_response(
+    ids: list[int],
+    items: dict[int, T],
+) -> BaseBatchResponse[T]:
+    """
+    Building a response with the found objects and the missing IDs.
+    :param ids: Requested IDs.
+    :param items: Found objects by ID.
+    :return: Pydantic model representing the batch.
+    """
+    return BaseBatchResponse(
+        items=items,
+        missing_ids=[obj_id for obj_id in ids if obj_id not in items],
+    )
+
+
+BatchIdsDep = Annotated[list[int], Depends(get_batch_ids)]
@@ -2,9 +2,22 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from src.config.config import settings
 from src.utils.transaction import (
     BaseManager,
+    InMemoryManager,
+    ReadOnlyTransactionManager,
     TransactionManager,
 )
 
-TransactionDep = Annotated[BaseManager, Depends(TransactionManager)]
+if settings.db.BACKEND == "memory":
+    transaction_manager = read_only_transaction_manager = InMemoryManager
+else:
+    transaction_manager = TransactionManager
+    read_only_transaction_manager = ReadOnlyTransactionManager
+
+TransactionDep = Annotated[BaseManager, Depends(transaction_manager)]
+ReadOnlyTransactionDep = Annotated[
+    BaseManager,
+    Depends(read_only_transaction_manager),
+]
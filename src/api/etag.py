@@ -0,0 +1,47 @@
+import hashlib
+
+from fastapi import (
+    Request,
+    Response,
+    status,
+)
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Building a strong entity tag from the version parts of a resource.
+    :param parts: Values identifying the resource state.
+    :return: Quoted entity tag.
+    """
+    digest = hashlib.blake2b(
+        repr(parts).encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Checking the If-None-Match header against the entity tag.
+    :param request: Request.
+    :param etag: Current entity tag of the resource.
+    :return: Whether the client copy is up to date.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Building a response without a body for an up to date client copy.
+    :param etag: Current entity tag of the resource.
+    :return: Response with the 304 status code.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag},
+    )
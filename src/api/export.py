@@ -0,0 +1,106 @@
+import csv
+import io
+from enum import Enum
+from typing import (
+    AsyncIterator,
+    TypeVar,
+)
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+T = TypeVar(
+    "T",
+    bound=BaseModel,
+)
+
+# Rows are grouped into chunks to avoid one network write per row.
+CHUNK_ROWS = 500
+
+
+class ExportFormatEnum(Enum):
+    NDJSON: str = "ndjson"
+    CSV: str = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
+
+
+async def to_ndjson(items: AsyncIterator[T]) -> AsyncIterator[bytes]:
+    """
+    Encoding Pydantic models as newline-delimited JSON.
+    :param items: Asynchronous iterator over Pydantic models.
+    :return: Asynchronous iterator over encoded chunks.
+    """
+    chunk = []
+    async for item in items:
+        chunk.append(item.model_dump_json())
+        if len(chunk) == CHUNK_ROWS:
+            yield ("\n".join(chunk) + "\n").encode()
+            chunk = []
+    if chunk:
+        yield ("\n".join(chunk) + "\n").encode()
+
+
+async def to_csv(
+    items: AsyncIterator[T],
+    fields: list[str],
+) -> AsyncIterator[bytes]:
+    """
+    Encoding Pydantic models as CSV with a header row.
+    :param items: Asynchronous iterator over Pydantic models.
+    :param fields: Names of the exported fields.
+    :return: Asynchronous iterator over encoded chunks.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    rows = 0
+    async for item in items:
+        writer.writerow(getattr(item, field) for field in fields)
+        rows += 1
+        if rows == CHUNK_ROWS:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if rows:
+        yield buffer.getvalue().encode()
+
+
+def get_export_response(
+    items: AsyncIterator[T],
+    schema: type[T],
+    export_format: ExportFormatEnum,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Building a streaming response with exported objects.
+    :param items: Asynchronous iterator over Pydantic models.
+    :param schema: Pydantic model class of the items.
+    :param export_format: Format of the export.
+    :param filename: Name of the file without extension.
+    :return: Streaming response.
+    """
+    if export_format == ExportFormatEnum.CSV:
+        fields = [
+            name for name, field in schema.model_fields.items() if not field.exclude
+        ]
+        content = to_csv(items, fields)
+    else:
+        content = to_ndjson(items)
+    return StreamingResponse(
+        content,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            ),
+        },
+    )
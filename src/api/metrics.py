@@ -0,0 +1,35 @@
+from fastapi import (
+    APIRouter,
+    Response,
+    status,
+)
+
+from src.utils.metrics import (
+    METRICS_CONTENT_TYPE,
+    get_metrics,
+)
+
+
+router = APIRouter(
+    tags=["Monitoring"],
+)
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="Getting the metrics",
+    description=(
+        "Getting the metrics of all the workers in the Prometheus text format."
+    ),
+    response_class=Response,
+)
+async def get_app_metrics() -> Response:
+    """
+    Getting the metrics.
+    :return: Metrics in the Prometheus text format.
+    """
+    return Response(
+        content=get_metrics(),
+        media_type=METRICS_CONTENT_TYPE,
+    )
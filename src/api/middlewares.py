@@ -0,0 +1,159 @@
+import math
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from src.config.config import settings
+from src.db.replicas import primary_pinned
+from src.utils.instrumentation import (
+    RequestStats,
+    logger,
+    request_stats,
+)
+from src.utils.metrics import (
+    REQUEST_DURATION,
+    REQUESTS_IN_FLIGHT,
+    RESPONSES,
+)
+
+PRIMARY_PIN_COOKIE = "primary_pinned"
+
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+class PrimaryPinningMiddleware:
+    """
+    Pinning the reads of a client to the primary after its writes,
+    so that the client reads its own writes despite the replication lag.
+    A successful write sets a cookie living for the maximum lag,
+    requests with the cookie are not routed to the replicas
+    and do not join the reads in flight started before the write.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialization the middleware.
+        :param app: ASGI application.
+        """
+        self.app = app
+        self.cookie = (
+            f"{PRIMARY_PIN_COOKIE}=1; "
+            f"Max-Age={math.ceil(settings.db.REPLICA_MAX_LAG)}; "
+            "Path=/; HttpOnly; SameSite=Lax"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        is_write = scope["method"] not in SAFE_METHODS
+
+        async def send_with_cookie(message: Message) -> None:
+            if (
+                is_write
+                and message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                headers = MutableHeaders(scope=message)
+                headers.append("Set-Cookie", self.cookie)
+            await send(message)
+
+        pinned = PRIMARY_PIN_COOKIE in HTTPConnection(scope).cookies
+        token = primary_pinned.set(pinned)
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            primary_pinned.reset(token)
+
+
+class MetricsMiddleware:
+    """
+    Measuring the duration, the quantity in flight and the status codes
+    of the HTTP requests.
+    Requests are labeled with the route template, not the path,
+    so the IDs in the paths do not multiply the series.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialization the middleware.
+        :param app: ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            route = route.path if route is not None else "unmatched"
+            REQUEST_DURATION.labels(scope["method"], route).observe(
+                time.perf_counter() - started_at,
+            )
+            RESPONSES.labels(scope["method"], route, status_code).inc()
+
+
+class ServerTimingMiddleware:
+    """
+    Reporting the database and serialization time of a request
+    in the Server-Timing header, and warning about the requests
+    with more queries than allowed, such as N+1 lazy loads.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialization the middleware.
+        :param app: ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        token = request_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_stats.reset(token)
+            if stats.queries > settings.instrumentation.MAX_QUERIES:
+                logger.warning(
+                    "%s %s issued %d queries, more than %d",
+                    scope["method"],
+                    scope["path"],
+                    stats.queries,
+                    settings.instrumentation.MAX_QUERIES,
+                )
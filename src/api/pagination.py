@@ -1,3 +1,6 @@
+import base64
+import binascii
+import json
 from typing import (
     Generic,
     TypeVar,
@@ -5,7 +8,10 @@ from typing import (
 from fastapi import Query
 from pydantic import BaseModel
 
-from src.exceptions.pagination import PageNotFoundException
+from src.exceptions.pagination import (
+    InvalidCursorException,
+    PageNotFoundException,
+)
 
 T = TypeVar("T")
 
@@ -24,6 +30,19 @@ class PaginationParams(BaseModel):
     )
 
 
+class CursorPaginationParams(BaseModel):
+    after: str | None = Query(
+        None,
+        description="Cursor of the last item of the previous page",
+    )
+    size: int = Query(
+        10,
+        ge=1,
+        le=100,
+        description="Page size",
+    )
+
+
 class BasePaginationResponse(BaseModel, Generic[T]):
     items: list[T]
     total: int
@@ -32,31 +51,107 @@ class BasePaginationResponse(BaseModel, Generic[T]):
     pages: int
 
 
+class BaseCursorPaginationResponse(BaseModel, Generic[T]):
+    items: list[T]
+    size: int
+    next_cursor: str | None
+
+
 class Paginator(Generic[T]):
     def __init__(
         self,
-        pages: list[T],
+        total: int,
         params: PaginationParams,
     ):
-        self.pages = pages
+        """
+        Initialization the paginator.
+        :param total: Total quantity of items.
+        :param params: Pagination params.
+        :raises PageNotFoundException: If the page is out of range.
+        """
+        self.total = total
         self.params = params
+        self.pages = total // params.size + bool(total % params.size)
+        if self.params.page > self.pages != 0:
+            raise PageNotFoundException
 
-    def paginate(self) -> list[T]:
-        start = (self.params.page - 1) * self.params.size
-        end = start + self.params.size
-        return self.pages[start:end]
+    @property
+    def offset(self) -> int:
+        return (self.params.page - 1) * self.params.size
 
-    def get_response(self) -> BasePaginationResponse:
-        items_quantity = len(self.pages)
-        pages_quantity = items_quantity // self.params.size + bool(
-            items_quantity % self.params.size
-        )
-        if self.params.page > pages_quantity != 0:
-            raise PageNotFoundException
+    @property
+    def limit(self) -> int:
+        return self.params.size
+
+    def get_response(self, items: list[T]) -> BasePaginationResponse[T]:
+        """
+        Building a page response.
+        :param items: Items of the current page.
+        :return: Pydantic model representing the page.
+        """
         return BasePaginationResponse[T](
-            items=self.paginate(),
-            total=items_quantity,
+            items=items,
+            total=self.total,
             page=self.params.page,
             size=self.params.size,
-            pages=pages_quantity,
+            pages=self.pages,
+        )
+
+
+class CursorPaginator(Generic[T]):
+    def __init__(
+        self,
+        params: CursorPaginationParams,
+    ):
+        """
+        Initialization the keyset paginator.
+        :param params: Cursor pagination params.
+        :raises InvalidCursorException: If the cursor cannot be decoded.
+        """
+        self.params = params
+        self.after_id = self.decode(params.after) if params.after is not None else None
+
+    @property
+    def limit(self) -> int:
+        # One extra item tells whether the next page exists.
+        return self.params.size + 1
+
+    @staticmethod
+    def encode(obj_id: int) -> str:
+        """
+        Encoding an object ID into an opaque cursor.
+        :param obj_id: Object ID.
+        :return: Cursor.
+        """
+        payload = json.dumps({"id": obj_id}).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    @staticmethod
+    def decode(cursor: str) -> int:
+        """
+        Decoding an opaque cursor into an object ID.
+        :param cursor: Cursor.
+        :return: Object ID.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            obj_id = payload["id"]
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidCursorException
+        if not isinstance(obj_id, int):
+            raise InvalidCursorException
+        return obj_id
+
+    def get_response(self, items: list[T]) -> BaseCursorPaginationResponse[T]:
+        """
+        Building a page response.
+        :param items: Items fetched with the paginator limit.
+        :return: Pydantic model representing the page.
+        """
+        items, rest = items[: self.params.size], items[self.params.size :]
+        next_cursor = self.encode(items[-1].id) if rest else None
+        return BaseCursorPaginationResponse[T](
+            items=items,
+            size=self.params.size,
+            next_cursor=next_cursor,
         )
@@ -0,0 +1,26 @@
+import time
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+from src.utils.instrumentation import request_stats
+
+
+class ModelResponse(JSONResponse):
+    """
+    JSON response for the read models returned by the services.
+    The models are already validated, so they are serialized
+    straight to bytes without FastAPI response-model validation
+    and without building an intermediate dict.
+    Routes declare the schema with response_model for the docs.
+    """
+
+    def render(self, content: Any) -> bytes:
+        stats = request_stats.get()
+        if stats is None:
+            return to_json(content)
+        started_at = time.perf_counter()
+        body = to_json(content)
+        stats.serialization_time += time.perf_counter() - started_at
+        return body
@@ -0,0 +1,67 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import (
+    Depends,
+    Query,
+)
+
+from src.exceptions.scores import TimeseriesTargetException
+from src.models.utils import ClassNamesEnum
+from src.schemas.scores import (
+    ScoresTimeseriesParams,
+    TimeBucketEnum,
+)
+
+
+def get_timeseries_params(
+    student_id: int | None = Query(
+        None,
+        ge=1,
+        description="Student ID",
+    ),
+    class_name: ClassNamesEnum | None = Query(
+        None,
+        description="Class name",
+    ),
+    bucket: TimeBucketEnum = Query(
+        TimeBucketEnum.WEEK,
+        description="Bucket width",
+    ),
+    date_from: date | None = Query(
+        None,
+        alias="from",
+        description="Earliest date of receipt",
+    ),
+    date_to: date | None = Query(
+        None,
+        alias="to",
+        description="Latest date of receipt",
+    ),
+) -> ScoresTimeseriesParams:
+    """
+    Parsing the timeseries params of a student or a class.
+    :param student_id: Student ID.
+    :param class_name: Class name.
+    :param bucket: Bucket width.
+    :param date_from: Earliest date of receipt.
+    :param date_to: Latest date of receipt.
+    :return: Pydantic model representing the params.
+    :raises TimeseriesTargetException: If neither or both of the student
+    and the class are given.
+    """
+    if (student_id is None) == (class_name is None):
+        raise TimeseriesTargetException
+    return ScoresTimeseriesParams(
+        student_id=student_id,
+        class_name=class_name,
+        bucket=bucket,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+
+TimeseriesParamsDep = Annotated[
+    ScoresTimeseriesParams,
+    Depends(get_timeseries_params),
+]
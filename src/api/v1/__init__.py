@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from src.api.v1.monitoring import router as monitoring_router
 from src.api.v1.scores import router as scores_router
 from src.api.v1.students import router as students_router
 from src.config.config import settings
@@ -7,6 +8,7 @@ from src.config.config import settings
 routers = (
     scores_router,
     students_router,
+    monitoring_router,
 )
 
 router_v1 = APIRouter(prefix=settings.api.V1_PREFIX)
@@ -0,0 +1,44 @@
+from fastapi import (
+    APIRouter,
+    status,
+)
+
+from src.schemas.monitoring import (
+    CacheStatsSchema,
+    SingleFlightStatsSchema,
+)
+from src.services.monitoring import MonitoringService
+
+
+router = APIRouter(
+    tags=["Monitoring"],
+    prefix="/monitoring",
+)
+
+
+@router.get(
+    "/cache",
+    status_code=status.HTTP_200_OK,
+    summary="Getting the cache stats",
+    description="Getting hit/miss counters of the repository cache of the worker.",
+)
+async def get_cache_stats() -> CacheStatsSchema:
+    """
+    Getting the cache stats.
+    :return: Pydantic model representing the cache stats.
+    """
+    return MonitoringService.get_cache_stats()
+
+
+@router.get(
+    "/single-flight",
+    status_code=status.HTTP_200_OK,
+    summary="Getting the read coalescing stats",
+    description="Getting counters of the coalesced identical reads of the worker.",
+)
+async def get_single_flight_stats() -> SingleFlightStatsSchema:
+    """
+    Getting the read coalescing stats.
+    :return: Pydantic model representing the coalescing stats.
+    """
+    return MonitoringService.get_single_flight_stats()
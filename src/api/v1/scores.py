@@ -1,18 +1,51 @@
+from typing import (
+    Annotated,
+    Any,
+)
+
 from fastapi import (
     APIRouter,
+    Body,
     Depends,
+    Query,
+    Request,
     status,
 )
+from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import TransactionDep
+from src.api.batch import (
+    BaseBatchResponse,
+    BatchIdsDep,
+)
+from src.api.dependencies import (
+    ReadOnlyTransactionDep,
+    TransactionDep,
+)
+from src.api.etag import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+from src.api.export import (
+    ExportFormatEnum,
+    get_export_response,
+)
 from src.api.pagination import (
+    BaseCursorPaginationResponse,
     BasePaginationResponse,
+    CursorPaginationParams,
     PaginationParams,
 )
+from src.api.responses import ModelResponse
+from src.api.timeseries import TimeseriesParamsDep
+from src.config.config import settings
 from src.schemas.scores import (
     AddScoreSchema,
+    BulkScoresSchema,
     ScoreSchema,
     ScoreIdSchema,
+    ScoresFilterParams,
+    ScoresTimeseriesSchema,
     UpdateScoreSchema,
 )
 from src.services.scores import ScoresService
@@ -28,21 +61,153 @@ router = APIRouter(
     "/all",
     status_code=status.HTTP_200_OK,
     summary="Getting all scores",
-    description="Getting all scores with pagination",
+    description="Getting all scores with pagination and filters",
+    response_model=BasePaginationResponse[ScoreSchema],
 )
 async def get_all_scores(
-    transaction: TransactionDep,
+    transaction: ReadOnlyTransactionDep,
+    request: Request,
     pagination: PaginationParams = Depends(),
-) -> BasePaginationResponse[ScoreSchema]:
+    filters: ScoresFilterParams = Depends(),
+) -> ModelResponse:
     """
     Getting all scores.
+    Answers 304 if the page versions match If-None-Match.
     :param transaction: Database transaction.
+    :param request: Request.
     :param pagination: Pagination params.
+    :param filters: Filter params.
     :return: List of Pydantic models representing the scores.
     """
-    return await ScoresService.get_all_scores(
+    scores = await ScoresService.get_all_scores(
         transaction,
         pagination,
+        filters,
+    )
+    etag = make_etag(
+        "scores",
+        pagination.page,
+        pagination.size,
+        filters,
+        scores.total,
+        [(score.id, score.version) for score in scores.items],
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return ModelResponse(
+        scores,
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    "/all/cursor",
+    status_code=status.HTTP_200_OK,
+    summary="Getting all scores by cursor",
+    description="Getting scores with keyset pagination.",
+    response_model=BaseCursorPaginationResponse[ScoreSchema],
+)
+async def get_scores_by_cursor(
+    transaction: ReadOnlyTransactionDep,
+    pagination: CursorPaginationParams = Depends(),
+) -> ModelResponse:
+    """
+    Getting scores by cursor.
+    :param transaction: Database transaction.
+    :param pagination: Cursor pagination params.
+    :return: List of Pydantic models representing the scores.
+    """
+    return ModelResponse(
+        await ScoresService.get_scores_by_cursor(
+            transaction,
+            pagination,
+        ),
+    )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Exporting all scores",
+    description="Streaming all scores as NDJSON or CSV.",
+    response_class=StreamingResponse,
+)
+async def export_scores(
+    transaction: ReadOnlyTransactionDep,
+    export_format: ExportFormatEnum = Query(
+        ExportFormatEnum.NDJSON,
+        alias="format",
+        description="Export format",
+    ),
+) -> StreamingResponse:
+    """
+    Exporting all scores.
+    :param transaction: Database transaction.
+    :param export_format: Export format.
+    :return: Streaming response with the scores.
+    """
+    return get_export_response(
+        ScoresService.export_scores(transaction),
+        ScoreSchema,
+        export_format,
+        "scores",
+    )
+
+
+@router.get(
+    "/timeseries",
+    status_code=status.HTTP_200_OK,
+    summary="Getting the average score trend",
+    description=(
+        "Getting the average score of a student or a class "
+        "by weeks or months as [start, average, count] buckets."
+    ),
+    response_model=ScoresTimeseriesSchema,
+)
+async def get_scores_timeseries(
+    transaction: ReadOnlyTransactionDep,
+    params: TimeseriesParamsDep,
+) -> ModelResponse:
+    """
+    Getting the average score trend.
+    :param transaction: Database transaction.
+    :param params: Timeseries params.
+    :return: Pydantic model representing the buckets.
+    """
+    return ModelResponse(
+        await ScoresService.get_scores_timeseries(
+            transaction,
+            params,
+        ),
+    )
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Getting scores by IDs",
+    description=(
+        "Getting scores by a list of IDs with one query, "
+        "the missing IDs are reported."
+    ),
+    response_model=BaseBatchResponse[ScoreSchema],
+)
+async def get_scores_by_ids(
+    transaction: ReadOnlyTransactionDep,
+    ids: BatchIdsDep,
+) -> ModelResponse:
+    """
+    Getting scores by IDs.
+    :param transaction: Database transaction.
+    :param ids: Score IDs.
+    :return: Pydantic models representing the scores by ID
+    and the missing IDs.
+    """
+    return ModelResponse(
+        await ScoresService.get_scores_by_ids(
+            transaction,
+            ids,
+        ),
     )
 
 
@@ -51,21 +216,32 @@ async def get_all_scores(
     status_code=status.HTTP_200_OK,
     summary="Getting a score by ID",
     description="Getting a score by ID.",
+    response_model=ScoreSchema,
 )
 async def get_score(
-    transaction: TransactionDep,
+    transaction: ReadOnlyTransactionDep,
+    request: Request,
     score_id: int,
-) -> ScoreSchema:
+) -> ModelResponse:
     """
     Getting a score by ID.
+    Answers 304 if the score version matches If-None-Match.
     :param transaction: Database transaction.
+    :param request: Request.
     :param score_id: Score ID.
     :return: Pydantic model representing the score.
     """
-    return await ScoresService.get_score(
+    score = await ScoresService.get_score(
         transaction,
         score_id,
     )
+    etag = make_etag("scores", score_id, score.version)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return ModelResponse(
+        score,
+        headers={"ETag": etag},
+    )
 
 
 @router.post(
@@ -73,20 +249,71 @@ async def get_score(
     status_code=status.HTTP_201_CREATED,
     summary="Adding a new score",
     description="Adding a new score.",
+    response_model=ScoreIdSchema,
 )
 async def add_score(
     transaction: TransactionDep,
     score_data: AddScoreSchema,
-) -> ScoreIdSchema:
+) -> ModelResponse:
     """
     Adding a new score.
     :param transaction: Database transaction.
     :param score_data: Pydantic model representing score data.
     :return: Pydantic model representing the created score ID.
     """
-    return await ScoresService.add_score(
-        transaction,
-        score_data,
+    return ModelResponse(
+        await ScoresService.add_score(
+            transaction,
+            score_data,
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Adding scores in bulk",
+    description=(
+        "Adding scores in one transaction. "
+        "Items are validated as in adding a new score; "
+        "invalid items are reported by index and skipped."
+    ),
+    response_model=BulkScoresSchema,
+    # Items are validated one by one in the service,
+    # the documented item is the one of adding a new score.
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "items": AddScoreSchema.model_json_schema(),
+                    },
+                },
+            },
+        },
+    },
+)
+async def add_scores(
+    transaction: TransactionDep,
+    scores_data: Annotated[
+        list[dict[str, Any]],
+        Body(max_length=settings.api.BULK_MAX_SIZE),
+    ],
+) -> ModelResponse:
+    """
+    Adding scores in bulk.
+    :param transaction: Database transaction.
+    :param scores_data: Raw scores data.
+    :return: Pydantic model representing the created scores IDs
+    and the errors by item index.
+    """
+    return ModelResponse(
+        await ScoresService.add_scores(
+            transaction,
+            scores_data,
+        ),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -95,12 +322,13 @@ async def add_score(
     status_code=status.HTTP_200_OK,
     summary="Updating a score by ID",
     description="Updating a score by ID.",
+    response_model=ScoreIdSchema,
 )
 async def update_score(
     transaction: TransactionDep,
     new_score: UpdateScoreSchema,
     score_id: int,
-) -> ScoreIdSchema:
+) -> ModelResponse:
     """
     Updating a score by ID.
     :param transaction: Database transaction.
@@ -108,10 +336,12 @@ async def update_score(
     :param new_score: Pydantic model representing new score.
     :return: Pydantic model representing the updated score ID.
     """
-    return await ScoresService.update_score(
-        transaction,
-        score_id,
-        new_score,
+    return ModelResponse(
+        await ScoresService.update_score(
+            transaction,
+            score_id,
+            new_score,
+        ),
     )
 
 
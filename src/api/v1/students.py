@@ -1,18 +1,47 @@
+from typing import Annotated
+
 from fastapi import (
     APIRouter,
+    Body,
     Depends,
+    Query,
+    Request,
     status,
 )
 
-from src.api.dependencies import TransactionDep
+from src.api.batch import (
+    BaseBatchResponse,
+    BatchIdsDep,
+)
+from src.api.dependencies import (
+    ReadOnlyTransactionDep,
+    TransactionDep,
+)
+from src.api.etag import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
 from src.api.pagination import (
+    BaseCursorPaginationResponse,
     BasePaginationResponse,
+    CursorPaginationParams,
     PaginationParams,
 )
+from src.api.responses import ModelResponse
+from src.config.config import settings
+from src.models.utils import ClassNamesEnum
 from src.schemas.students import (
     AddStudentSchema,
+    FoundStudentSchema,
+    ImportedStudentsSchema,
+    ImportStudentSchema,
+    LeaderboardEntrySchema,
+    RankedStudentSchema,
     StudentIdSchema,
     StudentSchema,
+    StudentStatsSchema,
+    StudentSummarySchema,
     UpdateStudentSchema,
 )
 from src.services.students import StudentsService
@@ -29,21 +58,221 @@ router = APIRouter(
     status_code=status.HTTP_200_OK,
     summary="Getting all students",
     description="Getting all students with their scores with pagination.",
+    response_model=BasePaginationResponse[StudentSchema],
 )
 async def get_all_students(
-    transaction: TransactionDep,
+    transaction: ReadOnlyTransactionDep,
+    request: Request,
     pagination: PaginationParams = Depends(),
-) -> BasePaginationResponse[StudentSchema]:
+) -> ModelResponse:
     """
     Getting all students.
+    Answers 304 if the page versions match If-None-Match.
     :param transaction: Database transaction.
+    :param request: Request.
     :param pagination: Pagination params.
     :return: List of Pydantic models representing the students.
     """
-    return await StudentsService.get_all_students(
+    students = await StudentsService.get_all_students(
         transaction,
         pagination,
     )
+    etag = make_etag(
+        "students",
+        pagination.page,
+        pagination.size,
+        students.total,
+        [(student.id, student.version) for student in students.items],
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return ModelResponse(
+        students,
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    "/all/cursor",
+    status_code=status.HTTP_200_OK,
+    summary="Getting all students by cursor",
+    description="Getting students with their scores with keyset pagination.",
+    response_model=BaseCursorPaginationResponse[StudentSchema],
+)
+async def get_students_by_cursor(
+    transaction: ReadOnlyTransactionDep,
+    pagination: CursorPaginationParams = Depends(),
+) -> ModelResponse:
+    """
+    Getting students by cursor.
+    :param transaction: Database transaction.
+    :param pagination: Cursor pagination params.
+    :return: List of Pydantic models representing the students.
+    """
+    return ModelResponse(
+        await StudentsService.get_students_by_cursor(
+            transaction,
+            pagination,
+        ),
+    )
+
+
+@router.get(
+    "/stats",
+    status_code=status.HTTP_200_OK,
+    summary="Getting scores stats of all students",
+    description="Getting scores stats of all students with pagination.",
+    response_model=BasePaginationResponse[StudentStatsSchema],
+)
+async def get_students_stats(
+    transaction: ReadOnlyTransactionDep,
+    pagination: PaginationParams = Depends(),
+) -> ModelResponse:
+    """
+    Getting scores stats of all students.
+    :param transaction: Database transaction.
+    :param pagination: Pagination params.
+    :return: List of Pydantic models representing the students stats.
+    """
+    return ModelResponse(
+        await StudentsService.get_students_stats(
+            transaction,
+            pagination,
+        ),
+    )
+
+
+@router.get(
+    "/summary",
+    status_code=status.HTTP_200_OK,
+    summary="Getting scores summary of all students",
+    description=(
+        "Getting the maintained scores count, average "
+        "and the latest date of all students with pagination."
+    ),
+    response_model=BasePaginationResponse[StudentSummarySchema],
+)
+async def get_students_summary(
+    transaction: ReadOnlyTransactionDep,
+    pagination: PaginationParams = Depends(),
+) -> ModelResponse:
+    """
+    Getting scores summary of all students.
+    :param transaction: Database transaction.
+    :param pagination: Pagination params.
+    :return: List of Pydantic models representing the students summary.
+    """
+    return ModelResponse(
+        await StudentsService.get_students_summary(
+            transaction,
+            pagination,
+        ),
+    )
+
+
+@router.get(
+    "/leaderboard",
+    status_code=status.HTTP_200_OK,
+    summary="Getting the leaderboard of a class",
+    description=(
+        "Getting the best students of a class by the average score "
+        "with their rank and percentile within the class."
+    ),
+    response_model=list[LeaderboardEntrySchema],
+)
+async def get_leaderboard(
+    transaction: ReadOnlyTransactionDep,
+    class_name: ClassNamesEnum,
+    limit: int = Query(
+        10,
+        ge=1,
+        le=100,
+        description="Quantity of students",
+    ),
+) -> ModelResponse:
+    """
+    Getting the leaderboard of a class.
+    :param transaction: Database transaction.
+    :param class_name: Class name.
+    :param limit: Quantity of students.
+    :return: List of Pydantic models representing the leaderboard.
+    """
+    return ModelResponse(
+        await StudentsService.get_leaderboard(
+            transaction,
+            class_name,
+            limit,
+        ),
+    )
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    summary="Searching for students by name",
+    description=(
+        "Searching for students by a part of the first or the last name, "
+        "the most similar first."
+    ),
+    response_model=list[FoundStudentSchema],
+)
+async def search_students(
+    transaction: ReadOnlyTransactionDep,
+    q: str = Query(
+        min_length=2,
+        max_length=50,
+        description="Part of the name",
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=50,
+        description="Quantity of students",
+    ),
+) -> ModelResponse:
+    """
+    Searching for students by name.
+    :param transaction: Database transaction.
+    :param q: Part of the name.
+    :param limit: Quantity of students.
+    :return: List of Pydantic models representing the found students.
+    """
+    return ModelResponse(
+        await StudentsService.search_students(
+            transaction,
+            q,
+            limit,
+        ),
+    )
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Getting students by IDs",
+    description=(
+        "Getting students by a list of IDs with one query, "
+        "the missing IDs are reported."
+    ),
+    response_model=BaseBatchResponse[StudentSchema],
+)
+async def get_students_by_ids(
+    transaction: ReadOnlyTransactionDep,
+    ids: BatchIdsDep,
+) -> ModelResponse:
+    """
+    Getting students by IDs.
+    :param transaction: Database transaction.
+    :param ids: Student IDs.
+    :return: Pydantic models representing the students by ID
+    and the missing IDs.
+    """
+    return ModelResponse(
+        await StudentsService.get_students_by_ids(
+            transaction,
+            ids,
+        ),
+    )
 
 
 @router.get(
@@ -51,21 +280,113 @@ async def get_all_students(
     status_code=status.HTTP_200_OK,
     summary="Getting a student by ID",
     description="Getting a student with their scores by ID.",
+    response_model=StudentSchema,
 )
 async def get_student(
-    transaction: TransactionDep,
+    transaction: ReadOnlyTransactionDep,
+    request: Request,
     student_id: int,
-) -> StudentSchema:
+) -> ModelResponse:
     """
     Getting a student by ID.
+    Answers 304 if the student version matches If-None-Match.
     :param transaction: Database transaction.
+    :param request: Request.
     :param student_id: Student ID.
     :return: Pydantic model representing the student.
     """
-    return await StudentsService.get_student(
+    student = await StudentsService.get_student(
         transaction,
         student_id,
     )
+    etag = make_etag("students", student_id, student.version)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return ModelResponse(
+        student,
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    "/{student_id}/ranked",
+    status_code=status.HTTP_200_OK,
+    summary="Getting a ranked student by ID",
+    description=(
+        "Getting a student with their scores, rank and percentile "
+        "within the class by ID."
+    ),
+    response_model=RankedStudentSchema,
+)
+async def get_ranked_student(
+    transaction: ReadOnlyTransactionDep,
+    student_id: int,
+) -> ModelResponse:
+    """
+    Getting a ranked student by ID.
+    :param transaction: Database transaction.
+    :param student_id: Student ID.
+    :return: Pydantic model representing the ranked student.
+    """
+    return ModelResponse(
+        await StudentsService.get_ranked_student(
+            transaction,
+            student_id,
+        ),
+    )
+
+
+@router.get(
+    "/{student_id}/stats",
+    status_code=status.HTTP_200_OK,
+    summary="Getting scores stats of a student by ID",
+    description="Getting scores stats of a student by ID.",
+    response_model=StudentStatsSchema,
+)
+async def get_student_stats(
+    transaction: ReadOnlyTransactionDep,
+    student_id: int,
+) -> ModelResponse:
+    """
+    Getting scores stats of a student by ID.
+    :param transaction: Database transaction.
+    :param student_id: Student ID.
+    :return: Pydantic model representing the student stats.
+    """
+    return ModelResponse(
+        await StudentsService.get_student_stats(
+            transaction,
+            student_id,
+        ),
+    )
+
+
+@router.get(
+    "/{student_id}/summary",
+    status_code=status.HTTP_200_OK,
+    summary="Getting scores summary of a student by ID",
+    description=(
+        "Getting the maintained scores count, average "
+        "and the latest date of a student by ID."
+    ),
+    response_model=StudentSummarySchema,
+)
+async def get_student_summary(
+    transaction: ReadOnlyTransactionDep,
+    student_id: int,
+) -> ModelResponse:
+    """
+    Getting scores summary of a student by ID.
+    :param transaction: Database transaction.
+    :param student_id: Student ID.
+    :return: Pydantic model representing the student summary.
+    """
+    return ModelResponse(
+        await StudentsService.get_student_summary(
+            transaction,
+            student_id,
+        ),
+    )
 
 
 @router.post(
@@ -73,20 +394,58 @@ async def get_student(
     status_code=status.HTTP_201_CREATED,
     summary="Adding a new student",
     description="Adding a new student.",
+    response_model=StudentIdSchema,
 )
 async def add_student(
     transaction: TransactionDep,
     student_data: AddStudentSchema,
-) -> StudentIdSchema:
+) -> ModelResponse:
     """
     Adding a new student.
     :param transaction: Database transaction.
     :param student_data: Pydantic model representing student data.
     :return: Pydantic model representing the created student ID.
     """
-    return await StudentsService.add_student(
-        transaction,
-        student_data,
+    return ModelResponse(
+        await StudentsService.add_student(
+            transaction,
+            student_data,
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Adding students in bulk",
+    description=(
+        "Adding students in one transaction. "
+        "Returns the created students IDs by client-supplied keys."
+    ),
+    response_model=ImportedStudentsSchema,
+)
+async def import_students(
+    transaction: TransactionDep,
+    students_data: Annotated[
+        list[ImportStudentSchema],
+        Body(max_length=settings.api.BULK_MAX_SIZE),
+    ],
+) -> ModelResponse:
+    """
+    Adding students in bulk.
+    :param transaction: Database transaction.
+    :param students_data: Pydantic models representing students data
+    with client-supplied keys.
+    :return: Pydantic model representing the mapping
+    from the keys to the created students IDs.
+    """
+    return ModelResponse(
+        await StudentsService.import_students(
+            transaction,
+            students_data,
+        ),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -95,12 +454,13 @@ async def add_student(
     status_code=status.HTTP_200_OK,
     summary="Updating a student by ID",
     description="Updating a student by ID.",
+    response_model=StudentIdSchema,
 )
 async def update_student(
     transaction: TransactionDep,
     student_data: UpdateStudentSchema,
     student_id: int,
-) -> StudentIdSchema:
+) -> ModelResponse:
     """
     Updating a student by ID.
     :param transaction: Database transaction.
@@ -108,10 +468,12 @@ async def update_student(
     :param student_data: Pydantic model representing student data.
     :return: Pydantic model representing the updated student ID.
     """
-    return await StudentsService.update_student(
-        transaction,
-        student_id,
-        student_data,
+    return ModelResponse(
+        await StudentsService.update_student(
+            transaction,
+            student_id,
+            student_data,
+        ),
     )
 
 
@@ -0,0 +1,73 @@
+"""
+Running the benchmarks:
+
+    python -m src.benchmarks [--filter NAME] [--save-baseline]
+
+The results are saved to results/latest.json and compared with
+baseline.json, the exit code is 1 if a benchmark regressed or if the
+baseline was measured with another Python or machine type.
+The repository benchmarks use the database of the settings
+and are skipped if it is not available. A baseline is saved only
+if no benchmark was skipped.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from src.benchmarks import (  # noqa: F401, the modules register benchmarks
+    bench_models,
+    bench_pagination,
+    bench_repository,
+    bench_routes,
+    bench_serialization,
+)
+from src.benchmarks.runner import (
+    BASELINE_PATH,
+    DEFAULT_TOLERANCE,
+    RESULTS_PATH,
+    EnvironmentMismatch,
+    compare_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmarks")
+    parser.add_argument("--filter", default="", help="Substring of the names")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Save the results as the new baseline",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmarks(args.filter))
+    save_results(results, args.output)
+    if args.save_baseline:
+        skipped = [name for name, result in results.items() if "skipped" in result]
+        if skipped:
+            print(f"Baseline not saved, skipped: {', '.join(skipped)}")
+            return 1
+        save_results(results, args.baseline)
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}")
+        return 0
+    try:
+        regressions = compare_results(results, args.baseline, args.tolerance)
+    except EnvironmentMismatch as exc:
+        print(f"Not compared, {exc}. Save a baseline here with --save-baseline")
+        return 1
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+from src.benchmarks.data import make_student
+from src.benchmarks.runner import benchmark
+from src.schemas.students import StudentSchema
+
+
+@benchmark(number=20)
+def to_read_model_500_scores():
+    student = make_student(500)
+    return student.to_read_model
+
+
+@benchmark(number=20)
+def get_scores_500_scores():
+    student = make_student(500)
+    return student.get_scores
+
+
+@benchmark(number=20)
+def projection_validate_500_scores():
+    # The dictionary the repository builds from the joined projection.
+    student = make_student(500).to_read_model().model_dump()
+    return lambda: StudentSchema.model_validate(student)
@@ -0,0 +1,15 @@
+from src.api.pagination import (
+    PaginationParams,
+    Paginator,
+)
+from src.benchmarks.data import make_scores
+from src.benchmarks.runner import benchmark
+
+
+@benchmark(number=20)
+def get_response_10k_items():
+    items = make_scores(10_000)
+    # Constructed directly, the page size of the API is limited.
+    params = PaginationParams.model_construct(page=1, size=10_000)
+    paginator = Paginator(total=100_000, params=params)
+    return lambda: paginator.get_response(items)
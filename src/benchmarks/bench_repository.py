@@ -0,0 +1,85 @@
+from sqlalchemy import (
+    func,
+    select,
+)
+from sqlalchemy.exc import (
+    DBAPIError,
+    InterfaceError,
+)
+
+from src.benchmarks.runner import (
+    SkipBenchmark,
+    benchmark,
+)
+from src.db.db import async_engine
+from src.models.students import Students
+from src.models.utils import ClassNamesEnum
+from src.utils.transaction import TransactionManager
+
+STUDENT_DATA = {
+    "class_name": ClassNamesEnum.MATH,
+    "first_name": "Ivan",
+    "last_name": "Ivanov",
+    "age": 12,
+}
+
+
+async def first_student_id() -> int:
+    """
+    Getting the ID of a student of the configured database.
+    :return: Student ID.
+    :raises SkipBenchmark: If the database is not available or empty.
+    """
+    try:
+        async with async_engine.connect() as conn:
+            student_id = await conn.scalar(select(func.min(Students.id)))
+    except (OSError, DBAPIError, InterfaceError) as exc:
+        raise SkipBenchmark(f"database is not available: {exc}")
+    if student_id is None:
+        raise SkipBenchmark("database has no students")
+    return student_id
+
+
+def uncached(transaction: TransactionManager) -> TransactionManager:
+    """
+    Disabling the cache of the students repository of a transaction,
+    so that the database is measured.
+    :param transaction: Transaction manager.
+    :return: Transaction manager.
+    """
+    transaction.students_repo.cache = None
+    return transaction
+
+
+@benchmark(number=50)
+async def add_one():
+    await first_student_id()
+
+    async def add_student():
+        # Rolled back on exit, the database is not changed.
+        async with uncached(TransactionManager()) as transaction:
+            await transaction.students_repo.add_one(STUDENT_DATA)
+
+    return add_student
+
+
+@benchmark(number=50)
+async def find_one():
+    student_id = await first_student_id()
+
+    async def find_student():
+        async with uncached(TransactionManager()) as transaction:
+            await transaction.students_repo.find_one(id=student_id)
+
+    return find_student
+
+
+@benchmark(number=50)
+async def find_all_100():
+    await first_student_id()
+
+    async def find_students():
+        async with uncached(TransactionManager()) as transaction:
+            await transaction.students_repo.find_all(limit=100)
+
+    return find_students
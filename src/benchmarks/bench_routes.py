@@ -0,0 +1,87 @@
+from functools import cache
+
+from httpx import (
+    ASGITransport,
+    AsyncClient,
+)
+
+from src.api.dependencies import (
+    read_only_transaction_manager,
+    transaction_manager,
+)
+from src.benchmarks.runner import benchmark
+from src.config.config import settings
+from src.main import app
+from src.seed.generator import SeedOptions
+from src.seed.loader import seed_memory
+from src.utils.memory import memory_storage
+from src.utils.transaction import InMemoryManager
+
+BASE_API_URL = "/api" + settings.api.V1_PREFIX
+
+# The routes are measured with the in-memory database,
+# so only the framework, validation and serialization are timed.
+SEED_OPTIONS = SeedOptions(
+    students=1000,
+    scores_per_student=20,
+    years=1,
+    seed=0,
+    batch_size=1000,
+)
+
+
+@cache
+def memory_client() -> AsyncClient:
+    """
+    Getting a client of the application with the seeded
+    in-memory database.
+    :return: Async client calling the application in process.
+    """
+    memory_storage.clear()
+    seed_memory(memory_storage, SEED_OPTIONS)
+    app.dependency_overrides[transaction_manager] = InMemoryManager
+    app.dependency_overrides[read_only_transaction_manager] = InMemoryManager
+    return AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://benchmark",
+    )
+
+
+def get_route(url: str):
+    """
+    Getting a function requesting a route.
+    :param url: Route URL.
+    :return: Asynchronous function.
+    """
+    client = memory_client()
+
+    async def get():
+        response = await client.get(BASE_API_URL + url)
+        response.raise_for_status()
+
+    return get
+
+
+@benchmark(number=200)
+def student():
+    return get_route("/students/1")
+
+
+@benchmark(number=50)
+def students_page_100():
+    return get_route("/students/all?page=1&size=100")
+
+
+@benchmark(number=200)
+def student_summary():
+    return get_route("/students/1/summary")
+
+
+@benchmark(number=50)
+def scores_page_100():
+    return get_route("/scores/all?page=1&size=100")
+
+
+@benchmark(number=50)
+def students_by_ids_100():
+    return get_route("/students?ids=" + ",".join(map(str, range(1, 101))))
@@ -0,0 +1,68 @@
+from datetime import (
+    date,
+    timedelta,
+)
+
+from src.db import (
+    Scores,
+    Students,
+)
+from src.models.utils import ClassNamesEnum
+from src.schemas.scores import ScoreSchema
+from src.schemas.students import StudentSchema
+
+
+def make_scores(quantity: int) -> list[ScoreSchema]:
+    """
+    Building scores read models.
+    :param quantity: Quantity of scores.
+    :return: List of Pydantic models representing the scores.
+    """
+    return [
+        ScoreSchema(
+            id=score_id,
+            score=2 + score_id % 4,
+            date_of_receipt=date(2024, 1, 1) + timedelta(days=score_id % 180),
+            student_id=1 + score_id % 1000,
+        )
+        for score_id in range(1, quantity + 1)
+    ]
+
+
+def make_student(scores_quantity: int) -> Students:
+    """
+    Building a transient student entity with scores.
+    :param scores_quantity: Quantity of scores of the student.
+    :return: Student entity.
+    """
+    student = Students(
+        id=1,
+        class_name=ClassNamesEnum.MATH,
+        first_name="Ivan",
+        last_name="Ivanov",
+        age=12,
+    )
+    student.scores = [
+        Scores(
+            id=score.id,
+            score=score.score,
+            date_of_receipt=score.date_of_receipt,
+            student_id=1,
+        )
+        for score in make_scores(scores_quantity)
+    ]
+    return student
+
+
+def make_students(quantity: int, scores_quantity: int) -> list[StudentSchema]:
+    """
+    Building students read models with scores.
+    :param quantity: Quantity of students.
+    :param scores_quantity: Quantity of scores of each student.
+    :return: List of Pydantic models representing the students.
+    """
+    student = make_student(scores_quantity).to_read_model()
+    return [
+        student.model_copy(update={"id": student_id})
+        for student_id in range(1, quantity + 1)
+    ]
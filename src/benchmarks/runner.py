@@ -0,0 +1,197 @@
+import gc
+import inspect
+import json
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+)
+
+BENCHMARKS_DIR = Path(__file__).parent
+BASELINE_PATH = BENCHMARKS_DIR / "baseline.json"
+RESULTS_PATH = BENCHMARKS_DIR / "results" / "latest.json"
+
+# A benchmark fails if its best time is slower than the baseline by more.
+# The best time is compared as the least affected by the machine noise.
+DEFAULT_TOLERANCE = 0.3
+
+benchmarks: dict[str, "Benchmark"] = {}
+
+
+class SkipBenchmark(Exception):
+    """
+    Raised by a benchmark setup if its environment is not available.
+    """
+
+
+class EnvironmentMismatch(Exception):
+    """
+    Raised if the baseline was measured in another environment,
+    so that the timings are not comparable.
+    """
+
+
+class Benchmark:
+    """
+    Benchmark of a function, synchronous or asynchronous.
+    The setup returns the function to measure, so that preparing
+    the data is not measured.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[], Any],
+        number: int,
+        rounds: int,
+    ):
+        """
+        Initialization the benchmark.
+        :param name: Name.
+        :param setup: Function returning the measured function.
+        :param number: Calls per round.
+        :param rounds: Quantity of rounds.
+        """
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.rounds = rounds
+
+    async def run(self) -> dict[str, float]:
+        """
+        Running the benchmark.
+        :return: Time per call in microseconds: min, median and mean.
+        """
+        func = self.setup()
+        if inspect.isawaitable(func):
+            func = await func
+        is_async = inspect.iscoroutinefunction(func)
+        timings = []
+        # As in timeit, collections are not a part of the measurement.
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(self.rounds):
+                started_at = time.perf_counter()
+                if is_async:
+                    for _ in range(self.number):
+                        await func()
+                else:
+                    for _ in range(self.number):
+                        func()
+                timings.append(
+                    (time.perf_counter() - started_at) / self.number * 1e6,
+                )
+        finally:
+            gc.enable()
+        return {
+            "min_us": min(timings),
+            "median_us": statistics.median(timings),
+            "mean_us": statistics.fmean(timings),
+        }
+
+
+def benchmark(
+    number: int = 100,
+    rounds: int = 7,
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator registering a benchmark setup under its module and name.
+    :param number: Calls per round.
+    :param rounds: Quantity of rounds.
+    :return: Decorator.
+    """
+
+    def decorator(setup: Callable) -> Callable:
+        module = setup.__module__.rsplit(".", 1)[-1].removeprefix("bench_")
+        name = f"{module}.{setup.__name__}"
+        benchmarks[name] = Benchmark(name, setup, number, rounds)
+        return setup
+
+    return decorator
+
+
+async def run_benchmarks(pattern: str = "") -> dict[str, Any]:
+    """
+    Running the registered benchmarks.
+    :param pattern: Substring of the names of the benchmarks to run.
+    :return: Results by benchmark name, skipped ones with the reason.
+    """
+    results = {}
+    for name, bench in benchmarks.items():
+        if pattern not in name:
+            continue
+        try:
+            results[name] = await bench.run()
+        except SkipBenchmark as exc:
+            results[name] = {"skipped": str(exc)}
+        print(f"{name}: {results[name]}")
+    return results
+
+
+def environment() -> dict[str, str]:
+    """
+    Getting the environment the timings depend on.
+    :return: Python version and machine type.
+    """
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+
+
+def save_results(results: dict[str, Any], path: Path) -> None:
+    """
+    Saving results as JSON with the environment they were measured in.
+    :param results: Results by benchmark name.
+    :param path: File path.
+    :return: None.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        **environment(),
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def compare_results(
+    results: dict[str, Any],
+    baseline_path: Path,
+    tolerance: float,
+) -> list[str]:
+    """
+    Comparing the best times with the baseline.
+    Benchmarks skipped or absent from the baseline are not compared.
+    :param results: Results by benchmark name.
+    :param baseline_path: Baseline file path.
+    :param tolerance: Allowed relative slowdown.
+    :return: Descriptions of the regressions.
+    :raises EnvironmentMismatch: If the baseline was measured
+    with another Python or on another machine type.
+    """
+    document = json.loads(baseline_path.read_text())
+    current = environment()
+    recorded = {key: document.get(key) for key in current}
+    if recorded != current:
+        raise EnvironmentMismatch(
+            f"baseline measured with Python {recorded['python']} "
+            f"on {recorded['machine']}, running Python {current['python']} "
+            f"on {current['machine']}"
+        )
+    baseline = document["results"]
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name, {}).get("min_us")
+        actual = result.get("min_us")
+        if expected is None or actual is None:
+            continue
+        if actual > expected * (1 + tolerance):
+            regressions.append(
+                f"{name}: {actual:.1f} us, baseline {expected:.1f} us "
+                f"(+{(actual / expected - 1) * 100:.0f}%)"
+            )
+    return regressions
@@ -3,6 +3,7 @@ from typing import Literal
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     PostgresDsn,
 )
 from pydantic_settings import BaseSettings
@@ -10,9 +11,13 @@ from pydantic_settings import BaseSettings
 
 class APISettings(BaseModel):
     V1_PREFIX: str = "/v1"
+    BULK_MAX_SIZE: int = 50_000
+    BATCH_MAX_SIZE: int = 500
 
 
 class DatabaseSettings(BaseModel):
+    model_config = ConfigDict(validate_default=True)
+
     NAME: str = os.getenv(
         "POSTGRES_DB",
         "example_db",
@@ -35,14 +40,74 @@ class DatabaseSettings(BaseModel):
     )
     URL: PostgresDsn = f"postgresql+asyncpg://{USER}:{PASS}@{HOST}:{PORT}/{NAME}"
 
+    # Comma separated DSNs of the read replicas, reads go to the primary
+    # if there are none.
+    REPLICA_URLS: list[PostgresDsn] = [
+        url for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url
+    ]
+    # Upper bound of the replication lag in seconds. Clients stay
+    # on the primary for this time after a write.
+    REPLICA_MAX_LAG: float = os.getenv(
+        "DB_REPLICA_MAX_LAG",
+        5,
+    )
+
+    # "memory" keeps the data in the process instead of PostgreSQL,
+    # to measure the application overhead without the database.
+    BACKEND: Literal["postgres", "memory"] = os.getenv(
+        "DB_BACKEND",
+        "postgres",
+    )
+    # Quantity of generated students the in-memory database starts with.
+    MEMORY_SEED_STUDENTS: int = os.getenv(
+        "DB_MEMORY_SEED_STUDENTS",
+        0,
+    )
+
     ECHO: bool = False
     POOL_SIZE: int = 50
     MAX_OVERFLOW: int = 10
 
 
+class CacheSettings(BaseModel):
+    # Values of the environment are strings, parsed like the defaults.
+    model_config = ConfigDict(validate_default=True)
+
+    # Per process, the other workers see a write only after the TTL.
+    ENABLED: bool = os.getenv(
+        "CACHE_ENABLED",
+        False,
+    )
+    MAX_SIZE: int = os.getenv(
+        "CACHE_MAX_SIZE",
+        10_000,
+    )
+    TTL: float = os.getenv(
+        "CACHE_TTL",
+        30,
+    )
+
+
+class InstrumentationSettings(BaseModel):
+    model_config = ConfigDict(validate_default=True)
+
+    # Server-Timing header and warnings about the requests
+    # with too many queries, off in production by default.
+    ENABLED: bool = os.getenv(
+        "SQL_INSTRUMENTATION",
+        os.getenv("MODE") != "PROD",
+    )
+    MAX_QUERIES: int = os.getenv(
+        "SQL_MAX_QUERIES",
+        10,
+    )
+
+
 class Settings(BaseSettings):
     api: APISettings = APISettings()
     db: DatabaseSettings = DatabaseSettings()
+    cache: CacheSettings = CacheSettings()
+    instrumentation: InstrumentationSettings = InstrumentationSettings()
 
     MODE: Literal["DEV", "TEST", "PROD"] = os.getenv("MODE", "TEST")
 
@@ -10,12 +10,15 @@ from sqlalchemy.orm import (
 )
 
 from src.config.config import settings
+from src.db.pool import MeasuredQueuePool
 
 async_engine = create_async_engine(
-    url=settings.db.URL,
+    url=str(settings.db.URL),
     echo=settings.db.ECHO,
     pool_size=settings.db.POOL_SIZE,
     max_overflow=settings.db.MAX_OVERFLOW,
+    poolclass=MeasuredQueuePool,
+    pool_logging_name="primary",
 )
 
 async_session = async_sessionmaker(
@@ -23,6 +26,17 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Shares the pool of the main engine. In autocommit mode the driver
+# sends no BEGIN and ROLLBACK, so a read costs one round trip per query.
+read_only_engine = async_engine.execution_options(
+    isolation_level="AUTOCOMMIT",
+)
+
+read_only_session = async_sessionmaker(
+    read_only_engine,
+    expire_on_commit=False,
+)
+
 
 class Base(DeclarativeBase):
     @declared_attr.directive
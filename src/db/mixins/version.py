@@ -0,0 +1,12 @@
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+
+class VersionMixin:
+    """
+    Mixin is a row version incremented on every change.
+    """
+
+    version: Mapped[int] = mapped_column(server_default="1")
@@ -0,0 +1,59 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.utils.instrumentation import request_stats
+from src.utils.metrics import (
+    POOL_CHECKED_OUT,
+    POOL_CHECKOUTS,
+    POOL_OVERFLOW,
+    POOL_WAIT,
+)
+
+# Connection record info key of the time spent opening the connection.
+SETUP_TIME = "pool_setup_time"
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Connection pool reporting checkouts, overflow and wait time.
+    The wait is the time in the queue for a free connection,
+    opening a new connection as the pool grows is not counted.
+    The pool is labeled with the pool_logging_name of the engine.
+    """
+
+    @property
+    def label(self) -> str:
+        return self.logging_name or "default"
+
+    def connect(self):
+        connection = super().connect()
+        POOL_CHECKOUTS.labels(self.label).inc()
+        self._set_gauges()
+        return connection
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        record = super()._do_get()
+        wait_time = time.perf_counter() - started_at
+        wait_time -= record.info.pop(SETUP_TIME, 0.0)
+        POOL_WAIT.labels(self.label).observe(wait_time)
+        stats = request_stats.get()
+        if stats is not None:
+            stats.pool_wait_time += wait_time
+        return record
+
+    def _create_connection(self):
+        started_at = time.perf_counter()
+        record = super()._create_connection()
+        # Kept on the record, not the pool, connections are opened concurrently.
+        record.info[SETUP_TIME] = time.perf_counter() - started_at
+        return record
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._set_gauges()
+
+    def _set_gauges(self) -> None:
+        POOL_CHECKED_OUT.labels(self.label).set(self.checkedout())
+        POOL_OVERFLOW.labels(self.label).set(max(self.overflow(), 0))
@@ -0,0 +1,75 @@
+import itertools
+from contextvars import ContextVar
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.config.config import settings
+from src.db.pool import MeasuredQueuePool
+
+REPLICA = "replica"
+
+# Set for the requests of the clients that wrote recently,
+# so that they read their own writes.
+primary_pinned: ContextVar[bool] = ContextVar(
+    "primary_pinned",
+    default=False,
+)
+
+
+class ReplicaRouter:
+    """
+    Choice of a read replica for the read-only sessions.
+    The least busy replica is chosen, ties are broken round-robin.
+    """
+
+    def __init__(self, urls: list[str]):
+        """
+        Initialization the router.
+        :param urls: DSNs of the replicas.
+        """
+        self.engines: list[AsyncEngine] = [
+            create_async_engine(
+                url=str(url),
+                echo=settings.db.ECHO,
+                pool_size=settings.db.POOL_SIZE,
+                max_overflow=settings.db.MAX_OVERFLOW,
+                poolclass=MeasuredQueuePool,
+                pool_logging_name=f"replica_{index}",
+            ).execution_options(
+                isolation_level="AUTOCOMMIT",
+            )
+            for index, url in enumerate(urls)
+        ]
+        self.session_factories = [
+            async_sessionmaker(
+                engine,
+                expire_on_commit=False,
+                info={REPLICA: True},
+            )
+            for engine in self.engines
+        ]
+        self._counter = itertools.count()
+
+    def choose(self) -> async_sessionmaker | None:
+        """
+        Choosing a session factory of a replica.
+        :return: Session factory or None if the primary must be used.
+        """
+        if not self.engines or primary_pinned.get():
+            return None
+        start = next(self._counter) % len(self.engines)
+        order = [
+            (start + shift) % len(self.engines) for shift in range(len(self.engines))
+        ]
+        index = min(
+            order,
+            key=lambda i: self.engines[i].pool.checkedout(),
+        )
+        return self.session_factories[index]
+
+
+replica_router = ReplicaRouter(settings.db.REPLICA_URLS)
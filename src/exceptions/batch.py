@@ -0,0 +1,8 @@
+from fastapi import status
+
+from src.exceptions.base import EJournalException
+
+
+class TooManyIdsException(EJournalException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    detail = "Too many IDs"
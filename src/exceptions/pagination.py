@@ -6,3 +6,8 @@ from src.exceptions.base import EJournalException
 class PageNotFoundException(EJournalException):
     status_code = status.HTTP_404_NOT_FOUND
     detail = "Page not found"
+
+
+class InvalidCursorException(EJournalException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Invalid cursor"
@@ -13,6 +13,16 @@ class IncorrectStudentException(EJournalException):
     detail = "Wrong student ID"
 
 
+class ScoresConflictException(EJournalException):
+    status_code = status.HTTP_409_CONFLICT
+    detail = "The scores conflict with the stored data"
+
+
 class IncorrectDateOfReceiptException(EJournalException):
     status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
     detail = "The date of receipt of the score cannot be longer than the current date"
+
+
+class TimeseriesTargetException(EJournalException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    detail = "Exactly one of student_id and class_name is required"
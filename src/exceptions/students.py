@@ -6,3 +6,8 @@ from src.exceptions.base import EJournalException
 class StudentNotFoundException(EJournalException):
     status_code = status.HTTP_404_NOT_FOUND
     detail = "Student not found"
+
+
+class DuplicateImportKeyException(EJournalException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    detail = "Import keys must be unique"
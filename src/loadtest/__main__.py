@@ -0,0 +1,119 @@
+"""
+Running the load test scenarios of scenarios.toml:
+
+    python -m src.loadtest [SCENARIO ...] [--base-url URL]
+
+Without --base-url the application src.main:app is driven in process,
+with the database of the settings. The report is printed and saved
+as JSON, the exit code is 1 if a threshold of the config is not met.
+The pool wait is taken from the Server-Timing header, which the server
+sends only with SQL_INSTRUMENTATION on (off with MODE=PROD by default).
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+
+from src.loadtest.runner import (
+    SCENARIOS_PATH,
+    check_thresholds,
+    load_scenarios,
+    run_scenario,
+)
+
+REPORT_PATH = Path(__file__).parent / "results" / "latest.json"
+
+COLUMNS = (
+    "requests",
+    "rps",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "error_rate",
+    "pool_wait_ms",
+)
+
+
+def format_row(name: str, result: dict) -> str:
+    cells = [f"{name:<20}"]
+    for column in COLUMNS:
+        value = result.get(column)
+        cells.append(f"{'-' if value is None else round(value, 3):>12}")
+    return "".join(cells)
+
+
+def print_report(name: str, report: dict) -> None:
+    print(f"\n{name}: {report['duration']:.1f} s, {report['concurrency']} workers")
+    print(f"{'':<20}" + "".join(f"{column:>12}" for column in COLUMNS))
+    for request_name, result in report["requests"].items():
+        print(format_row(request_name, result))
+    print(format_row("total", report["total"]))
+
+
+async def run(args: argparse.Namespace) -> int:
+    scenarios = load_scenarios(args.config)
+    names = args.scenarios or list(scenarios)
+    if args.base_url is None:
+        from src.main import app
+
+        transport = httpx.ASGITransport(
+            app=app,
+            raise_app_exceptions=False,
+        )
+        base_url = "http://loadtest"
+    else:
+        transport = None
+        base_url = args.base_url
+
+    reports = {}
+    failed = False
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url=base_url,
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=None),
+    ) as client:
+        for name in names:
+            report = await run_scenario(
+                client,
+                scenarios[name],
+                duration=args.duration,
+                concurrency=args.concurrency,
+                seed=args.seed,
+            )
+            report["failures"] = check_thresholds(scenarios[name], report)
+            reports[name] = report
+            print_report(name, report)
+            if report["total"]["requests"] and report["total"]["pool_wait_ms"] is None:
+                print(
+                    "WARNING no pool wait in the responses, "
+                    "enable SQL_INSTRUMENTATION on the server"
+                )
+            for failure in report["failures"]:
+                failed = True
+                print(f"FAILED {failure}")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(reports, indent=2) + "\n")
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.loadtest")
+    parser.add_argument("scenarios", nargs="*", help="Scenarios, all by default")
+    parser.add_argument("--config", type=Path, default=SCENARIOS_PATH)
+    parser.add_argument("--base-url", help="URL of a running server")
+    parser.add_argument("--duration", type=float, help="Seconds per scenario")
+    parser.add_argument("--concurrency", type=int, help="Concurrent workers")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--output", type=Path, default=REPORT_PATH)
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+import asyncio
+import random
+import re
+import statistics
+import time
+import tomllib
+from datetime import (
+    date,
+    timedelta,
+)
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from src.models.utils import ClassNamesEnum
+
+SCENARIOS_PATH = Path(__file__).parent / "scenarios.toml"
+
+PLACEHOLDER = re.compile(r"^\{(\w+)\}$")
+POOL_TIMING = re.compile(r"(?:^|,)\s*pool;dur=([\d.]+)")
+
+
+def load_scenarios(path: Path = SCENARIOS_PATH) -> dict[str, dict]:
+    """
+    Loading the scenarios config.
+    :param path: Config file path.
+    :return: Scenarios by name.
+    """
+    with path.open("rb") as file:
+        return tomllib.load(file)["scenarios"]
+
+
+class RequestTemplate:
+    """
+    Request of a scenario with random values in place of placeholders.
+    """
+
+    def __init__(self, config: dict, id_range: list[int]):
+        """
+        Initialization the template.
+        :param config: Request config.
+        :param id_range: Range of the random IDs.
+        """
+        self.name = config["name"]
+        self.method = config["method"]
+        self.path = config["path"]
+        self.weight = config.get("weight", 1)
+        self.json = config.get("json")
+        self.repeat = config.get("repeat")
+        self.max_p99_ms = config.get("max_p99_ms")
+        self.max_error_rate = config.get("max_error_rate")
+        self.id_range = id_range
+
+    def build(self, rng: random.Random) -> dict[str, Any]:
+        """
+        Building the arguments of a request.
+        :param rng: Random generator.
+        :return: Arguments of httpx.AsyncClient.request.
+        """
+        values = {
+            "student_id": rng.randint(*self.id_range),
+            "score_id": rng.randint(*self.id_range),
+            "score": rng.randint(2, 5),
+            "date": (date.today() - timedelta(days=rng.randrange(180))).isoformat(),
+            "class_name": rng.choice(list(ClassNamesEnum)).value,
+        }
+        request = {
+            "method": self.method,
+            "url": self.path.format(**values),
+        }
+        if self.json is not None:
+            if self.repeat is None:
+                request["json"] = self._render(self.json, values)
+            else:
+                request["json"] = [
+                    self._render(
+                        self.json,
+                        values
+                        | {
+                            "student_id": rng.randint(*self.id_range),
+                            "score": rng.randint(2, 5),
+                        },
+                    )
+                    for _ in range(self.repeat)
+                ]
+        return request
+
+    def _render(self, value: Any, values: dict[str, Any]) -> Any:
+        """
+        Filling the placeholders of a body value.
+        :param value: Body value.
+        :param values: Values of the placeholders.
+        :return: Filled value.
+        """
+        if isinstance(value, dict):
+            return {key: self._render(item, values) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._render(item, values) for item in value]
+        if isinstance(value, str):
+            match = PLACEHOLDER.match(value)
+            if match is not None:
+                return values[match.group(1)]
+            return value.format(**values)
+        return value
+
+
+class RequestStats:
+    """
+    Outcomes of the requests of one template.
+    """
+
+    def __init__(self):
+        """
+        Initialization the stats.
+        """
+        self.latencies: list[float] = []
+        self.pool_waits: list[float] = []
+        self.errors = 0
+
+    def add(
+        self,
+        latency: float,
+        error: bool,
+        pool_wait: float | None,
+    ) -> None:
+        """
+        Adding the outcome of a request.
+        :param latency: Latency in seconds.
+        :param error: Whether the request failed.
+        :param pool_wait: Pool wait in milliseconds from Server-Timing.
+        :return: None.
+        """
+        self.latencies.append(latency)
+        self.errors += error
+        if pool_wait is not None:
+            self.pool_waits.append(pool_wait)
+
+    def report(self, duration: float) -> dict[str, Any]:
+        """
+        Summarizing the outcomes.
+        :param duration: Duration of the scenario in seconds.
+        :return: Throughput, latency percentiles, error rate and pool wait.
+        """
+        count = len(self.latencies)
+        if count == 0:
+            return {"requests": 0}
+        latencies = sorted(self.latencies)
+        return {
+            "requests": count,
+            "rps": count / duration,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "error_rate": self.errors / count,
+            "pool_wait_ms": (
+                statistics.fmean(self.pool_waits) if self.pool_waits else None
+            ),
+        }
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """
+    Getting a percentile of sorted values by the nearest rank.
+    :param values: Sorted values.
+    :param rank: Percentile rank from 0 to 100.
+    :return: Percentile.
+    """
+    index = max(0, round(rank / 100 * len(values) + 0.5) - 1)
+    return values[min(index, len(values) - 1)]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    config: dict,
+    duration: float | None = None,
+    concurrency: int | None = None,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Running a scenario.
+    :param client: Client of the application.
+    :param config: Scenario config.
+    :param duration: Duration in seconds instead of the configured one.
+    :param concurrency: Concurrent workers instead of the configured ones.
+    :param seed: Seed of the random requests.
+    :return: Report of the scenario by request name and in total.
+    """
+    id_range = config.get("id_range", [1, 1000])
+    templates = [RequestTemplate(request, id_range) for request in config["requests"]]
+    weights = [template.weight for template in templates]
+    stats = {template.name: RequestStats() for template in templates}
+    duration = duration or config["duration"]
+    concurrency = concurrency or config["concurrency"]
+    deadline = time.perf_counter() + duration
+
+    async def worker(worker_id: int) -> None:
+        rng = random.Random(seed * 1_000_003 + worker_id)
+        while time.perf_counter() < deadline:
+            template = rng.choices(templates, weights)[0]
+            request = template.build(rng)
+            started_at = time.perf_counter()
+            try:
+                response = await client.request(**request)
+                error = response.status_code >= 400
+                pool_wait = POOL_TIMING.search(
+                    response.headers.get("server-timing", ""),
+                )
+                pool_wait = float(pool_wait.group(1)) if pool_wait else None
+            except httpx.HTTPError:
+                error = True
+                pool_wait = None
+            stats[template.name].add(
+                time.perf_counter() - started_at,
+                error,
+                pool_wait,
+            )
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(worker_id) for worker_id in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    total = RequestStats()
+    for request_stats in stats.values():
+        total.latencies.extend(request_stats.latencies)
+        total.pool_waits.extend(request_stats.pool_waits)
+        total.errors += request_stats.errors
+    return {
+        "duration": elapsed,
+        "concurrency": concurrency,
+        "requests": {
+            name: request_stats.report(elapsed) for name, request_stats in stats.items()
+        },
+        "total": total.report(elapsed),
+    }
+
+
+def check_thresholds(config: dict, report: dict[str, Any]) -> list[str]:
+    """
+    Checking a scenario report against the thresholds of the config.
+    :param config: Scenario config.
+    :param report: Scenario report.
+    :return: Descriptions of the thresholds not met.
+    """
+    failures = []
+    min_rps = config.get("min_rps")
+    total_rps = report["total"].get("rps", 0)
+    if min_rps is not None and total_rps < min_rps:
+        failures.append(f"throughput {total_rps:.1f} rps < {min_rps} rps")
+    for request in config["requests"]:
+        result = report["requests"][request["name"]]
+        if not result["requests"]:
+            continue
+        max_p99_ms = request.get("max_p99_ms")
+        if max_p99_ms is not None and result["p99_ms"] > max_p99_ms:
+            failures.append(
+                f"{request['name']}: p99 {result['p99_ms']:.1f} ms "
+                f"> {max_p99_ms} ms"
+            )
+        max_error_rate = request.get("max_error_rate")
+        if max_error_rate is not None and result["error_rate"] > max_error_rate:
+            failures.append(
+                f"{request['name']}: error rate {result['error_rate']:.3f} "
+                f"> {max_error_rate}"
+            )
+    return failures
@@ -1,6 +1,17 @@
 from fastapi import FastAPI
 
 from src.api import main_router
+from src.api.metrics import router as metrics_router
+from src.api.middlewares import (
+    MetricsMiddleware,
+    PrimaryPinningMiddleware,
+    ServerTimingMiddleware,
+)
+from src.config.config import settings
+from src.seed.generator import SeedOptions
+from src.seed.loader import seed_memory
+from src.utils.instrumentation import instrument_queries
+from src.utils.memory import memory_storage
 
 app = FastAPI(
     title="E-Journal API",
@@ -9,3 +20,25 @@ app = FastAPI(
 )
 
 app.include_router(main_router)
+app.include_router(metrics_router)
+
+app.add_middleware(MetricsMiddleware)
+
+if settings.db.BACKEND == "memory" and settings.db.MEMORY_SEED_STUDENTS:
+    seed_memory(
+        memory_storage,
+        SeedOptions(
+            students=settings.db.MEMORY_SEED_STUDENTS,
+            scores_per_student=20,
+            years=4,
+            seed=0,
+            batch_size=10_000,
+        ),
+    )
+
+# Needed without replicas too: coalesced reads skip the recent writers.
+app.add_middleware(PrimaryPinningMiddleware)
+
+if settings.instrumentation.ENABLED:
+    instrument_queries()
+    app.add_middleware(ServerTimingMiddleware)
@@ -9,12 +9,13 @@ from alembic import context
 
 from src.db.db import Base
 from src.config.config import settings
+from src.models.students import PG_TRGM_EXTENSION
 
 
 config = context.config
 config.set_main_option(
     "sqlalchemy.url",
-    settings.db.URL,
+    str(settings.db.URL),
 )
 
 
@@ -53,6 +54,8 @@ def do_run_migrations(connection: Connection) -> None:
     context.configure(connection=connection, target_metadata=target_metadata)
 
     with context.begin_transaction():
+        # Autogenerated revisions do not create extensions.
+        connection.execute(PG_TRGM_EXTENSION)
         context.run_migrations()
 
 
@@ -3,6 +3,7 @@ from datetime import date
 from sqlalchemy import (
     CheckConstraint,
     ForeignKey,
+    Index,
     SmallInteger,
 )
 from sqlalchemy.orm import (
@@ -13,10 +14,11 @@ from sqlalchemy.orm import (
 
 from src.db.db import Base
 from src.db.mixins.pk import IntIdPkMixin
+from src.db.mixins.version import VersionMixin
 from src.schemas.scores import ScoreSchema
 
 
-class Scores(Base, IntIdPkMixin):
+class Scores(Base, IntIdPkMixin, VersionMixin):
     """
     Student scores model.
     """
@@ -30,6 +32,13 @@ class Scores(Base, IntIdPkMixin):
             "date_of_receipt <= CURRENT_DATE",
             name="check_date",
         ),
+        # Serves the scores of a student, also by date of receipt,
+        # and the foreign key lookups.
+        Index(
+            "ix_scores_student_id_date_of_receipt",
+            "student_id",
+            "date_of_receipt",
+        ),
     )
 
     score: Mapped[int] = mapped_column(SmallInteger)
@@ -52,4 +61,5 @@ class Scores(Base, IntIdPkMixin):
             score=self.score,
             date_of_receipt=self.date_of_receipt,
             student_id=self.student_id,
+            version=self.version,
         )
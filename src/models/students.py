@@ -1,6 +1,11 @@
+from datetime import date
+
 from sqlalchemy import (
+    DDL,
     CheckConstraint,
     Enum as SQLAEnum,
+    Index,
+    event,
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -10,6 +15,7 @@ from sqlalchemy.orm import (
 
 from src.db.db import Base
 from src.db.mixins.pk import IntIdPkMixin
+from src.db.mixins.version import VersionMixin
 from src.models.utils import ClassNamesEnum
 from src.schemas.scores import (
     ScoreSchema,
@@ -18,7 +24,7 @@ from src.schemas.scores import (
 from src.schemas.students import StudentSchema
 
 
-class Students(Base, IntIdPkMixin):
+class Students(Base, IntIdPkMixin, VersionMixin):
     """
     Student model.
     """
@@ -36,6 +42,19 @@ class Students(Base, IntIdPkMixin):
             "length(last_name) <= 50",
             name="last_name_len",
         ),
+        # Trigram indexes of the name search.
+        Index(
+            "ix_students_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_students_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
     )
 
     class_name: Mapped[ClassNamesEnum] = mapped_column(
@@ -45,6 +64,11 @@ class Students(Base, IntIdPkMixin):
     last_name: Mapped[str]
     age: Mapped[int]
 
+    # Scores summary, kept in sync by the scores repository.
+    score_count: Mapped[int] = mapped_column(server_default="0")
+    score_sum: Mapped[int] = mapped_column(server_default="0")
+    last_score_at: Mapped[date | None]
+
     scores: Mapped[list["Scores"]] = relationship(
         "Scores",
         back_populates="student",
@@ -58,6 +82,7 @@ class Students(Base, IntIdPkMixin):
             last_name=self.last_name,
             age=self.age,
             scores=self.get_scores(),
+            version=self.version,
         )
 
     def get_scores(self) -> list[ScoresForStudentSchema]:
@@ -69,3 +94,9 @@ class Students(Base, IntIdPkMixin):
             )
             scores.append(score_info)
         return scores
+
+
+# Operator classes of the trigram indexes.
+PG_TRGM_EXTENSION = DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+event.listen(Students.__table__, "before_create", PG_TRGM_EXTENSION)
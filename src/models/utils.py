@@ -5,3 +5,7 @@ class ClassNamesEnum(Enum):
     MATH: str = "Math"
     SCIENCE: str = "Science"
     ART: str = "Art"
+
+
+# Allowed scores, see the "check_score" constraint.
+GRADES = range(2, 6)
@@ -0,0 +1,441 @@
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from collections import (
+    Counter,
+    defaultdict,
+)
+from datetime import (
+    date,
+    timedelta,
+)
+
+from src.models.utils import (
+    ClassNamesEnum,
+    GRADES,
+)
+from src.schemas.scores import (
+    ScoreSchema,
+    ScoresFilterParams,
+    ScoresTimeseriesParams,
+    ScoresTimeseriesSchema,
+    TimeBucketEnum,
+)
+from src.schemas.students import (
+    FoundStudentSchema,
+    LeaderboardEntrySchema,
+    StudentRankSchema,
+    StudentSchema,
+    StudentStatsSchema,
+    StudentSummarySchema,
+)
+from src.utils.memory import (
+    InMemoryRepository,
+    Row,
+)
+
+# Default of pg_trgm.word_similarity_threshold, see the "<%" operator.
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+
+class InMemoryScoresRepository(InMemoryRepository):
+    table_name = "scores"
+    schema = ScoreSchema
+
+    async def add_one(self, data: dict) -> int:
+        """
+        Adding a score and updating the student's scores summary.
+        :param data: Score data.
+        :return: ID of the created score.
+        """
+        self.session.check_exists("students", data["student_id"])
+        score_id = await super().add_one(data)
+        student = self.session.table("students").rows[data["student_id"]]
+        last_score_at = student["last_score_at"]
+        self.session.update(
+            "students",
+            data["student_id"],
+            {
+                "score_count": student["score_count"] + 1,
+                "score_sum": student["score_sum"] + data["score"],
+                "last_score_at": (
+                    data["date_of_receipt"]
+                    if last_score_at is None
+                    else max(last_score_at, data["date_of_receipt"])
+                ),
+            },
+        )
+        return score_id
+
+    async def edit_one(self, obj_id: int, data: dict) -> int:
+        """
+        Updating a score and updating the student's scores summary.
+        :param obj_id: Score ID.
+        :param data: Score data.
+        :return: ID of the updated score.
+        """
+        old_score = dict(self.table.rows.get(obj_id) or {})
+        await super().edit_one(obj_id, data)
+        score = self.table.rows[obj_id]
+        student = self.session.table("students").rows[score["student_id"]]
+        values = {
+            "score_sum": (student["score_sum"] + score["score"] - old_score["score"]),
+        }
+        if "date_of_receipt" in data:
+            values["last_score_at"] = self._last_score_at(score["student_id"])
+        self.session.update("students", score["student_id"], values)
+        return obj_id
+
+    async def delete_one(self, obj_id: int) -> None:
+        """
+        Deleting a score by ID and updating the student's scores summary.
+        :param obj_id: Score ID.
+        :return: None.
+        """
+        score = self.session.delete(self.table_name, obj_id)
+        if score is None:
+            return
+        student = self.session.table("students").rows[score["student_id"]]
+        self.session.update(
+            "students",
+            score["student_id"],
+            {
+                "score_count": student["score_count"] - 1,
+                "score_sum": student["score_sum"] - score["score"],
+                "last_score_at": self._last_score_at(score["student_id"]),
+            },
+        )
+
+    async def find_timeseries(
+        self,
+        params: ScoresTimeseriesParams,
+    ) -> ScoresTimeseriesSchema:
+        """
+        Aggregating the average score by weeks or months
+        of the scores of a student or a class.
+        :param params: Timeseries params.
+        :return: Pydantic model representing the buckets ordered by date.
+        """
+        if params.student_id is not None:
+            students_ids = [params.student_id]
+        else:
+            students_ids = [
+                student["id"]
+                for student in self.session.table("students").rows.values()
+                if student["class_name"] == params.class_name
+            ]
+        filters = ScoresFilterParams(
+            date_from=params.date_from,
+            date_to=params.date_to,
+        )
+        buckets = defaultdict(list)
+        for student_id in students_ids:
+            for row in self._rows(
+                filters.model_copy(
+                    update={"student_id": student_id},
+                )
+            ):
+                day = row["date_of_receipt"]
+                if params.bucket == TimeBucketEnum.WEEK:
+                    start = day - timedelta(days=day.weekday())
+                else:
+                    start = day.replace(day=1)
+                buckets[start].append(row["score"])
+        return ScoresTimeseriesSchema(
+            bucket=params.bucket,
+            buckets=[
+                (start, sum(scores) / len(scores), len(scores))
+                for start, scores in sorted(buckets.items())
+            ],
+        )
+
+    def _rows(self, filters: ScoresFilterParams | None):
+        """
+        Scores matching the filter params.
+        :param filters: Filter params.
+        :return: Scores ordered by ID.
+        """
+        if filters is None or not filters.model_dump(exclude_none=True):
+            return self.table.rows.values()
+        if filters.student_id is not None:
+            rows = self.table.lookup("student_id", filters.student_id)
+        else:
+            rows = self.table.rows.values()
+        return (
+            row
+            for row in rows
+            if (
+                filters.date_from is None or row["date_of_receipt"] >= filters.date_from
+            )
+            and (filters.date_to is None or row["date_of_receipt"] <= filters.date_to)
+            and (filters.score is None or row["score"] == filters.score)
+        )
+
+    def _last_score_at(self, student_id: int) -> date | None:
+        """
+        Getting the date of the student's latest score.
+        :param student_id: Student ID.
+        :return: Date or None if the student has no scores.
+        """
+        return max(
+            (
+                row["date_of_receipt"]
+                for row in self.table.lookup("student_id", student_id)
+            ),
+            default=None,
+        )
+
+
+class InMemoryStudentsRepository(InMemoryRepository):
+    table_name = "students"
+    schema = StudentSchema
+
+    async def add_one(self, data: dict) -> int:
+        """
+        Adding a student with an empty scores summary.
+        :param data: Student data.
+        :return: ID of the created student.
+        """
+        return await super().add_one(
+            {
+                "score_count": 0,
+                "score_sum": 0,
+                "last_score_at": None,
+                **data,
+            }
+        )
+
+    async def delete_one(self, obj_id: int) -> None:
+        """
+        Deleting a student by ID with the scores.
+        :param obj_id: Student ID.
+        :return: None.
+        """
+        scores = self.session.table("scores").lookup("student_id", obj_id)
+        for score in scores:
+            self.session.delete("scores", score["id"])
+        await super().delete_one(obj_id)
+
+    async def find_stats(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        **filter_by,
+    ) -> list[StudentStatsSchema]:
+        """
+        Aggregating scores of students.
+        :param offset: Quantity of students to skip.
+        :param limit: Maximum quantity of students.
+        :param filter_by: Students filters.
+        :return: List of Pydantic models representing the students stats.
+        """
+        stats = []
+        for student in self._find_rows(offset, limit, filter_by):
+            scores = self._scores(student["id"])
+            grades = [score["score"] for score in scores]
+            distribution = Counter(grades)
+            stats.append(
+                StudentStatsSchema(
+                    student_id=student["id"],
+                    count=len(grades),
+                    average=sum(grades) / len(grades) if grades else None,
+                    min=min(grades, default=None),
+                    max=max(grades, default=None),
+                    distribution={grade: distribution[grade] for grade in GRADES},
+                    last_date_of_receipt=max(
+                        (score["date_of_receipt"] for score in scores),
+                        default=None,
+                    ),
+                )
+            )
+        return stats
+
+    async def find_summary(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        **filter_by,
+    ) -> list[StudentSummarySchema]:
+        """
+        Getting the maintained scores summary of students.
+        :param offset: Quantity of students to skip.
+        :param limit: Maximum quantity of students.
+        :param filter_by: Students filters.
+        :return: List of Pydantic models representing the summary.
+        """
+        return [
+            StudentSummarySchema(
+                student_id=student["id"],
+                score_count=student["score_count"],
+                average_score=self._average_score(student),
+                last_score_at=student["last_score_at"],
+            )
+            for student in self._find_rows(offset, limit, filter_by)
+        ]
+
+    async def find_leaderboard(
+        self,
+        class_name: ClassNamesEnum,
+        limit: int,
+    ) -> list[LeaderboardEntrySchema]:
+        """
+        Getting the best students of a class by the average score.
+        :param class_name: Class name.
+        :param limit: Maximum quantity of students.
+        :return: List of Pydantic models representing the leaderboard.
+        """
+        ranking = sorted(
+            self._ranking(class_name).items(),
+            key=lambda item: (item[1].rank, item[0]),
+        )
+        students = self.table.rows
+        return [
+            LeaderboardEntrySchema(
+                student_id=student_id,
+                class_name=students[student_id]["class_name"],
+                first_name=students[student_id]["first_name"],
+                last_name=students[student_id]["last_name"],
+                average_score=self._average_score(students[student_id]),
+                rank=rank.rank,
+                percentile=rank.percentile,
+            )
+            for student_id, rank in ranking[:limit]
+        ]
+
+    async def search(self, query: str, limit: int) -> list[FoundStudentSchema]:
+        """
+        Search for students by a part of the first or the last name,
+        the most similar first.
+        :param query: Part of the name.
+        :param limit: Maximum quantity of students.
+        :return: List of Pydantic models representing the found students.
+        """
+        found = []
+        for student in self.table.rows.values():
+            similarity = max(
+                word_similarity(query, student["first_name"]),
+                word_similarity(query, student["last_name"]),
+            )
+            if similarity >= WORD_SIMILARITY_THRESHOLD:
+                found.append((similarity, student))
+        found.sort(key=lambda item: (-item[0], item[1]["id"]))
+        return [
+            FoundStudentSchema(
+                student_id=student["id"],
+                class_name=student["class_name"],
+                first_name=student["first_name"],
+                last_name=student["last_name"],
+                similarity=similarity,
+            )
+            for similarity, student in found[:limit]
+        ]
+
+    async def find_rank(self, student_id: int) -> StudentRankSchema:
+        """
+        Getting the rank and the percentile of a student within the class.
+        :param student_id: Student ID.
+        :return: Pydantic model representing the rank,
+        empty if the student has no scores.
+        """
+        student = self.table.rows.get(student_id)
+        if student is not None:
+            rank = self._ranking(student["class_name"]).get(student_id)
+            if rank is not None:
+                return rank
+        return StudentRankSchema(rank=None, percentile=None)
+
+    def _to_read_model(self, row: Row) -> StudentSchema:
+        """
+        Conversion of a student row to a pydantic model with the scores.
+        :param row: Student row.
+        :return: Pydantic model.
+        """
+        return self.schema.model_validate(
+            {**row, "scores": self._scores(row["id"])},
+        )
+
+    def _find_rows(
+        self,
+        offset: int,
+        limit: int | None,
+        filter_by: dict,
+    ) -> list[Row]:
+        if filter_by.keys() == {"id"}:
+            row = self.table.rows.get(filter_by["id"])
+            rows = [] if row is None else [row]
+        else:
+            rows = self._filter_by(self.table.rows.values(), filter_by)
+        return list(self._slice(rows, offset, limit))
+
+    def _scores(self, student_id: int) -> list[Row]:
+        return self.session.table("scores").lookup("student_id", student_id)
+
+    @staticmethod
+    def _average_score(student: Row) -> float | None:
+        if not student["score_count"]:
+            return None
+        return student["score_sum"] / student["score_count"]
+
+    def _ranking(
+        self,
+        class_name: ClassNamesEnum,
+    ) -> dict[int, StudentRankSchema]:
+        """
+        Ranking students with scores within a class
+        by the maintained average score.
+        :param class_name: Class name.
+        :return: Ranks by student ID.
+        """
+        averages = {
+            student["id"]: self._average_score(student)
+            for student in self.table.rows.values()
+            if student["class_name"] == class_name and student["score_count"]
+        }
+        ordered = sorted(averages.values())
+        ranking = {}
+        for student_id, average in averages.items():
+            below = bisect_left(ordered, average)
+            above = len(ordered) - bisect_right(ordered, average)
+            ranking[student_id] = StudentRankSchema(
+                rank=above + 1,
+                percentile=(
+                    below / (len(ordered) - 1) * 100 if len(ordered) > 1 else 0
+                ),
+            )
+        return ranking
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Getting the trigrams of the words of a text as pg_trgm does.
+    :param text: Text.
+    :return: Set of trigrams.
+    """
+    result = set()
+    for word in "".join(
+        char if char.isalnum() else " " for char in text.lower()
+    ).split():
+        word = f"  {word} "
+        result.update(word[i : i + 3] for i in range(len(word) - 2))
+    return result
+
+
+def word_similarity(query: str, text: str) -> float:
+    """
+    Approximating pg_trgm word_similarity: the greatest share
+    of the query trigrams found in a word of the text.
+    :param query: Query.
+    :param text: Text.
+    :return: Similarity from 0 to 1.
+    """
+    query_trigrams = trigrams(query)
+    if not query_trigrams:
+        return 0
+    return max(
+        (
+            len(query_trigrams & trigrams(word)) / len(query_trigrams)
+            for word in text.split()
+        ),
+        default=0,
+    )
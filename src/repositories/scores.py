@@ -1,6 +1,270 @@
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    DateTime,
+    Integer,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    literal_column,
+    select,
+    update,
+    values,
+)
+
 from src.models.scores import Scores
+from src.models.students import Students
+from src.schemas.scores import (
+    ScoreSchema,
+    ScoresFilterParams,
+    ScoresTimeseriesParams,
+    ScoresTimeseriesSchema,
+)
 from src.utils.repository import BaseRepository
 
 
 class ScoresRepository(BaseRepository):
     model = Scores
+    schema = ScoreSchema
+
+    async def add_one(self, data: dict) -> int:
+        """
+        Adding a score to the database
+        and updating the student's scores summary.
+        :param data: Score data.
+        :return: ID of the created score.
+        """
+        score_id = await super().add_one(data)
+        statement = (
+            update(Students)
+            .filter_by(id=data["student_id"])
+            .values(
+                version=Students.version + 1,
+                score_count=Students.score_count + 1,
+                score_sum=Students.score_sum + data["score"],
+                last_score_at=func.greatest(
+                    Students.last_score_at,
+                    data["date_of_receipt"],
+                ),
+            )
+        )
+        await self.session.execute(statement)
+        self._invalidate(data["student_id"], model=Students)
+        return score_id
+
+    async def add_many(self, data: list[dict]) -> list[int]:
+        """
+        Adding scores to the database in one batch
+        and updating the students' scores summary.
+        :param data: Scores data.
+        :return: IDs of the created scores in the order of the data.
+        """
+        scores_ids = await super().add_many(data)
+        if not data:
+            return scores_ids
+        summary = defaultdict(lambda: [0, 0, date.min])
+        for score in data:
+            student_summary = summary[score["student_id"]]
+            student_summary[0] += 1
+            student_summary[1] += score["score"]
+            student_summary[2] = max(
+                student_summary[2],
+                score["date_of_receipt"],
+            )
+        summary_values = values(
+            column("student_id", Integer),
+            column("count", Integer),
+            column("sum", Integer),
+            column("last", Date),
+            name="summary",
+        ).data([(student_id, *row) for student_id, row in summary.items()])
+        statement = (
+            update(Students)
+            .where(Students.id == summary_values.c.student_id)
+            .values(
+                version=Students.version + 1,
+                score_count=Students.score_count + summary_values.c.count,
+                score_sum=Students.score_sum + summary_values.c.sum,
+                last_score_at=func.greatest(
+                    Students.last_score_at,
+                    summary_values.c.last,
+                ),
+            )
+        )
+        await self.session.execute(statement)
+        self._invalidate(*summary, model=Students)
+        return scores_ids
+
+    async def edit_one(self, obj_id: int, data: dict) -> int:
+        """
+        Updating a score in the database
+        and updating the student's scores summary.
+        :param obj_id: Score ID.
+        :param data: Score data.
+        :return: ID of the updated score.
+        """
+        old_score = (
+            select(self.model.id, self.model.score)
+            .filter_by(id=obj_id)
+            .with_for_update()
+            .cte("old_score")
+        )
+        statement = (
+            update(self.model)
+            .where(self.model.id == old_score.c.id)
+            .values(**data, version=self.model.version + 1)
+            .returning(
+                self.model.student_id,
+                self.model.score - old_score.c.score,
+            )
+        )
+        result = await self.session.execute(statement)
+        student_id, score_delta = result.one()
+        statement = (
+            update(Students)
+            .filter_by(id=student_id)
+            .values(
+                version=Students.version + 1,
+                score_sum=Students.score_sum + score_delta,
+            )
+        )
+        if "date_of_receipt" in data:
+            statement = statement.values(
+                last_score_at=self._last_score_at(student_id),
+            )
+        await self.session.execute(statement)
+        self._invalidate(obj_id)
+        self._invalidate(student_id, model=Students)
+        return obj_id
+
+    async def delete_one(self, obj_id: int) -> None:
+        """
+        Deleting a score from the database by ID
+        and updating the student's scores summary.
+        :param obj_id: Score ID.
+        :return: None.
+        """
+        statement = (
+            delete(self.model)
+            .filter_by(id=obj_id)
+            .returning(
+                self.model.student_id,
+                self.model.score,
+                self.model.date_of_receipt,
+            )
+        )
+        result = await self.session.execute(statement)
+        self._invalidate(obj_id)
+        deleted = result.one_or_none()
+        if deleted is None:
+            return
+        student_id, score, date_of_receipt = deleted
+        statement = (
+            update(Students)
+            .filter_by(id=student_id)
+            .values(
+                version=Students.version + 1,
+                score_count=Students.score_count - 1,
+                score_sum=Students.score_sum - score,
+                # Only deleting the latest score requires a lookup.
+                last_score_at=case(
+                    (
+                        Students.last_score_at == date_of_receipt,
+                        self._last_score_at(student_id),
+                    ),
+                    else_=Students.last_score_at,
+                ),
+            )
+        )
+        await self.session.execute(statement)
+        self._invalidate(student_id, model=Students)
+
+    async def find_timeseries(
+        self,
+        params: ScoresTimeseriesParams,
+    ) -> ScoresTimeseriesSchema:
+        """
+        Aggregating the average score by weeks or months
+        of the scores of a student or a class.
+        The scores of a student are read by the range of the
+        (student_id, date_of_receipt) index.
+        :param params: Timeseries params.
+        :return: Pydantic model representing the buckets ordered by date.
+        """
+        # Inlined, so that the grouped expression matches the selected one.
+        bucket = literal_column(f"'{params.bucket.value}'")
+        start = cast(
+            func.date_trunc(
+                bucket,
+                cast(self.model.date_of_receipt, DateTime),
+            ),
+            Date,
+        )
+        if params.student_id is not None:
+            student = self.model.student_id == params.student_id
+        else:
+            student = self.model.student_id.in_(
+                select(Students.id).filter_by(class_name=params.class_name)
+            )
+        statement = (
+            select(
+                start,
+                func.avg(self.model.score),
+                func.count(),
+            )
+            .where(
+                student,
+                *self._where(
+                    ScoresFilterParams(
+                        date_from=params.date_from,
+                        date_to=params.date_to,
+                    )
+                ),
+            )
+            .group_by(start)
+            .order_by(start)
+        )
+        result = await self.session.execute(statement)
+        return ScoresTimeseriesSchema(
+            bucket=params.bucket,
+            buckets=[tuple(row) for row in result.all()],
+        )
+
+    def _where(
+        self,
+        filters: ScoresFilterParams | None,
+    ) -> list[ColumnElement]:
+        """
+        Conditions of the scores filter params.
+        :param filters: Filter params.
+        :return: List of conditions.
+        """
+        if filters is None:
+            return []
+        conditions = []
+        if filters.student_id is not None:
+            conditions.append(self.model.student_id == filters.student_id)
+        if filters.date_from is not None:
+            conditions.append(self.model.date_of_receipt >= filters.date_from)
+        if filters.date_to is not None:
+            conditions.append(self.model.date_of_receipt <= filters.date_to)
+        if filters.score is not None:
+            conditions.append(self.model.score == filters.score)
+        return conditions
+
+    def _last_score_at(self, student_id: int):
+        """
+        Subquery of the date of the student's latest score.
+        :param student_id: Student ID.
+        :return: Scalar subquery.
+        """
+        return (
+            select(func.max(self.model.date_of_receipt))
+            .filter_by(student_id=student_id)
+            .scalar_subquery()
+        )
@@ -1,38 +1,359 @@
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from pydantic import BaseModel
+from sqlalchemy import (
+    Numeric,
+    Select,
+    String,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.exc import (
+    MultipleResultsFound,
+    NoResultFound,
+)
 
+from src.models.scores import Scores
 from src.models.students import Students
-from src.schemas.students import StudentSchema
+from src.models.utils import (
+    ClassNamesEnum,
+    GRADES,
+)
+from src.schemas.students import (
+    FoundStudentSchema,
+    LeaderboardEntrySchema,
+    StudentRankSchema,
+    StudentSchema,
+    StudentStatsSchema,
+    StudentSummarySchema,
+)
 from src.utils.repository import BaseRepository
 
 
 class StudentsRepository(BaseRepository):
     model = Students
+    schema = StudentSchema
 
-    async def find_all(self) -> list[StudentSchema]:
+    async def _find_all(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        after_id: int | None = None,
+        filters: BaseModel | None = None,
+    ) -> list[StudentSchema]:
         """
-        Getting all students from the database.
+        Getting students from the database ordered by ID.
+        :param offset: Quantity of students to skip.
+        :param limit: Maximum quantity of students.
+        :param after_id: Return only students with a greater ID.
+        :param filters: Filter params.
         :return: List of Pydantic models representing the students.
         """
         statement = (
-            select(self.model)
-            .options(
-                selectinload(self.model.scores)
-            )
+            select(*self._read_columns())
+            .where(*self._where(filters))
+            .order_by(self.model.id)
+            .offset(offset)
+            .limit(limit)
         )
-        result = await self.session.execute(statement)
-        result = [row[0].to_read_model() for row in result.all()]
-        return result
+        if after_id is not None:
+            statement = statement.where(self.model.id > after_id)
+        return await self._find_with_scores(statement)
 
-    async def find_one(self, **filter_by) -> StudentSchema:
+    async def _find_one(self, **filter_by) -> StudentSchema:
         """
         Search for a student by filters in the database.
         :param filter_by: Filters.
         :return: Pydantic models representing the students.
         """
+        statement = select(*self._read_columns()).filter_by(**filter_by)
+        students = await self._find_with_scores(statement)
+        if not students:
+            raise NoResultFound
+        if len(students) > 1:
+            raise MultipleResultsFound
+        return students[0]
+
+    async def _find_many(self, ids: list[int]) -> dict[int, StudentSchema]:
+        """
+        Getting students with their scores by IDs from the database.
+        :param ids: Students IDs.
+        :return: Pydantic models representing the students by ID.
+        """
+        statement = select(*self._read_columns()).where(
+            self.model.id == self._any_id(ids),
+        )
+        students = await self._find_with_scores(statement)
+        return {student.id: student for student in students}
+
+    async def _find_with_scores(
+        self,
+        students: Select,
+    ) -> list[StudentSchema]:
+        """
+        Getting students with their scores in one joined query.
+        :param students: Statement selecting the students columns.
+        :return: List of Pydantic models representing the students.
+        """
+        students = students.subquery()
+        statement = (
+            select(
+                students,
+                Scores.score,
+                Scores.date_of_receipt,
+            )
+            .outerjoin(Scores, Scores.student_id == students.c.id)
+            .order_by(students.c.id, Scores.id)
+        )
+        result = await self.session.execute(statement)
+        keys = list(students.c.keys())
+        students_data = {}
+        for row in result:
+            student_data = students_data.get(row.id)
+            if student_data is None:
+                student_data = dict(zip(keys, row))
+                student_data["scores"] = []
+                students_data[row.id] = student_data
+            if row.score is not None:
+                student_data["scores"].append(
+                    {
+                        "score": row.score,
+                        "date_of_receipt": row.date_of_receipt,
+                    }
+                )
+        return [
+            self.schema.model_validate(student_data)
+            for student_data in students_data.values()
+        ]
+
+    async def delete_one(self, obj_id: int) -> None:
+        """
+        Deleting a student from the database by ID.
+        With the cache enabled the scores are deleted explicitly
+        to invalidate them instead of relying on the cascade.
+        :param obj_id: Student ID.
+        :return: None.
+        """
+        if self.cache is not None:
+            statement = delete(Scores).filter_by(student_id=obj_id).returning(Scores.id)
+            result = await self.session.execute(statement)
+            self._invalidate(*result.scalars(), model=Scores)
+        await super().delete_one(obj_id)
+
+    async def find_stats(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        **filter_by,
+    ) -> list[StudentStatsSchema]:
+        """
+        Aggregating scores of students in the database.
+        :param offset: Quantity of students to skip.
+        :param limit: Maximum quantity of students.
+        :param filter_by: Students filters.
+        :return: List of Pydantic models representing the students stats.
+        """
+        students = (
+            select(self.model.id)
+            .filter_by(**filter_by)
+            .order_by(self.model.id)
+            .offset(offset)
+            .limit(limit)
+            .subquery()
+        )
         statement = (
-            select(self.model)
-            .options(selectinload(self.model.scores))
-            .filter_by(**filter_by))
+            select(
+                students.c.id,
+                func.count(Scores.id),
+                func.avg(Scores.score),
+                func.min(Scores.score),
+                func.max(Scores.score),
+                func.max(Scores.date_of_receipt),
+                *(
+                    func.count(Scores.id).filter(Scores.score == grade)
+                    for grade in GRADES
+                ),
+            )
+            .outerjoin(Scores, Scores.student_id == students.c.id)
+            .group_by(students.c.id)
+            .order_by(students.c.id)
+        )
         result = await self.session.execute(statement)
-        return result.scalar_one().to_read_model()
+        return [
+            StudentStatsSchema(
+                student_id=student_id,
+                count=count,
+                average=average,
+                min=min_score,
+                max=max_score,
+                distribution=dict(zip(GRADES, distribution)),
+                last_date_of_receipt=last_date_of_receipt,
+            )
+            for (
+                student_id,
+                count,
+                average,
+                min_score,
+                max_score,
+                last_date_of_receipt,
+                *distribution,
+            ) in result.all()
+        ]
+
+    async def find_summary(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        **filter_by,
+    ) -> list[StudentSummarySchema]:
+        """
+        Getting the maintained scores summary of students
+        without reading their scores.
+        :param offset: Quantity of students to skip.
+        :param limit: Maximum quantity of students.
+        :param filter_by: Students filters.
+        :return: List of Pydantic models representing the summary.
+        """
+        statement = (
+            select(
+                self.model.id,
+                self.model.score_count,
+                self.model.score_sum,
+                self.model.last_score_at,
+            )
+            .filter_by(**filter_by)
+            .order_by(self.model.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(statement)
+        return [
+            StudentSummarySchema(
+                student_id=student_id,
+                score_count=score_count,
+                average_score=(score_sum / score_count if score_count else None),
+                last_score_at=last_score_at,
+            )
+            for student_id, score_count, score_sum, last_score_at in result.all()
+        ]
+
+    async def find_leaderboard(
+        self,
+        class_name: ClassNamesEnum,
+        limit: int,
+    ) -> list[LeaderboardEntrySchema]:
+        """
+        Getting the best students of a class by the average score.
+        :param class_name: Class name.
+        :param limit: Maximum quantity of students.
+        :return: List of Pydantic models representing the leaderboard.
+        """
+        ranking = self._ranking().filter_by(class_name=class_name).subquery()
+        statement = select(ranking).order_by(ranking.c.rank, ranking.c.id).limit(limit)
+        result = await self.session.execute(statement)
+        return [
+            LeaderboardEntrySchema(
+                student_id=row.id,
+                class_name=row.class_name,
+                first_name=row.first_name,
+                last_name=row.last_name,
+                average_score=row.average_score,
+                rank=row.rank,
+                percentile=row.percentile,
+            )
+            for row in result.all()
+        ]
+
+    async def search(self, query: str, limit: int) -> list[FoundStudentSchema]:
+        """
+        Search for students by a part of the first or the last name,
+        the most similar first.
+        The trigram word similarity operator is served by the GIN indexes.
+        :param query: Part of the name.
+        :param limit: Maximum quantity of students.
+        :return: List of Pydantic models representing the found students.
+        """
+        query = literal(query, String)
+        similarity = func.greatest(
+            func.word_similarity(query, self.model.first_name),
+            func.word_similarity(query, self.model.last_name),
+        ).label("similarity")
+        statement = (
+            select(
+                self.model.id,
+                self.model.class_name,
+                self.model.first_name,
+                self.model.last_name,
+                similarity,
+            )
+            .where(
+                or_(
+                    query.op("<%", is_comparison=True)(self.model.first_name),
+                    query.op("<%", is_comparison=True)(self.model.last_name),
+                )
+            )
+            .order_by(similarity.desc(), self.model.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(statement)
+        return [
+            FoundStudentSchema(
+                student_id=row.id,
+                class_name=row.class_name,
+                first_name=row.first_name,
+                last_name=row.last_name,
+                similarity=row.similarity,
+            )
+            for row in result.all()
+        ]
+
+    async def find_rank(self, student_id: int) -> StudentRankSchema:
+        """
+        Getting the rank and the percentile of a student within the class.
+        :param student_id: Student ID.
+        :return: Pydantic model representing the rank,
+        empty if the student has no scores.
+        """
+        class_name = (
+            select(self.model.class_name).filter_by(id=student_id).scalar_subquery()
+        )
+        ranking = self._ranking().where(self.model.class_name == class_name).subquery()
+        statement = select(
+            ranking.c.rank,
+            ranking.c.percentile,
+        ).where(ranking.c.id == student_id)
+        result = await self.session.execute(statement)
+        row = result.one_or_none()
+        if row is None:
+            return StudentRankSchema(rank=None, percentile=None)
+        return StudentRankSchema(rank=row.rank, percentile=row.percentile)
+
+    def _ranking(self) -> Select:
+        """
+        Statement ranking students with scores within their classes
+        by the maintained average score.
+        :return: Select statement.
+        """
+        average_score = cast(self.model.score_sum, Numeric) / self.model.score_count
+        return select(
+            self.model.id,
+            self.model.class_name,
+            self.model.first_name,
+            self.model.last_name,
+            average_score.label("average_score"),
+            func.rank()
+            .over(
+                partition_by=self.model.class_name,
+                order_by=average_score.desc(),
+            )
+            .label("rank"),
+            (
+                func.percent_rank().over(
+                    partition_by=self.model.class_name,
+                    order_by=average_score,
+                )
+                * 100
+            ).label("percentile"),
+        ).where(self.model.score_count > 0)
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class CacheStatsSchema(BaseModel):
+    enabled: bool
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float | None
+
+
+class SingleFlightStatsSchema(BaseModel):
+    executed: int
+    coalesced: int
+    in_flight: int
+    coalesced_ratio: float | None
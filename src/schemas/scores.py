@@ -1,7 +1,15 @@
 from datetime import date
+from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel
+from fastapi import Query
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+)
 
+from src.models.utils import ClassNamesEnum
 from src.schemas.mixins.scores import (
     DateOfReceiptMixin,
     ScoreMixin,
@@ -14,6 +22,8 @@ class ScoreSchema(BaseModel):
     score: int
     date_of_receipt: date
     student_id: int
+    # Not serialized, the ETag is built from the version of the read.
+    version: int | None = Field(None, exclude=True)
 
 
 class AddScoreSchema(
@@ -30,6 +40,53 @@ class UpdateScoreSchema(
     pass
 
 
+class ScoresFilterParams(BaseModel):
+    # Frozen to be hashable as a part of the cache keys.
+    model_config = ConfigDict(frozen=True)
+
+    student_id: int | None = Query(
+        None,
+        ge=1,
+        description="Student ID",
+    )
+    date_from: date | None = Query(
+        None,
+        description="Earliest date of receipt",
+    )
+    date_to: date | None = Query(
+        None,
+        description="Latest date of receipt",
+    )
+    score: int | None = Query(
+        None,
+        ge=2,
+        le=5,
+        description="Score",
+    )
+
+
+class TimeBucketEnum(Enum):
+    WEEK = "week"
+    MONTH = "month"
+
+
+class ScoresTimeseriesParams(BaseModel):
+    # Frozen to be hashable as a part of the single-flight keys.
+    model_config = ConfigDict(frozen=True)
+
+    student_id: int | None = None
+    class_name: ClassNamesEnum | None = None
+    bucket: TimeBucketEnum = TimeBucketEnum.WEEK
+    date_from: date | None = None
+    date_to: date | None = None
+
+
+class ScoresTimeseriesSchema(BaseModel):
+    bucket: TimeBucketEnum
+    # Start of the bucket, average score and quantity of scores.
+    buckets: list[tuple[date, float, int]]
+
+
 class ScoresForStudentSchema(BaseModel):
     score: int
     date_of_receipt: date
@@ -37,3 +94,17 @@ class ScoresForStudentSchema(BaseModel):
 
 class ScoreIdSchema(BaseModel):
     score_id: int
+
+
+class BulkScoreIdSchema(ScoreIdSchema):
+    index: int
+
+
+class BulkErrorSchema(BaseModel):
+    index: int
+    detail: Any
+
+
+class BulkScoresSchema(BaseModel):
+    created: list[BulkScoreIdSchema]
+    errors: list[BulkErrorSchema]
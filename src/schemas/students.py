@@ -1,3 +1,4 @@
+from datetime import date
 from typing import Annotated
 
 from pydantic import (
@@ -16,6 +17,8 @@ class StudentSchema(BaseModel):
     last_name: str
     age: int
     scores: list[ScoresForStudentSchema]
+    # Not serialized, the ETag is built from the version of the read.
+    version: int | None = Field(None, exclude=True)
 
 
 class AddStudentSchema(BaseModel):
@@ -25,6 +28,10 @@ class AddStudentSchema(BaseModel):
     age: Annotated[int, Field(ge=7)]
 
 
+class ImportStudentSchema(AddStudentSchema):
+    key: Annotated[str, Field(min_length=1, max_length=100)]
+
+
 class UpdateStudentSchema(BaseModel):
     class_name: Annotated[
         ClassNamesEnum | None,
@@ -46,3 +53,49 @@ class UpdateStudentSchema(BaseModel):
 
 class StudentIdSchema(BaseModel):
     student_id: int
+
+
+class ImportedStudentsSchema(BaseModel):
+    students_ids: dict[str, int]
+
+
+class StudentStatsSchema(BaseModel):
+    student_id: int
+    count: int
+    average: float | None
+    min: int | None
+    max: int | None
+    distribution: dict[int, int]
+    last_date_of_receipt: date | None
+
+
+class StudentSummarySchema(BaseModel):
+    student_id: int
+    score_count: int
+    average_score: float | None
+    last_score_at: date | None
+
+
+class StudentRankSchema(BaseModel):
+    rank: int | None
+    percentile: float | None
+
+
+class RankedStudentSchema(StudentSchema, StudentRankSchema):
+    pass
+
+
+class LeaderboardEntrySchema(StudentRankSchema):
+    student_id: int
+    class_name: str
+    first_name: str
+    last_name: str
+    average_score: float
+
+
+class FoundStudentSchema(BaseModel):
+    student_id: int
+    class_name: str
+    first_name: str
+    last_name: str
+    similarity: float
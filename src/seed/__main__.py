@@ -0,0 +1,88 @@
+"""
+Seeding the database of the settings with generated data:
+
+    python -m src.seed [--students N] [--seed N] [--truncate]
+
+The same options give the same rows, IDs included, so benchmark
+and load test runs are reproducible.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import date
+
+from src.db.db import async_engine
+from src.seed.generator import SeedOptions
+from src.seed.loader import (
+    NotEmptyException,
+    seed,
+)
+
+
+async def run(args: argparse.Namespace) -> int:
+    options = SeedOptions(
+        students=args.students,
+        scores_per_student=args.scores_per_student,
+        years=args.years,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        today=args.today,
+    )
+    started_at = time.perf_counter()
+    try:
+        students, scores = await seed(
+            async_engine,
+            options,
+            workers=args.workers,
+            truncate=args.truncate,
+        )
+    except NotEmptyException as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    finally:
+        await async_engine.dispose()
+    print(
+        f"Loaded {students} students and {scores} scores "
+        f"in {time.perf_counter() - started_at:.1f} s"
+    )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.seed")
+    parser.add_argument("--students", type=int, default=1_000_000)
+    parser.add_argument(
+        "--scores-per-student",
+        type=float,
+        default=20,
+        help="Mean quantity of scores of a student",
+    )
+    parser.add_argument("--years", type=int, default=4, help="Years of scores")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="Last day of scores, fix it to reproduce a seeding later",
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent COPY connections",
+    )
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Delete the existing students and scores",
+    )
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
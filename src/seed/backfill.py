@@ -0,0 +1,71 @@
+"""
+Filling the scores summary columns of the students from their scores:
+
+    python -m src.seed.backfill
+
+Needed once for a database that had scores before the summary columns
+were added, the application keeps them up to date afterwards.
+Only the students with a wrong summary are updated.
+"""
+
+import asyncio
+import sys
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db.db import async_engine
+
+BACKFILL_SUMMARY = text(
+    """
+    UPDATE students
+    SET score_count = summary.score_count,
+        score_sum = summary.score_sum,
+        last_score_at = summary.last_score_at
+    FROM (
+        SELECT students.id,
+               count(scores.id) AS score_count,
+               coalesce(sum(scores.score), 0) AS score_sum,
+               max(scores.date_of_receipt) AS last_score_at
+        FROM students
+        LEFT JOIN scores ON scores.student_id = students.id
+        GROUP BY students.id
+    ) AS summary
+    WHERE students.id = summary.id
+      AND (students.score_count, students.score_sum, students.last_score_at)
+          IS DISTINCT FROM
+          (summary.score_count, summary.score_sum, summary.last_score_at)
+    """
+)
+
+
+async def backfill_summary(engine: AsyncEngine) -> int:
+    """
+    Recomputing the scores summary of the students in one transaction.
+    The scores are locked against writes meanwhile,
+    so the application may keep running.
+    :param engine: Database engine.
+    :return: Quantity of the updated students.
+    """
+    async with engine.begin() as conn:
+        await conn.execute(text("LOCK TABLE scores IN SHARE MODE"))
+        result = await conn.execute(BACKFILL_SUMMARY)
+        return result.rowcount
+
+
+async def run() -> int:
+    started_at = time.perf_counter()
+    try:
+        students = await backfill_summary(async_engine)
+    finally:
+        await async_engine.dispose()
+    print(
+        f"Updated the summary of {students} students "
+        f"in {time.perf_counter() - started_at:.1f} s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
@@ -0,0 +1,232 @@
+import random
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    date,
+    timedelta,
+)
+
+from src.models.utils import (
+    GRADES,
+    ClassNamesEnum,
+)
+
+# Share of the students of each class.
+CLASS_WEIGHTS = {
+    ClassNamesEnum.MATH: 45,
+    ClassNamesEnum.SCIENCE: 35,
+    ClassNamesEnum.ART: 20,
+}
+# Share of each grade, most grades are 4.
+GRADE_WEIGHTS = dict(zip(GRADES, (5, 22, 45, 28)))
+# Months without lessons.
+HOLIDAY_MONTHS = frozenset((6, 7, 8))
+
+FIRST_NAMES = (
+    "Alex",
+    "Alina",
+    "Anna",
+    "Anton",
+    "Arina",
+    "Artem",
+    "Boris",
+    "Daria",
+    "Denis",
+    "Dmitry",
+    "Egor",
+    "Elena",
+    "Eva",
+    "Fedor",
+    "Gleb",
+    "Igor",
+    "Ilya",
+    "Irina",
+    "Ivan",
+    "Kirill",
+    "Ksenia",
+    "Lev",
+    "Maria",
+    "Mark",
+    "Maxim",
+    "Mikhail",
+    "Nikita",
+    "Nina",
+    "Oleg",
+    "Olga",
+    "Pavel",
+    "Polina",
+    "Roman",
+    "Sofia",
+    "Stepan",
+    "Taisia",
+    "Timur",
+    "Vera",
+    "Victoria",
+    "Yan",
+)
+LAST_NAMES = (
+    "Alekseev",
+    "Andreev",
+    "Belov",
+    "Bogdanov",
+    "Volkov",
+    "Vorobev",
+    "Gusev",
+    "Egorov",
+    "Zaitsev",
+    "Ivanov",
+    "Kiselev",
+    "Kovalev",
+    "Kozlov",
+    "Komarov",
+    "Kuznetsov",
+    "Lebedev",
+    "Makarov",
+    "Medvedev",
+    "Morozov",
+    "Nikitin",
+    "Novikov",
+    "Orlov",
+    "Pavlov",
+    "Petrov",
+    "Popov",
+    "Romanov",
+    "Semenov",
+    "Smirnov",
+    "Sokolov",
+    "Solovev",
+    "Stepanov",
+    "Tarasov",
+    "Fedorov",
+    "Frolov",
+    "Vasilev",
+    "Yakovlev",
+)
+
+STUDENT_COLUMNS = (
+    "id",
+    "class_name",
+    "first_name",
+    "last_name",
+    "age",
+    "score_count",
+    "score_sum",
+    "last_score_at",
+)
+SCORE_COLUMNS = (
+    "id",
+    "score",
+    "date_of_receipt",
+    "student_id",
+)
+
+
+@dataclass(frozen=True)
+class SeedOptions:
+    """
+    Options of the generated data.
+    """
+
+    students: int
+    scores_per_student: float
+    years: int
+    seed: int
+    batch_size: int
+    today: date = field(default_factory=date.today)
+
+    @property
+    def batches(self) -> int:
+        return -(-self.students // self.batch_size)
+
+
+@dataclass
+class Batch:
+    """
+    Rows of a batch of students with their scores,
+    in the column order of STUDENT_COLUMNS and SCORE_COLUMNS.
+    """
+
+    index: int
+    students: list[tuple]
+    scores: list[tuple]
+
+
+def school_days(options: SeedOptions) -> list[date]:
+    """
+    Getting the days with lessons of the last years.
+    :param options: Seed options.
+    :return: Weekdays out of the holidays up to today.
+    """
+    day = options.today - timedelta(days=365 * options.years)
+    days = []
+    while day <= options.today:
+        if day.weekday() < 5 and day.month not in HOLIDAY_MONTHS:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def generate_batch(
+    options: SeedOptions,
+    index: int,
+    first_score_id: int,
+    days: list[date],
+) -> Batch:
+    """
+    Generating a batch of students with their scores.
+    The batch depends only on the seed, its index and the first
+    score ID, so the data is the same on every run.
+    :param options: Seed options.
+    :param index: Batch index.
+    :param first_score_id: ID of the first score of the batch.
+    :param days: Days of the scores.
+    :return: Rows of the batch.
+    """
+    rng = random.Random(f"{options.seed}:{index}")
+    first_student_id = index * options.batch_size + 1
+    last_student_id = min(
+        first_student_id + options.batch_size,
+        options.students + 1,
+    )
+    classes = list(CLASS_WEIGHTS)
+    class_weights = list(CLASS_WEIGHTS.values())
+    grades = list(GRADE_WEIGHTS)
+    grade_weights = list(GRADE_WEIGHTS.values())
+
+    students = []
+    scores = []
+    score_id = first_score_id
+    for student_id in range(first_student_id, last_student_id):
+        quantity = max(
+            0,
+            round(
+                rng.gauss(
+                    options.scores_per_student,
+                    options.scores_per_student / 3,
+                )
+            ),
+        )
+        student_grades = rng.choices(grades, grade_weights, k=quantity)
+        student_days = rng.choices(days, k=quantity)
+        for grade, day in zip(student_grades, student_days):
+            scores.append((score_id, grade, day, student_id))
+            score_id += 1
+        students.append(
+            (
+                student_id,
+                rng.choices(classes, class_weights)[0].name,
+                rng.choice(FIRST_NAMES),
+                rng.choice(LAST_NAMES),
+                min(18, max(8, round(rng.gauss(13, 2.5)))),
+                quantity,
+                sum(student_grades),
+                max(student_days, default=None),
+            )
+        )
+    return Batch(
+        index=index,
+        students=students,
+        scores=scores,
+    )
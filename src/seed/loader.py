@@ -0,0 +1,172 @@
+import asyncio
+import itertools
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.models.utils import ClassNamesEnum
+from src.seed.generator import (
+    SCORE_COLUMNS,
+    STUDENT_COLUMNS,
+    Batch,
+    SeedOptions,
+    generate_batch,
+    school_days,
+)
+from src.utils.memory import MemoryStorage
+
+logger = logging.getLogger("src.seed")
+
+TABLES = ("students", "scores")
+
+
+class NotEmptyException(Exception):
+    """
+    The tables to seed already have rows.
+    """
+
+
+async def copy_batch(engine: AsyncEngine, batch: Batch) -> None:
+    """
+    Loading a batch with COPY in one transaction,
+    the students first for the foreign keys of the scores.
+    :param engine: Database engine.
+    :param batch: Rows of the batch.
+    :return: None.
+    """
+    async with engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        async with driver_connection.transaction():
+            await driver_connection.copy_records_to_table(
+                "students",
+                records=batch.students,
+                columns=STUDENT_COLUMNS,
+            )
+            await driver_connection.copy_records_to_table(
+                "scores",
+                records=batch.scores,
+                columns=SCORE_COLUMNS,
+            )
+
+
+async def prepare_tables(engine: AsyncEngine, truncate: bool) -> None:
+    """
+    Making sure the tables are empty, so the generated IDs are free.
+    :param engine: Database engine.
+    :param truncate: Whether to delete the existing rows.
+    :return: None.
+    """
+    async with engine.begin() as conn:
+        if truncate:
+            await conn.execute(
+                text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"),
+            )
+            return
+        for table in TABLES:
+            if await conn.scalar(text(f"SELECT EXISTS (SELECT FROM {table})")):
+                raise NotEmptyException(
+                    f"Table {table} is not empty, use --truncate",
+                )
+
+
+async def finish_tables(engine: AsyncEngine) -> None:
+    """
+    Moving the ID sequences past the loaded IDs
+    and refreshing the planner statistics.
+    :param engine: Database engine.
+    :return: None.
+    """
+    async with engine.begin() as conn:
+        for table in TABLES:
+            await conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"coalesce(max(id), 0) + 1, false) FROM {table}"
+                ),
+            )
+        await conn.execute(text(f"ANALYZE {', '.join(TABLES)}"))
+
+
+async def seed(
+    engine: AsyncEngine,
+    options: SeedOptions,
+    workers: int,
+    truncate: bool = False,
+) -> tuple[int, int]:
+    """
+    Seeding the database with generated students and scores.
+    Batches are generated one after another, so that the score IDs
+    follow each other, and loaded by concurrent workers.
+    :param engine: Database engine.
+    :param options: Seed options.
+    :param workers: Quantity of concurrent COPY connections.
+    :param truncate: Whether to delete the existing rows.
+    :return: Quantity of the loaded students and scores.
+    """
+    await prepare_tables(engine, truncate)
+    days = school_days(options)
+    queue: asyncio.Queue[Batch | None] = asyncio.Queue(maxsize=workers)
+    started_at = time.perf_counter()
+    students = scores = 0
+
+    async def load() -> None:
+        while (batch := await queue.get()) is not None:
+            await copy_batch(engine, batch)
+            logger.info(
+                "Batch %d/%d loaded, %.1f s",
+                batch.index + 1,
+                options.batches,
+                time.perf_counter() - started_at,
+            )
+
+    async def generate() -> None:
+        nonlocal students, scores
+        for index in range(options.batches):
+            # Generated in a thread, so the loading goes on meanwhile.
+            batch = await asyncio.to_thread(
+                generate_batch,
+                options,
+                index,
+                scores + 1,
+                days,
+            )
+            students += len(batch.students)
+            scores += len(batch.scores)
+            await queue.put(batch)
+        for _ in range(workers):
+            await queue.put(None)
+
+    async with asyncio.TaskGroup() as group:
+        group.create_task(generate())
+        for _ in range(workers):
+            group.create_task(load())
+
+    await finish_tables(engine)
+    return students, scores
+
+
+def seed_memory(storage: MemoryStorage, options: SeedOptions) -> tuple[int, int]:
+    """
+    Seeding the in-memory database with the same data
+    as the database for the same options.
+    :param storage: Tables of the in-memory database.
+    :param options: Seed options.
+    :return: Quantity of the loaded students and scores.
+    """
+    days = school_days(options)
+    students = storage.tables["students"]
+    scores = storage.tables["scores"]
+    for index in range(options.batches):
+        batch = generate_batch(options, index, len(scores.rows) + 1, days)
+        for record in batch.students:
+            row = dict(zip(STUDENT_COLUMNS, record), version=1)
+            row["class_name"] = ClassNamesEnum[row["class_name"]]
+            students.insert(row)
+        for record in batch.scores:
+            scores.insert(dict(zip(SCORE_COLUMNS, record), version=1))
+    for table in (students, scores):
+        table.sequence = itertools.count(len(table.rows) + 1)
+    return len(students.rows), len(scores.rows)
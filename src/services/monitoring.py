@@ -0,0 +1,51 @@
+from src.schemas.monitoring import (
+    CacheStatsSchema,
+    SingleFlightStatsSchema,
+)
+from src.utils.cache import repository_cache
+from src.utils.singleflight import single_flight
+
+
+class MonitoringService:
+    @staticmethod
+    def get_cache_stats() -> CacheStatsSchema:
+        """
+        The logic of getting the repository cache stats.
+        :return: Pydantic model representing the cache stats.
+        """
+        if repository_cache is None:
+            return CacheStatsSchema(
+                enabled=False,
+                size=0,
+                max_size=0,
+                ttl=0,
+                hits=0,
+                misses=0,
+                evictions=0,
+                hit_ratio=None,
+            )
+        lookups = repository_cache.hits + repository_cache.misses
+        return CacheStatsSchema(
+            enabled=True,
+            size=len(repository_cache),
+            max_size=repository_cache.max_size,
+            ttl=repository_cache.ttl,
+            hits=repository_cache.hits,
+            misses=repository_cache.misses,
+            evictions=repository_cache.evictions,
+            hit_ratio=repository_cache.hits / lookups if lookups else None,
+        )
+
+    @staticmethod
+    def get_single_flight_stats() -> SingleFlightStatsSchema:
+        """
+        The logic of getting the read coalescing stats.
+        :return: Pydantic model representing the coalescing stats.
+        """
+        calls = single_flight.executed + single_flight.coalesced
+        return SingleFlightStatsSchema(
+            executed=single_flight.executed,
+            coalesced=single_flight.coalesced,
+            in_flight=len(single_flight),
+            coalesced_ratio=single_flight.coalesced / calls if calls else None,
+        )
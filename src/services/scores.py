@@ -1,48 +1,156 @@
+from typing import (
+    Any,
+    AsyncIterator,
+)
+
+from pydantic import ValidationError
 from sqlalchemy.exc import (
     IntegrityError,
     NoResultFound,
 )
 
+from src.api.batch import (
+    BaseBatchResponse,
+    get_batch_response,
+)
 from src.api.pagination import (
+    BaseCursorPaginationResponse,
     BasePaginationResponse,
+    CursorPaginationParams,
+    CursorPaginator,
     PaginationParams,
     Paginator,
 )
+from src.exceptions.base import EJournalException
 from src.exceptions.scores import (
     IncorrectStudentException,
     ScoreNotFoundException,
+    ScoresConflictException,
 )
+from src.exceptions.students import StudentNotFoundException
 from src.schemas.scores import (
     AddScoreSchema,
+    BulkErrorSchema,
+    BulkScoreIdSchema,
+    BulkScoresSchema,
     ScoreSchema,
     ScoreIdSchema,
+    ScoresFilterParams,
+    ScoresTimeseriesParams,
+    ScoresTimeseriesSchema,
     UpdateScoreSchema,
 )
+from src.utils.repository import is_foreign_key_violation
+from src.utils.singleflight import single_flight
 from src.utils.transaction import BaseManager
 
 
 class ScoresService:
 
     @staticmethod
+    @single_flight.coalesce
     async def get_all_scores(
         transaction: BaseManager,
         pagination: PaginationParams,
+        filters: ScoresFilterParams,
     ) -> BasePaginationResponse[ScoreSchema]:
         """
         The logic of getting all scores.
         :param transaction: Database transaction.
         :param pagination: Pagination params.
+        :param filters: Filter params.
         :return: List of Pydantic models representing the scores.
         """
         async with transaction:
-            scores = await transaction.scores_repo.find_all()
+            total = await transaction.scores_repo.count(filters)
             paginator = Paginator(
-                pages=scores,
+                total=total,
                 params=pagination,
             )
-            return paginator.get_response()
+            scores = await transaction.scores_repo.find_all(
+                offset=paginator.offset,
+                limit=paginator.limit,
+                filters=filters,
+            )
+            return paginator.get_response(scores)
+
+    @staticmethod
+    async def get_scores_by_cursor(
+        transaction: BaseManager,
+        pagination: CursorPaginationParams,
+    ) -> BaseCursorPaginationResponse[ScoreSchema]:
+        """
+        The logic of getting scores with keyset pagination.
+        :param transaction: Database transaction.
+        :param pagination: Cursor pagination params.
+        :return: List of Pydantic models representing the scores.
+        """
+        paginator = CursorPaginator(pagination)
+        async with transaction:
+            scores = await transaction.scores_repo.find_all(
+                limit=paginator.limit,
+                after_id=paginator.after_id,
+            )
+            return paginator.get_response(scores)
+
+    @staticmethod
+    async def export_scores(
+        transaction: BaseManager,
+    ) -> AsyncIterator[ScoreSchema]:
+        """
+        The logic of streaming all scores.
+        :param transaction: Database transaction.
+        :return: Asynchronous iterator over Pydantic models
+        representing the scores.
+        """
+        async with transaction:
+            async for score in transaction.scores_repo.stream_all():
+                yield score
+
+    @staticmethod
+    @single_flight.coalesce
+    async def get_scores_timeseries(
+        transaction: BaseManager,
+        params: ScoresTimeseriesParams,
+    ) -> ScoresTimeseriesSchema:
+        """
+        The logic of getting the average score trend
+        of a student or a class.
+        The student is looked up only if there are no buckets.
+        :param transaction: Database transaction.
+        :param params: Timeseries params.
+        :return: Pydantic model representing the buckets.
+        """
+        async with transaction:
+            timeseries = await transaction.scores_repo.find_timeseries(params)
+            if (
+                not timeseries.buckets
+                and params.student_id is not None
+                and not await transaction.students_repo.find_summary(
+                    id=params.student_id,
+                )
+            ):
+                raise StudentNotFoundException
+            return timeseries
 
     @staticmethod
+    async def get_scores_by_ids(
+        transaction: BaseManager,
+        ids: list[int],
+    ) -> BaseBatchResponse[ScoreSchema]:
+        """
+        The logic of getting scores by IDs.
+        :param transaction: Database transaction.
+        :param ids: Score IDs.
+        :return: Pydantic models representing the scores by ID
+        and the missing IDs.
+        """
+        async with transaction:
+            scores = await transaction.scores_repo.find_many(ids)
+            return get_batch_response(ids, scores)
+
+    @staticmethod
+    @single_flight.coalesce
     async def get_score(
         transaction: BaseManager,
         score_id: int,
@@ -84,6 +192,70 @@ class ScoresService:
             except IntegrityError:
                 raise IncorrectStudentException
 
+    @staticmethod
+    async def add_scores(
+        transaction: BaseManager,
+        scores_data: list[dict[str, Any]],
+    ) -> BulkScoresSchema:
+        """
+        The logic of creating scores in one transaction.
+        Invalid items and items with a wrong student ID are reported
+        as errors, the rest are created.
+        :param transaction: Database transaction.
+        :param scores_data: Raw scores data.
+        :return: Pydantic model representing the created scores IDs
+        and the errors by item index.
+        :raises IncorrectStudentException: If a student was deleted meanwhile.
+        :raises ScoresConflictException: If another constraint is violated.
+        """
+        errors = []
+        valid_scores = {}
+        for index, score_data in enumerate(scores_data):
+            try:
+                valid_scores[index] = AddScoreSchema.model_validate(score_data)
+            except ValidationError as exc:
+                errors.append(
+                    BulkErrorSchema(
+                        index=index,
+                        detail=exc.errors(
+                            include_url=False,
+                            include_context=False,
+                        ),
+                    )
+                )
+            except EJournalException as exc:
+                errors.append(BulkErrorSchema(index=index, detail=exc.detail))
+
+        async with transaction:
+            students_ids = await transaction.students_repo.find_existing_ids(
+                {score.student_id for score in valid_scores.values()},
+            )
+            for index, score in list(valid_scores.items()):
+                if score.student_id not in students_ids:
+                    del valid_scores[index]
+                    errors.append(
+                        BulkErrorSchema(
+                            index=index,
+                            detail=IncorrectStudentException.detail,
+                        )
+                    )
+            try:
+                scores_ids = await transaction.scores_repo.add_many(
+                    [score.model_dump() for score in valid_scores.values()],
+                )
+                await transaction.commit()
+            except IntegrityError as exc:
+                if is_foreign_key_violation(exc):
+                    raise IncorrectStudentException
+                raise ScoresConflictException
+
+        created = [
+            BulkScoreIdSchema(index=index, score_id=score_id)
+            for index, score_id in zip(valid_scores, scores_ids)
+        ]
+        errors.sort(key=lambda error: error.index)
+        return BulkScoresSchema(created=created, errors=errors)
+
     @staticmethod
     async def update_score(
         transaction: BaseManager,
@@ -1,22 +1,42 @@
 from sqlalchemy.exc import NoResultFound
 
+from src.api.batch import (
+    BaseBatchResponse,
+    get_batch_response,
+)
 from src.api.pagination import (
+    BaseCursorPaginationResponse,
     BasePaginationResponse,
+    CursorPaginationParams,
+    CursorPaginator,
     PaginationParams,
     Paginator,
 )
-from src.exceptions.students import StudentNotFoundException
+from src.models.utils import ClassNamesEnum
+from src.exceptions.students import (
+    DuplicateImportKeyException,
+    StudentNotFoundException,
+)
 from src.schemas.students import (
     AddStudentSchema,
+    FoundStudentSchema,
+    ImportedStudentsSchema,
+    ImportStudentSchema,
+    LeaderboardEntrySchema,
+    RankedStudentSchema,
     StudentIdSchema,
     StudentSchema,
+    StudentStatsSchema,
+    StudentSummarySchema,
     UpdateStudentSchema,
 )
+from src.utils.singleflight import single_flight
 from src.utils.transaction import BaseManager
 
 
 class StudentsService:
     @staticmethod
+    @single_flight.coalesce
     async def get_all_students(
         transaction: BaseManager,
         pagination: PaginationParams,
@@ -28,14 +48,138 @@ class StudentsService:
         :return: List of Pydantic models representing the students.
         """
         async with transaction:
-            students = await transaction.students_repo.find_all()
+            total = await transaction.students_repo.count()
+            paginator = Paginator(
+                total=total,
+                params=pagination,
+            )
+            students = await transaction.students_repo.find_all(
+                offset=paginator.offset,
+                limit=paginator.limit,
+            )
+            return paginator.get_response(students)
+
+    @staticmethod
+    async def get_students_by_cursor(
+        transaction: BaseManager,
+        pagination: CursorPaginationParams,
+    ) -> BaseCursorPaginationResponse[StudentSchema]:
+        """
+        The logic of getting students with keyset pagination.
+        :param transaction: Database transaction.
+        :param pagination: Cursor pagination params.
+        :return: List of Pydantic models representing the students.
+        """
+        paginator = CursorPaginator(pagination)
+        async with transaction:
+            students = await transaction.students_repo.find_all(
+                limit=paginator.limit,
+                after_id=paginator.after_id,
+            )
+            return paginator.get_response(students)
+
+    @staticmethod
+    async def get_students_stats(
+        transaction: BaseManager,
+        pagination: PaginationParams,
+    ) -> BasePaginationResponse[StudentStatsSchema]:
+        """
+        The logic of getting scores stats of all students.
+        :param transaction: Database transaction.
+        :param pagination: Pagination params.
+        :return: List of Pydantic models representing the students stats.
+        """
+        async with transaction:
+            total = await transaction.students_repo.count()
+            paginator = Paginator(
+                total=total,
+                params=pagination,
+            )
+            stats = await transaction.students_repo.find_stats(
+                offset=paginator.offset,
+                limit=paginator.limit,
+            )
+            return paginator.get_response(stats)
+
+    @staticmethod
+    async def get_student_stats(
+        transaction: BaseManager,
+        student_id: int,
+    ) -> StudentStatsSchema:
+        """
+        The logic of getting scores stats of a student by ID.
+        :param transaction: Database transaction.
+        :param student_id: Student ID.
+        :return: Pydantic model representing the student stats.
+        """
+        async with transaction:
+            stats = await transaction.students_repo.find_stats(
+                id=student_id,
+            )
+            if not stats:
+                raise StudentNotFoundException
+            return stats[0]
+
+    @staticmethod
+    async def get_students_summary(
+        transaction: BaseManager,
+        pagination: PaginationParams,
+    ) -> BasePaginationResponse[StudentSummarySchema]:
+        """
+        The logic of getting scores summary of all students.
+        :param transaction: Database transaction.
+        :param pagination: Pagination params.
+        :return: List of Pydantic models representing the students summary.
+        """
+        async with transaction:
+            total = await transaction.students_repo.count()
             paginator = Paginator(
-                pages=students,
+                total=total,
                 params=pagination,
             )
-            return paginator.get_response()
+            summary = await transaction.students_repo.find_summary(
+                offset=paginator.offset,
+                limit=paginator.limit,
+            )
+            return paginator.get_response(summary)
+
+    @staticmethod
+    async def get_student_summary(
+        transaction: BaseManager,
+        student_id: int,
+    ) -> StudentSummarySchema:
+        """
+        The logic of getting scores summary of a student by ID.
+        :param transaction: Database transaction.
+        :param student_id: Student ID.
+        :return: Pydantic model representing the student summary.
+        """
+        async with transaction:
+            summary = await transaction.students_repo.find_summary(
+                id=student_id,
+            )
+            if not summary:
+                raise StudentNotFoundException
+            return summary[0]
+
+    @staticmethod
+    async def get_students_by_ids(
+        transaction: BaseManager,
+        ids: list[int],
+    ) -> BaseBatchResponse[StudentSchema]:
+        """
+        The logic of getting students by IDs.
+        :param transaction: Database transaction.
+        :param ids: Student IDs.
+        :return: Pydantic models representing the students by ID
+        and the missing IDs.
+        """
+        async with transaction:
+            students = await transaction.students_repo.find_many(ids)
+            return get_batch_response(ids, students)
 
     @staticmethod
+    @single_flight.coalesce
     async def get_student(
         transaction: BaseManager,
         student_id: int,
@@ -55,6 +199,69 @@ class StudentsService:
             except NoResultFound:
                 raise StudentNotFoundException
 
+    @staticmethod
+    async def get_ranked_student(
+        transaction: BaseManager,
+        student_id: int,
+    ) -> RankedStudentSchema:
+        """
+        The logic of getting a student by ID
+        with the rank within the class.
+        :param transaction: Database transaction.
+        :param student_id: Student ID.
+        :return: Pydantic model representing the ranked student.
+        """
+        async with transaction:
+            try:
+                student = await transaction.students_repo.find_one(
+                    id=student_id,
+                )
+            except NoResultFound:
+                raise StudentNotFoundException
+            rank = await transaction.students_repo.find_rank(student_id)
+            return RankedStudentSchema(
+                **student.model_dump(),
+                **rank.model_dump(),
+            )
+
+    @staticmethod
+    async def get_leaderboard(
+        transaction: BaseManager,
+        class_name: ClassNamesEnum,
+        limit: int,
+    ) -> list[LeaderboardEntrySchema]:
+        """
+        The logic of getting the best students of a class.
+        :param transaction: Database transaction.
+        :param class_name: Class name.
+        :param limit: Maximum quantity of students.
+        :return: List of Pydantic models representing the leaderboard.
+        """
+        async with transaction:
+            return await transaction.students_repo.find_leaderboard(
+                class_name,
+                limit,
+            )
+
+    @staticmethod
+    async def search_students(
+        transaction: BaseManager,
+        query: str,
+        limit: int,
+    ) -> list[FoundStudentSchema]:
+        """
+        The logic of searching for students by name.
+        :param transaction: Database transaction.
+        :param query: Part of the name.
+        :param limit: Maximum quantity of students.
+        :return: List of Pydantic models representing the found students.
+        """
+        async with transaction:
+            return await transaction.students_repo.search(
+                query,
+                limit,
+            )
+
     @staticmethod
     async def add_student(
         transaction: BaseManager,
@@ -74,6 +281,31 @@ class StudentsService:
             await transaction.commit()
             return StudentIdSchema(student_id=student_id)
 
+    @staticmethod
+    async def import_students(
+        transaction: BaseManager,
+        students_data: list[ImportStudentSchema],
+    ) -> ImportedStudentsSchema:
+        """
+        The logic of creating students in one transaction.
+        :param transaction: Database transaction.
+        :param students_data: Pydantic models representing students data
+        with client-supplied keys.
+        :return: Pydantic model representing the mapping
+        from the keys to the created students IDs.
+        """
+        keys = [student.key for student in students_data]
+        if len(set(keys)) != len(keys):
+            raise DuplicateImportKeyException
+        async with transaction:
+            students_ids = await transaction.students_repo.add_many(
+                [student.model_dump(exclude={"key"}) for student in students_data],
+            )
+            await transaction.commit()
+        return ImportedStudentsSchema(
+            students_ids=dict(zip(keys, students_ids)),
+        )
+
     @staticmethod
     async def update_student(
         transaction: BaseManager,
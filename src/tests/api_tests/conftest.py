@@ -1,5 +1,21 @@
 import pytest
-from httpx import AsyncClient
+from httpx import (
+    ASGITransport,
+    AsyncClient,
+)
+
+from src.api.dependencies import (
+    read_only_transaction_manager,
+    transaction_manager,
+)
+from src.config.config import settings
+from src.db.db import async_engine
+from src.db.replicas import replica_router
+from src.main import app
+from src.utils.cache import LRUCache
+from src.utils.memory import memory_storage
+from src.utils.repository import BaseRepository
+from src.utils.transaction import InMemoryManager
 
 
 @pytest.fixture(scope="function")
@@ -10,3 +26,66 @@ async def ac():
 
     async with AsyncClient(base_url="http://localhost:8080") as ac:
         yield ac
+
+
+@pytest.fixture(scope="function")
+async def database():
+    """
+    Database engines of the application used in the test process.
+    """
+
+    # Connections of the pools belong to the event loop that opened them.
+    engines = [async_engine, *replica_router.engines]
+    for engine in engines:
+        await engine.dispose(close=False)
+    yield
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+async def app_ac(database):
+    """
+    Async client calling the application in the test process,
+    so that its database traffic can be observed.
+    """
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as app_ac:
+        yield app_ac
+
+
+@pytest.fixture(scope="function")
+async def memory_ac():
+    """
+    Async client calling the application in the test process
+    with the in-memory database instead of PostgreSQL.
+    """
+
+    memory_storage.clear()
+    app.dependency_overrides[transaction_manager] = InMemoryManager
+    app.dependency_overrides[read_only_transaction_manager] = InMemoryManager
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as memory_ac:
+        yield memory_ac
+    app.dependency_overrides.clear()
+    memory_storage.clear()
+
+
+@pytest.fixture(scope="function")
+def repository_cache(monkeypatch):
+    """
+    Empty cache of the repositories of the application in the test process,
+    enabled whatever the settings are.
+    """
+
+    cache = LRUCache(
+        max_size=settings.cache.MAX_SIZE,
+        ttl=settings.cache.TTL,
+    )
+    monkeypatch.setattr(BaseRepository, "cache", cache)
+    return cache
@@ -1,5 +1,6 @@
 from fastapi import status
 
+from src.api.pagination import CursorPaginator
 from src.tests.conftest import (
     ScoresFactory,
     StudentsFactory,
@@ -12,11 +13,19 @@ SCORE: ScoresFactory = ScoresFactory.build()
 PAGINATION_VALIDATION_DATA = [
     (1, 10, status.HTTP_200_OK),
     (2, 1, status.HTTP_200_OK),
+    (100_000, 100, status.HTTP_404_NOT_FOUND),
     (1, 100_000, status.HTTP_422_UNPROCESSABLE_ENTITY),
     ("invalid_page", 1, status.HTTP_422_UNPROCESSABLE_ENTITY),
     (1, "invalid_size", status.HTTP_422_UNPROCESSABLE_ENTITY),
 ]
 
+CURSOR_PAGINATION_VALIDATION_DATA = [
+    (None, 10, status.HTTP_200_OK),
+    (CursorPaginator.encode(2), 1, status.HTTP_200_OK),
+    ("invalid_cursor", 10, status.HTTP_400_BAD_REQUEST),
+    (None, 100_000, status.HTTP_422_UNPROCESSABLE_ENTITY),
+]
+
 DELETE_VALIDATION_DATA = [
     (1, status.HTTP_204_NO_CONTENT),
     (10, status.HTTP_204_NO_CONTENT),
@@ -0,0 +1,185 @@
+from types import SimpleNamespace
+
+from fastapi import status
+from httpx import AsyncClient
+
+from src.tests.api_tests.v1_tests.conftest import BASE_API_URL
+from src.tests.api_tests.v1_tests.unit_tests.conftest import (
+    SCORE,
+    STUDENT,
+)
+from src.utils import cache as cache_module
+from src.utils.cache import (
+    MISSING,
+    LRUCache,
+)
+
+
+async def add_student(ac: AsyncClient) -> int:
+    """
+    Adding a new student.
+    :param ac: Async client for testing endpoints.
+    :return: ID of the created student.
+    """
+    response = await ac.post(
+        BASE_API_URL + "/students/add",
+        json={
+            "class_name": STUDENT.class_name.value,
+            "first_name": STUDENT.first_name,
+            "last_name": STUDENT.last_name,
+            "age": STUDENT.age,
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()["student_id"]
+
+
+def test_cache_ttl(monkeypatch):
+    """
+    Testing the expiry of the cache entries after the TTL.
+    :param monkeypatch: Pytest monkeypatch.
+    """
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(
+        cache_module,
+        "time",
+        SimpleNamespace(monotonic=lambda: clock.now),
+    )
+    cache = LRUCache(max_size=10, ttl=30)
+    cache.set("key", "value")
+
+    clock.now += 30
+    assert cache.get("key") == "value"
+    clock.now += 1
+    assert cache.get("key") is MISSING
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_eviction():
+    """
+    Testing the eviction of the least recently used entries
+    above the maximum size.
+    """
+    cache = LRUCache(max_size=2, ttl=30)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    assert cache.get("first") == 1
+    cache.set("third", 3)
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("second") is MISSING
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+
+def test_cache_invalidate():
+    """
+    Testing the deletion of an entry and the invalidation of a namespace.
+    """
+    cache = LRUCache(max_size=10, ttl=30)
+    cache.set("key", "value")
+    cache.delete("key")
+    assert cache.get("key") is MISSING
+
+    generation = cache.generation("students")
+    assert not cache.invalidated_within("students", 60)
+    cache.invalidate("students")
+    assert cache.generation("students") == generation + 1
+    assert cache.generation("scores") == 0
+    assert cache.invalidated_within("students", 60)
+
+
+async def test_cache_add_student(
+    app_ac: AsyncClient,
+    repository_cache: LRUCache,
+):
+    """
+    Testing that adding a student drops the cached lists.
+    :param app_ac: Async client calling the application in process.
+    :param repository_cache: Cache of the repositories.
+    """
+    url = BASE_API_URL + "/students/all?page=1&size=1"
+    total = (await app_ac.get(url)).json()["total"]
+    assert (await app_ac.get(url)).json()["total"] == total
+    assert repository_cache.hits > 0
+
+    await add_student(app_ac)
+    assert (await app_ac.get(url)).json()["total"] == total + 1
+
+
+async def test_cache_edit_student(
+    app_ac: AsyncClient,
+    repository_cache: LRUCache,
+):
+    """
+    Testing that updating a student drops the cached student.
+    :param app_ac: Async client calling the application in process.
+    :param repository_cache: Cache of the repositories.
+    """
+    student_id = await add_student(app_ac)
+    url = BASE_API_URL + f"/students/{student_id}"
+    await app_ac.get(url)
+    hits = repository_cache.hits
+    await app_ac.get(url)
+    assert repository_cache.hits > hits
+
+    response = await app_ac.patch(url, json={"first_name": "Updated"})
+    assert response.status_code == status.HTTP_200_OK
+    response = await app_ac.get(url)
+    assert response.json()["first_name"] == "Updated"
+
+
+async def test_cache_delete_student(
+    app_ac: AsyncClient,
+    repository_cache: LRUCache,
+):
+    """
+    Testing that deleting a student drops the cached student.
+    :param app_ac: Async client calling the application in process.
+    :param repository_cache: Cache of the repositories.
+    """
+    student_id = await add_student(app_ac)
+    url = BASE_API_URL + f"/students/{student_id}"
+    assert (await app_ac.get(url)).status_code == status.HTTP_200_OK
+
+    response = await app_ac.delete(url)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert (await app_ac.get(url)).status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_cache_edit_score(
+    app_ac: AsyncClient,
+    repository_cache: LRUCache,
+):
+    """
+    Testing that updating a score drops the cached student,
+    whose scores summary and version have changed.
+    :param app_ac: Async client calling the application in process.
+    :param repository_cache: Cache of the repositories.
+    """
+    student_id = await add_student(app_ac)
+    response = await app_ac.post(
+        BASE_API_URL + "/scores/add",
+        json={
+            "score": 2,
+            "date_of_receipt": SCORE.date_of_receipt.isoformat(),
+            "student_id": student_id,
+        },
+    )
+    score_id = response.json()["score_id"]
+    url = BASE_API_URL + f"/students/{student_id}"
+    etag = (await app_ac.get(url)).headers["etag"]
+    hits = repository_cache.hits
+    assert (await app_ac.get(url)).headers["etag"] == etag
+    assert repository_cache.hits > hits
+
+    response = await app_ac.patch(
+        BASE_API_URL + f"/scores/{score_id}",
+        json={"score": 5},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = await app_ac.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
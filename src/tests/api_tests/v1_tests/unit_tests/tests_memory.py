@@ -0,0 +1,96 @@
+from datetime import date
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.tests.api_tests.v1_tests.conftest import BASE_API_URL
+from src.tests.api_tests.v1_tests.unit_tests.conftest import STUDENT
+from src.utils.transaction import InMemoryManager
+
+
+async def add_student(memory_ac: AsyncClient) -> int:
+    """
+    Adding a student to the in-memory database.
+    :param memory_ac: Async client with the in-memory database.
+    :return: Student ID.
+    """
+    response = await memory_ac.post(
+        BASE_API_URL + "/students/add",
+        json={
+            "class_name": STUDENT.class_name.value,
+            "first_name": STUDENT.first_name,
+            "last_name": STUDENT.last_name,
+            "age": STUDENT.age,
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()["student_id"]
+
+
+@pytest.mark.parametrize(
+    "scores, count, average",
+    [
+        ([], 0, None),
+        ([5], 1, 5),
+        ([2, 4, 5, 5], 4, 4),
+    ],
+)
+async def test_memory_scores_summary(
+    scores: list[int],
+    count: int,
+    average: float | None,
+    memory_ac: AsyncClient,
+):
+    """
+    Testing the scores summary maintained by the in-memory repositories.
+    :param scores: Scores of the student.
+    :param count: Expected quantity of scores.
+    :param average: Expected average score.
+    :param memory_ac: Async client with the in-memory database.
+    """
+    student_id = await add_student(memory_ac)
+    for score in scores:
+        response = await memory_ac.post(
+            BASE_API_URL + "/scores/add",
+            json={
+                "score": score,
+                "date_of_receipt": "2024-01-10",
+                "student_id": student_id,
+            },
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    response = await memory_ac.get(
+        BASE_API_URL + f"/students/{student_id}/summary",
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["score_count"] == count
+    assert response.json()["average_score"] == average
+
+    response = await memory_ac.get(BASE_API_URL + f"/students/{student_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["score"] for item in response.json()["scores"]] == scores
+
+
+async def test_memory_rollback(memory_ac: AsyncClient):
+    """
+    Testing that the in-memory changes not committed are undone.
+    :param memory_ac: Async client with the in-memory database.
+    """
+    student_id = await add_student(memory_ac)
+    async with InMemoryManager() as transaction:
+        await transaction.scores_repo.add_one(
+            {
+                "score": 5,
+                "date_of_receipt": date(2024, 1, 10),
+                "student_id": student_id,
+            }
+        )
+        await transaction.students_repo.delete_one(student_id)
+
+    response = await memory_ac.get(
+        BASE_API_URL + f"/students/{student_id}/summary",
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["score_count"] == 0
@@ -0,0 +1,163 @@
+import asyncio
+import time
+
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.middlewares import PRIMARY_PIN_COOKIE
+from src.config.config import settings
+from src.db.pool import MeasuredQueuePool
+from src.tests.api_tests.v1_tests.conftest import BASE_API_URL
+from src.tests.api_tests.v1_tests.unit_tests.conftest import STUDENT
+from src.utils.instrumentation import (
+    RequestStats,
+    request_stats,
+)
+
+
+async def test_get_cache_stats(ac: AsyncClient):
+    """
+    Testing the getting the cache stats.
+    Repeated reads of a student must not decrease the hits.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(BASE_API_URL + "/monitoring/cache")
+    assert response.status_code == status.HTTP_200_OK
+    hits = response.json()["hits"]
+    for _ in range(2):
+        await ac.get(BASE_API_URL + "/students/3")
+    response = await ac.get(BASE_API_URL + "/monitoring/cache")
+    response_data = response.json()
+    assert "misses" in response_data
+    assert "evictions" in response_data
+    assert "hit_ratio" in response_data
+    if response_data["enabled"]:
+        assert response_data["hits"] > hits
+
+
+async def test_get_single_flight_stats(ac: AsyncClient):
+    """
+    Testing the getting the read coalescing stats.
+    Concurrent identical reads must be executed or coalesced.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(BASE_API_URL + "/monitoring/single-flight")
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    calls = response_data["executed"] + response_data["coalesced"]
+    responses = await asyncio.gather(
+        *(ac.get(BASE_API_URL + "/students/3") for _ in range(10))
+    )
+    assert all(response.status_code == status.HTTP_200_OK for response in responses)
+    response = await ac.get(BASE_API_URL + "/monitoring/single-flight")
+    response_data = response.json()
+    assert "in_flight" in response_data
+    assert "coalesced_ratio" in response_data
+    assert response_data["executed"] + response_data["coalesced"] > calls
+
+
+async def test_writer_reads_not_coalesced(memory_ac: AsyncClient):
+    """
+    Testing that the reads of a client after its write
+    do not go through the read coalescing, with no replicas.
+    :param memory_ac: Async client with the in-memory database.
+    """
+    response = await memory_ac.post(
+        BASE_API_URL + "/students/add",
+        json={
+            "class_name": STUDENT.class_name.value,
+            "first_name": STUDENT.first_name,
+            "last_name": STUDENT.last_name,
+            "age": STUDENT.age,
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert PRIMARY_PIN_COOKIE in response.cookies
+    student_id = response.json()["student_id"]
+
+    response = await memory_ac.get(BASE_API_URL + "/monitoring/single-flight")
+    calls = response.json()
+    responses = await asyncio.gather(
+        *(memory_ac.get(BASE_API_URL + f"/students/{student_id}") for _ in range(5))
+    )
+    assert all(response.status_code == status.HTTP_200_OK for response in responses)
+    response = await memory_ac.get(BASE_API_URL + "/monitoring/single-flight")
+    response_data = response.json()
+    assert response_data["executed"] == calls["executed"]
+    assert response_data["coalesced"] == calls["coalesced"]
+
+
+async def test_get_metrics(ac: AsyncClient):
+    """
+    Testing the getting the metrics in the Prometheus text format.
+    A served request must be counted under its route template.
+    :param ac: Async client for testing endpoints.
+    """
+    await ac.get(BASE_API_URL + "/students/3")
+    response = await ac.get("/api/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_request_duration_seconds_bucket" in response.text
+    assert 'route="/v1/students/{student_id}"' in response.text
+    assert "db_pool_checkouts_total" in response.text
+    assert "repository_query_duration_seconds" in response.text
+
+
+async def test_server_timing(ac: AsyncClient):
+    """
+    Testing the Server-Timing header of the instrumented requests.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(BASE_API_URL + "/students/all")
+    assert response.status_code == status.HTTP_200_OK
+    server_timing = response.headers["server-timing"]
+    assert "db;dur=" in server_timing
+    assert "queries" in server_timing
+    assert "serialize;dur=" in server_timing
+
+
+async def checkout_wait(engine, hold: float = 0.0) -> float:
+    """
+    Checking out a connection of an engine.
+    :param engine: Engine with a measured pool.
+    :param hold: Seconds to hold the connection.
+    :return: Pool wait of the checkout in seconds.
+    """
+    stats = RequestStats()
+    token = request_stats.set(stats)
+    try:
+        async with engine.connect():
+            await asyncio.sleep(hold)
+    finally:
+        request_stats.reset(token)
+    return stats.pool_wait_time
+
+
+async def test_pool_wait():
+    """
+    Testing that the pool wait is the time in the queue
+    for a free connection, not the opening of a new connection.
+    """
+    engine = create_async_engine(
+        url=str(settings.db.URL),
+        pool_size=1,
+        max_overflow=0,
+        poolclass=MeasuredQueuePool,
+        pool_logging_name="test",
+    )
+    event.listen(
+        engine.sync_engine,
+        "connect",
+        lambda *args: time.sleep(0.2),
+    )
+    try:
+        assert await checkout_wait(engine) < 0.1
+        holder = asyncio.create_task(checkout_wait(engine, hold=0.2))
+        await asyncio.sleep(0.05)
+        waiter_wait = await checkout_wait(engine)
+        assert await holder < 0.1
+    finally:
+        await engine.dispose()
+    assert waiter_wait > 0.1
@@ -0,0 +1,83 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.db.db import async_engine
+from src.db.replicas import replica_router
+from src.tests.api_tests.v1_tests.conftest import BASE_API_URL
+from src.tests.api_tests.v1_tests.unit_tests.conftest import STUDENT
+from src.tests.utils import RoundTripCounter
+from src.utils.repository import BaseRepository
+
+# Reads may be routed to the replicas, so their traffic is counted too.
+ENGINES = [engine.sync_engine for engine in (async_engine, *replica_router.engines)]
+
+
+@pytest.mark.parametrize(
+    "url, max_queries",
+    [
+        ("/students/1", 1),
+        ("/students/all?page=1&size=10", 2),
+        ("/students/1/summary", 1),
+        ("/scores/1", 1),
+        ("/scores/all?page=1&size=10", 2),
+    ],
+)
+async def test_read_round_trips(
+    url: str,
+    max_queries: int,
+    app_ac: AsyncClient,
+    monkeypatch,
+):
+    """
+    Testing the round trips of the read endpoints.
+    Reads must not send BEGIN and ROLLBACK.
+    :param url: Endpoint URL.
+    :param max_queries: Maximum quantity of queries.
+    :param app_ac: Async client calling the application in process.
+    :param monkeypatch: Pytest monkeypatch.
+    """
+    # Reads served from the cache would send nothing.
+    monkeypatch.setattr(BaseRepository, "cache", None)
+    with RoundTripCounter(*ENGINES) as counter:
+        response = await app_ac.get(BASE_API_URL + url)
+    assert response.status_code == status.HTTP_200_OK
+    assert counter.transactions == 0
+    assert 0 < counter.queries <= max_queries
+
+
+async def test_write_round_trips(app_ac: AsyncClient):
+    """
+    Testing the round trips of a write endpoint.
+    A committed transaction must not be rolled back afterwards.
+    :param app_ac: Async client calling the application in process.
+    """
+    with RoundTripCounter(*ENGINES) as counter:
+        response = await app_ac.post(
+            BASE_API_URL + "/students/add",
+            json={
+                "class_name": STUDENT.class_name.value,
+                "first_name": STUDENT.first_name,
+                "last_name": STUDENT.last_name,
+                "age": STUDENT.age,
+            },
+        )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert counter.queries == 1
+    assert counter.transactions == 2
+
+
+async def test_export_round_trips(app_ac: AsyncClient):
+    """
+    Testing the round trips of the export.
+    The cursor of the stream needs a transaction, the driver must send
+    BEGIN and its end although the read session is in autocommit mode.
+    :param app_ac: Async client calling the application in process.
+    """
+    with RoundTripCounter(*ENGINES) as counter:
+        response = await app_ac.get(
+            BASE_API_URL + "/scores/export",
+            params={"format": "ndjson"},
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert counter.transactions == 2
@@ -2,15 +2,30 @@ from datetime import date
 from typing import Any
 
 import pytest
+from asyncpg.exceptions import (
+    CheckViolationError,
+    ForeignKeyViolationError,
+)
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy.exc import IntegrityError
 
+from src.main import app
+from src.repositories.scores import ScoresRepository
 from src.tests.api_tests.v1_tests.conftest import BASE_API_URL
 from src.tests.api_tests.v1_tests.unit_tests.conftest import (
+    CURSOR_PAGINATION_VALIDATION_DATA,
     DELETE_VALIDATION_DATA,
     PAGINATION_VALIDATION_DATA,
     SCORE,
+    STUDENT,
+)
+from src.tests.utils import factory_to_dict
+from src.utils.repository import (
+    COPY_THRESHOLD,
+    is_foreign_key_violation,
 )
+from src.utils.transaction import TransactionManager
 
 
 @pytest.mark.parametrize(
@@ -72,6 +87,131 @@ async def test_add_score(
         assert "score_id" in response_data
 
 
+async def test_add_scores_in_bulk(ac: AsyncClient):
+    """
+    Testing the adding of scores in bulk.
+    :param ac: Async client for testing endpoints.
+    """
+    valid_score = {
+        "date_of_receipt": SCORE.date_of_receipt.isoformat(),
+        "score": SCORE.score,
+        "student_id": 7,
+    }
+    response = await ac.post(
+        BASE_API_URL + "/scores/bulk",
+        json=[
+            valid_score,
+            {**valid_score, "score": 100},
+            {**valid_score, "date_of_receipt": date(9999, 12, 31).isoformat()},
+            {**valid_score, "student_id": 100_000_000},
+            valid_score,
+        ],
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = response.json()
+    assert [item["index"] for item in response_data["created"]] == [0, 4]
+    assert [error["index"] for error in response_data["errors"]] == [1, 2, 3]
+
+
+def test_add_scores_in_bulk_schema():
+    """
+    Testing that the documented bulk item is the score to add.
+    """
+    request_body = app.openapi()["paths"]["/v1/scores/bulk"]["post"]["requestBody"]
+    schema = request_body["content"]["application/json"]["schema"]
+    assert schema["type"] == "array"
+    assert set(schema["items"]["required"]) == {
+        "student_id",
+        "score",
+        "date_of_receipt",
+    }
+
+
+@pytest.mark.parametrize(
+    "error, status_code",
+    [
+        (ForeignKeyViolationError("missing student"), status.HTTP_400_BAD_REQUEST),
+        (CheckViolationError("check_date"), status.HTTP_409_CONFLICT),
+    ],
+)
+async def test_add_scores_in_bulk_integrity_error(
+    error: Exception,
+    status_code: int,
+    app_ac: AsyncClient,
+    monkeypatch,
+):
+    """
+    Testing the response to a constraint violated on insert.
+    Only a foreign key violation means a wrong student.
+    :param error: Driver error.
+    :param status_code: API response code.
+    :param app_ac: Async client calling the application in process.
+    :param monkeypatch: Pytest monkeypatch.
+    """
+
+    async def add_many(self, data: list[dict]) -> list[int]:
+        raise IntegrityError("INSERT", None, error)
+
+    monkeypatch.setattr(ScoresRepository, "add_many", add_many)
+    response = await app_ac.post(
+        BASE_API_URL + "/scores/bulk",
+        json=[
+            {
+                "date_of_receipt": SCORE.date_of_receipt.isoformat(),
+                "score": SCORE.score,
+                "student_id": 7,
+            },
+        ],
+    )
+    assert response.status_code == status_code
+
+
+@pytest.mark.parametrize(
+    "values, foreign_key",
+    [
+        ({"student_id": 100_000_000}, True),
+        ({"score": 100}, False),
+    ],
+)
+async def test_add_many_copy_integrity_error(
+    values: dict[str, Any],
+    foreign_key: bool,
+    database,
+):
+    """
+    Testing that a constraint violated by COPY raises an integrity error
+    telling a foreign key violation from the others.
+    :param values: Values of the invalid score.
+    :param foreign_key: Whether the foreign key is violated.
+    :param database: Database engines used in the test process.
+    """
+    async with TransactionManager() as transaction:
+        student_id = await transaction.students_repo.add_one(
+            factory_to_dict(STUDENT),
+        )
+        score = {
+            "date_of_receipt": SCORE.date_of_receipt,
+            "score": SCORE.score,
+            "student_id": student_id,
+        }
+        scores = [score] * (COPY_THRESHOLD - 1) + [{**score, **values}]
+        with pytest.raises(IntegrityError) as exc_info:
+            await transaction.scores_repo.add_many(scores)
+    assert is_foreign_key_violation(exc_info.value) == foreign_key
+
+
+async def test_add_scores_in_bulk_validation(ac: AsyncClient):
+    """
+    Testing the validation of the bulk scores payload.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.post(
+        BASE_API_URL + "/scores/bulk",
+        json={"score": SCORE.score},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.parametrize(
     "score_id, status_code",
     [
@@ -104,6 +244,85 @@ async def test_get_score_by_id(
         assert "student_id" in response_data
 
 
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/scores/4",
+        "/scores/all",
+    ],
+)
+async def test_get_scores_not_modified(
+    path: str,
+    ac: AsyncClient,
+):
+    """
+    Testing the conditional getting of scores.
+    :param path: Endpoint path.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(BASE_API_URL + path)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+
+    response = await ac.get(
+        BASE_API_URL + path,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+    await ac.patch(
+        BASE_API_URL + "/scores/4",
+        json={"score": SCORE.score},
+    )
+    response = await ac.get(
+        BASE_API_URL + path,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.parametrize(
+    "ids, missing_ids, status_code",
+    [
+        ("2,3,4", [], status.HTTP_200_OK),
+        ("2,100000,2", [100_000], status.HTTP_200_OK),
+        ("1,invalid_id", [], status.HTTP_422_UNPROCESSABLE_ENTITY),
+        (
+            ",".join(map(str, range(1, 1000))),
+            [],
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ),
+    ],
+)
+async def test_get_scores_by_ids(
+    ids: str,
+    missing_ids: list[int],
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting scores by IDs.
+    :param ids: Comma separated IDs.
+    :param missing_ids: IDs expected to be missing.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + "/scores",
+        params={"ids": ids},
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert response_data["missing_ids"] == missing_ids
+        for obj_id, item in response_data["items"].items():
+            assert item["id"] == int(obj_id)
+            assert int(obj_id) not in missing_ids
+
+
 @pytest.mark.parametrize(
     "page, size, status_code",
     PAGINATION_VALIDATION_DATA,
@@ -136,6 +355,244 @@ async def test_get_all_scores_with_pagination(
         assert "page" in response_data
         assert "size" in response_data
         assert "pages" in response_data
+        assert len(response_data["items"]) <= size
+
+
+@pytest.mark.parametrize(
+    "params, status_code",
+    [
+        ({"student_id": 1}, status.HTTP_200_OK),
+        ({"score": SCORE.score}, status.HTTP_200_OK),
+        (
+            {
+                "student_id": 2,
+                "date_from": SCORE.date_of_receipt.isoformat(),
+                "date_to": date.today().isoformat(),
+            },
+            status.HTTP_200_OK,
+        ),
+        ({"student_id": 0}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        ({"score": 6}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        ({"date_from": "invalid_date"}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_get_all_scores_with_filters(
+    params: dict[str, Any],
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting all scores with filters.
+    Every returned score must match the filters.
+    :param params: Filter params.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + "/scores/all",
+        params=params,
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        for item in response.json()["items"]:
+            if "student_id" in params:
+                assert item["student_id"] == params["student_id"]
+            if "score" in params:
+                assert item["score"] == params["score"]
+            if "date_from" in params:
+                assert item["date_of_receipt"] >= params["date_from"]
+            if "date_to" in params:
+                assert item["date_of_receipt"] <= params["date_to"]
+
+
+@pytest.mark.parametrize(
+    "params, status_code",
+    [
+        ({"student_id": 1}, status.HTTP_200_OK),
+        ({"student_id": 1, "bucket": "month"}, status.HTTP_200_OK),
+        (
+            {
+                "class_name": "Math",
+                "bucket": "week",
+                "from": SCORE.date_of_receipt.isoformat(),
+                "to": date.today().isoformat(),
+            },
+            status.HTTP_200_OK,
+        ),
+        ({}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        (
+            {"student_id": 1, "class_name": "Math"},
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ),
+        ({"student_id": 1, "bucket": "day"}, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        ({"student_id": 100_000_000}, status.HTTP_404_NOT_FOUND),
+    ],
+)
+async def test_get_scores_timeseries(
+    params: dict[str, Any],
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting the average score trend.
+    Buckets must be ordered, start on their bucket boundary
+    and fall within the requested dates.
+    :param params: Timeseries params.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + "/scores/timeseries",
+        params=params,
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert response_data["bucket"] == params.get("bucket", "week")
+        starts = [start for start, _, _ in response_data["buckets"]]
+        assert starts == sorted(set(starts))
+        for start, average, count in response_data["buckets"]:
+            start = date.fromisoformat(start)
+            if response_data["bucket"] == "week":
+                assert start.weekday() == 0
+            else:
+                assert start.day == 1
+            assert 2 <= average <= 5
+            assert count > 0
+            if "to" in params:
+                assert start.isoformat() <= params["to"]
+
+
+@pytest.mark.parametrize(
+    "params, buckets",
+    [
+        (
+            {"bucket": "week"},
+            [["2024-01-08", 3.5, 2], ["2024-01-15", 3.0, 1], ["2024-02-05", 4.0, 1]],
+        ),
+        (
+            {"bucket": "month"},
+            [["2024-01-01", 10 / 3, 3], ["2024-02-01", 4.0, 1]],
+        ),
+        (
+            {"bucket": "month", "from": "2024-01-11", "to": "2024-01-31"},
+            [["2024-01-01", 2.5, 2]],
+        ),
+    ],
+)
+async def test_get_student_scores_timeseries(
+    params: dict[str, Any],
+    buckets: list[list],
+    ac: AsyncClient,
+):
+    """
+    Testing the buckets of the average score trend of a new student.
+    :param params: Timeseries params without the student.
+    :param buckets: Expected buckets.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.post(
+        BASE_API_URL + "/students/add",
+        json={
+            "class_name": STUDENT.class_name.value,
+            "first_name": STUDENT.first_name,
+            "last_name": STUDENT.last_name,
+            "age": STUDENT.age,
+        },
+    )
+    student_id = response.json()["student_id"]
+    for score, date_of_receipt in (
+        (5, "2024-01-10"),
+        (2, "2024-01-12"),
+        (3, "2024-01-20"),
+        (4, "2024-02-05"),
+    ):
+        response = await ac.post(
+            BASE_API_URL + "/scores/add",
+            json={
+                "score": score,
+                "date_of_receipt": date_of_receipt,
+                "student_id": student_id,
+            },
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    response = await ac.get(
+        BASE_API_URL + "/scores/timeseries",
+        params={"student_id": student_id, **params},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert response_data["bucket"] == params["bucket"]
+    assert response_data["buckets"] == [
+        [start, pytest.approx(average), count] for start, average, count in buckets
+    ]
+
+
+@pytest.mark.parametrize(
+    "after, size, status_code",
+    CURSOR_PAGINATION_VALIDATION_DATA,
+)
+async def test_get_all_scores_by_cursor(
+    after: str | None,
+    size: int | Any,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting all scores with keyset pagination.
+    :param after: Cursor of the previous page.
+    :param size: Quantity of items per page.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    params = {"size": size}
+    if after is not None:
+        params["after"] = after
+    response = await ac.get(
+        BASE_API_URL + "/scores/all/cursor",
+        params=params,
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert "items" in response_data
+        assert "size" in response_data
+        assert "next_cursor" in response_data
+        assert len(response_data["items"]) <= size
+
+
+@pytest.mark.parametrize(
+    "export_format, content_type, status_code",
+    [
+        ("ndjson", "application/x-ndjson", status.HTTP_200_OK),
+        ("csv", "text/csv", status.HTTP_200_OK),
+        ("invalid_format", None, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_export_scores(
+    export_format: str,
+    content_type: str | None,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the exporting all scores.
+    :param export_format: Export format.
+    :param content_type: Expected content type.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + "/scores/export",
+        params={
+            "format": export_format,
+        },
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        assert response.headers["content-type"].startswith(content_type)
+        assert response.text
 
 
 @pytest.mark.parametrize(
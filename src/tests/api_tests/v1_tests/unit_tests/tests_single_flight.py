@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from src.utils.singleflight import SingleFlight
+
+
+class GatedService:
+    """
+    Service with a read held until the gate opens, counting its calls.
+    """
+
+    def __init__(self, error: Exception | None = None):
+        """
+        Initialization the service.
+        :param error: Error to raise instead of returning.
+        """
+        self.error = error
+        self.calls = 0
+        self.gate = asyncio.Event()
+
+    async def read(self, transaction, student_id: int, **kwargs) -> dict:
+        self.calls += 1
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return {"student_id": student_id, **kwargs}
+
+
+async def start(read, quantity: int, *args, **kwargs) -> list[asyncio.Task]:
+    """
+    Starting concurrent calls and letting them reach the gate.
+    :param read: Coalesced service service.
+    :param quantity: Quantity of the calls.
+    :return: Tasks of the calls.
+    """
+    tasks = [
+        asyncio.create_task(read(f"transaction_{index}", *args, **kwargs))
+        for index in range(quantity)
+    ]
+    await asyncio.sleep(0)
+    return tasks
+
+
+async def test_coalesce_shares_result():
+    """
+    Testing that identical concurrent calls run the read once
+    and all get the same result.
+    """
+    group = SingleFlight()
+    service = GatedService()
+    read = group.coalesce(service.read)
+    tasks = await start(read, 5, 1, detailed=True)
+    service.gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert service.calls == 1
+    assert all(result is results[0] for result in results)
+    assert results[0] == {"student_id": 1, "detailed": True}
+    assert (group.executed, group.coalesced) == (1, 4)
+    assert len(group) == 0
+
+
+async def test_coalesce_distinct_arguments():
+    """
+    Testing that calls with different arguments are not coalesced.
+    """
+    group = SingleFlight()
+    service = GatedService()
+    read = group.coalesce(service.read)
+    tasks = [
+        *await start(read, 1, 1),
+        *await start(read, 1, 2),
+        *await start(read, 1, 1, detailed=True),
+    ]
+    service.gate.set()
+    await asyncio.gather(*tasks)
+
+    assert service.calls == 3
+    assert (group.executed, group.coalesced) == (3, 0)
+
+
+async def test_coalesce_shares_exception():
+    """
+    Testing that an exception of the call is raised in every caller.
+    """
+    group = SingleFlight()
+    error = ValueError("read failed")
+    service = GatedService(error=error)
+    read = group.coalesce(service.read)
+    tasks = await start(read, 3, 1)
+    service.gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert service.calls == 1
+    assert results == [error] * 3
+    assert len(group) == 0
+
+
+async def test_coalesce_cancelled_caller():
+    """
+    Testing that a cancelled caller does not cancel
+    the call for the other callers.
+    """
+    group = SingleFlight()
+    service = GatedService()
+    read = group.coalesce(service.read)
+    cancelled, *tasks = await start(read, 3, 1)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    service.gate.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert await asyncio.gather(*tasks) == [{"student_id": 1}] * 2
+    assert service.calls == 1
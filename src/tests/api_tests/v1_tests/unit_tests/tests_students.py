@@ -4,8 +4,11 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from src.db.db import async_engine
+from src.seed.backfill import backfill_summary
 from src.tests.api_tests.v1_tests.conftest import BASE_API_URL
 from src.tests.api_tests.v1_tests.unit_tests.conftest import (
+    CURSOR_PAGINATION_VALIDATION_DATA,
     DELETE_VALIDATION_DATA,
     PAGINATION_VALIDATION_DATA,
     STUDENT,
@@ -85,6 +88,46 @@ async def test_add_student(
         assert "student_id" in response_data
 
 
+@pytest.mark.parametrize(
+    "keys, age, status_code",
+    [
+        (["first", "second"], STUDENT.age, status.HTTP_201_CREATED),
+        (["same", "same"], STUDENT.age, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        (["first", "second"], 1, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_import_students(
+    keys: list[str],
+    age: int,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the adding students in bulk.
+    :param keys: Client-supplied keys of the students.
+    :param age: Students' age.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.post(
+        BASE_API_URL + "/students/bulk",
+        json=[
+            {
+                "key": key,
+                "class_name": STUDENT.class_name.value,
+                "first_name": STUDENT.first_name,
+                "last_name": STUDENT.last_name,
+                "age": age,
+            }
+            for key in keys
+        ],
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_201_CREATED:
+        response_data = response.json()
+        assert sorted(response_data["students_ids"]) == sorted(keys)
+
+
 @pytest.mark.parametrize(
     "student_id, status_code",
     [
@@ -117,6 +160,86 @@ async def test_get_student_by_id(
         assert "last_name" in response_data
         assert "age" in response_data
         assert "scores" in response_data
+        assert "version" not in response_data
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/students/4",
+        "/students/all",
+    ],
+)
+async def test_get_students_not_modified(
+    path: str,
+    ac: AsyncClient,
+):
+    """
+    Testing the conditional getting of students.
+    :param path: Endpoint path.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(BASE_API_URL + path)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+
+    response = await ac.get(
+        BASE_API_URL + path,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+    await ac.patch(
+        BASE_API_URL + "/students/4",
+        json={"age": STUDENT.age},
+    )
+    response = await ac.get(
+        BASE_API_URL + path,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.parametrize(
+    "ids, missing_ids, status_code",
+    [
+        ("2,3,4", [], status.HTTP_200_OK),
+        ("2,100000,2", [100_000], status.HTTP_200_OK),
+        ("1,invalid_id", [], status.HTTP_422_UNPROCESSABLE_ENTITY),
+        (
+            ",".join(map(str, range(1, 1000))),
+            [],
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ),
+    ],
+)
+async def test_get_students_by_ids(
+    ids: str,
+    missing_ids: list[int],
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting students by IDs.
+    :param ids: Comma separated IDs.
+    :param missing_ids: IDs expected to be missing.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + "/students",
+        params={"ids": ids},
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert response_data["missing_ids"] == missing_ids
+        for obj_id, item in response_data["items"].items():
+            assert item["id"] == int(obj_id)
+            assert int(obj_id) not in missing_ids
 
 
 @pytest.mark.parametrize(
@@ -151,6 +274,255 @@ async def test_get_all_students_with_pagination(
         assert "page" in response_data
         assert "size" in response_data
         assert "pages" in response_data
+        assert len(response_data["items"]) <= size
+
+
+@pytest.mark.parametrize(
+    "after, size, status_code",
+    CURSOR_PAGINATION_VALIDATION_DATA,
+)
+async def test_get_all_students_by_cursor(
+    after: str | None,
+    size: int | Any,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting all students with keyset pagination.
+    :param after: Cursor of the previous page.
+    :param size: Quantity of items per page.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    params = {"size": size}
+    if after is not None:
+        params["after"] = after
+    response = await ac.get(
+        BASE_API_URL + "/students/all/cursor",
+        params=params,
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert "items" in response_data
+        assert "size" in response_data
+        assert "next_cursor" in response_data
+        assert len(response_data["items"]) <= size
+
+
+@pytest.mark.parametrize(
+    "class_name, limit, status_code",
+    [
+        (STUDENT.class_name.value, 3, status.HTTP_200_OK),
+        ("invalid_class_name", 3, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        (STUDENT.class_name.value, 100_000, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_get_leaderboard(
+    class_name: str,
+    limit: int | Any,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting the leaderboard of a class.
+    :param class_name: Class name.
+    :param limit: Quantity of students.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + "/students/leaderboard",
+        params={
+            "class_name": class_name,
+            "limit": limit,
+        },
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert len(response_data) <= limit
+        ranks = [entry["rank"] for entry in response_data]
+        assert ranks == sorted(ranks)
+        assert all(entry["class_name"] == class_name for entry in response_data)
+
+
+@pytest.mark.parametrize(
+    "q, limit, status_code",
+    [
+        (STUDENT.last_name[:3], 5, status.HTTP_200_OK),
+        (STUDENT.first_name.lower(), 5, status.HTTP_200_OK),
+        ("a", 5, status.HTTP_422_UNPROCESSABLE_ENTITY),
+        (STUDENT.last_name, 100_000, status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_search_students(
+    q: str,
+    limit: int | Any,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the search for students by name.
+    The found students must be ordered by similarity.
+    :param q: Part of the name.
+    :param limit: Quantity of students.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + "/students/search",
+        params={
+            "q": q,
+            "limit": limit,
+        },
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert len(response_data) <= limit
+        similarities = [entry["similarity"] for entry in response_data]
+        assert similarities == sorted(similarities, reverse=True)
+
+
+@pytest.mark.parametrize(
+    "student_id, status_code",
+    [
+        (2, status.HTTP_200_OK),
+        (100_000, status.HTTP_404_NOT_FOUND),
+        ("invalid_id", status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_get_ranked_student(
+    student_id: int | Any,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting a ranked student by ID.
+    :param student_id: Student ID.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + f"/students/{student_id}/ranked",
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert "scores" in response_data
+        assert "rank" in response_data
+        assert "percentile" in response_data
+
+
+@pytest.mark.parametrize(
+    "student_id, status_code",
+    [
+        (2, status.HTTP_200_OK),
+        (100_000, status.HTTP_404_NOT_FOUND),
+        ("invalid_id", status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_get_student_stats(
+    student_id: int | Any,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting scores stats of a student by ID.
+    :param student_id: Student ID.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + f"/students/{student_id}/stats",
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert response_data["student_id"] == student_id
+        assert "count" in response_data
+        assert "average" in response_data
+        assert "min" in response_data
+        assert "max" in response_data
+        assert "distribution" in response_data
+        assert "last_date_of_receipt" in response_data
+        assert "scores" not in response_data
+
+
+@pytest.mark.parametrize(
+    "student_id, status_code",
+    [
+        (2, status.HTTP_200_OK),
+        (100_000, status.HTTP_404_NOT_FOUND),
+        ("invalid_id", status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_get_student_summary(
+    student_id: int | Any,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting scores summary of a student by ID.
+    The summary must match the stats aggregated from the scores.
+    :param student_id: Student ID.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + f"/students/{student_id}/summary",
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        stats_response = await ac.get(
+            BASE_API_URL + f"/students/{student_id}/stats",
+        )
+        stats_data = stats_response.json()
+        assert response_data["score_count"] == stats_data["count"]
+        assert response_data["average_score"] == pytest.approx(stats_data["average"])
+        assert response_data["last_score_at"] == stats_data["last_date_of_receipt"]
+
+
+async def test_backfill_summary(database):
+    """
+    Testing the backfill of the scores summary.
+    The maintained summary must match the scores, so nothing is updated.
+    :param database: Database engines used in the test process.
+    """
+    assert await backfill_summary(async_engine) == 0
+
+
+@pytest.mark.parametrize(
+    "page, size, status_code",
+    PAGINATION_VALIDATION_DATA,
+)
+async def test_get_students_stats_with_pagination(
+    page: int | Any,
+    size: int | Any,
+    status_code: int,
+    ac: AsyncClient,
+):
+    """
+    Testing the getting scores stats of all students with pagination.
+    :param page: Current page.
+    :param size: Quantity of items per page.
+    :param status_code: API response code.
+    :param ac: Async client for testing endpoints.
+    """
+    response = await ac.get(
+        BASE_API_URL + "/students/stats",
+        params={
+            "page": page,
+            "size": size,
+        },
+    )
+    assert response.status_code == status_code
+    if status_code == status.HTTP_200_OK:
+        response_data = response.json()
+        assert "items" in response_data
+        assert len(response_data["items"]) <= size
 
 
 @pytest.mark.parametrize(
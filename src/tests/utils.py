@@ -1,5 +1,10 @@
 from factory import SubFactory
 from factory.alchemy import SQLAlchemyModelFactory
+from sqlalchemy import (
+    Connection,
+    Engine,
+    event,
+)
 
 
 def factory_to_dict(
@@ -13,6 +18,49 @@ def factory_to_dict(
     model_dict = {
         col.name: getattr(model_factory, col.name)
         for col in model_factory.__table__.columns
+        if getattr(model_factory, col.name) is not None
     }
     model_dict.pop("id", None)
     return model_dict
+
+
+class RoundTripCounter:
+    """
+    Counting the statements sent to the databases through engines.
+    Transaction control is counted apart by the state of the driver
+    connection, asyncpg sends no BEGIN, COMMIT and ROLLBACK
+    while it is in autocommit mode, whatever the options requested.
+    """
+
+    def __init__(self, *engines: Engine):
+        """
+        Initialization the counter.
+        :param engines: Synchronous engines of the application.
+        """
+        self.engines = engines
+        self.queries = 0
+        self.transactions = 0
+
+    def __enter__(self):
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._on_query)
+            for identifier in ("begin", "commit", "rollback"):
+                event.listen(engine, identifier, self._on_transaction)
+        return self
+
+    def __exit__(self, *args):
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._on_query)
+            for identifier in ("begin", "commit", "rollback"):
+                event.remove(engine, identifier, self._on_transaction)
+
+    @property
+    def round_trips(self) -> int:
+        return self.queries + self.transactions
+
+    def _on_query(self, *args) -> None:
+        self.queries += 1
+
+    def _on_transaction(self, connection: Connection) -> None:
+        if not connection.connection.dbapi_connection.autocommit:
+            self.transactions += 1
@@ -0,0 +1,125 @@
+import time
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
+from typing import (
+    Any,
+    Hashable,
+)
+
+from src.config.config import settings
+
+MISSING = object()
+
+
+class LRUCache:
+    """
+    In-process LRU cache with TTL and namespace invalidation.
+    Not shared between workers, the TTL bounds the staleness there.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Initialization the cache.
+        :param max_size: Maximum quantity of entries.
+        :param ttl: Time to live of an entry in seconds.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generations: defaultdict[str, int] = defaultdict(int)
+        self._invalidated_at: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Getting a value by key.
+        :param key: Key.
+        :return: Value or MISSING.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Setting a value by key, evicting the least recently used entries.
+        :param key: Key.
+        :param value: Value.
+        :return: None.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Deleting a value by key.
+        :param key: Key.
+        :return: None.
+        """
+        self._entries.pop(key, None)
+
+    def generation(self, namespace: str) -> int:
+        """
+        Getting the current generation of a namespace.
+        Keys built with a generation become unreachable
+        once the namespace is invalidated.
+        :param namespace: Namespace.
+        :return: Generation.
+        """
+        return self._generations[namespace]
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        Invalidating a namespace.
+        :param namespace: Namespace.
+        :return: None.
+        """
+        self._generations[namespace] += 1
+        self._invalidated_at[namespace] = time.monotonic()
+
+    def invalidated_within(self, namespace: str, seconds: float) -> bool:
+        """
+        Checking whether a namespace was invalidated recently.
+        :param namespace: Namespace.
+        :param seconds: Period in seconds.
+        :return: Whether the last invalidation is within the period.
+        """
+        invalidated_at = self._invalidated_at.get(namespace)
+        return (
+            invalidated_at is not None and time.monotonic() - invalidated_at < seconds
+        )
+
+    def clear(self) -> None:
+        """
+        Deleting all entries.
+        :return: None.
+        """
+        self._entries.clear()
+        self._generations.clear()
+        self._invalidated_at.clear()
+
+
+repository_cache = (
+    LRUCache(
+        max_size=settings.cache.MAX_SIZE,
+        ttl=settings.cache.TTL,
+    )
+    if settings.cache.ENABLED
+    else None
+)
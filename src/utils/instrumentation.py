@@ -0,0 +1,73 @@
+import logging
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import (
+    Engine,
+    event,
+)
+
+logger = logging.getLogger(__name__)
+
+QUERY_STARTED_AT = "request_query_started_at"
+
+
+class RequestStats:
+    """
+    Database, connection pool and serialization time of a request.
+    """
+
+    def __init__(self):
+        """
+        Initialization the stats.
+        """
+        self.queries = 0
+        self.db_time = 0.0
+        self.pool_wait_time = 0.0
+        self.serialization_time = 0.0
+
+    def server_timing(self) -> str:
+        """
+        Building the Server-Timing header value, durations in milliseconds.
+        :return: Header value.
+        """
+        return (
+            f'db;dur={self.db_time * 1000:.3f};desc="{self.queries} queries", '
+            f"pool;dur={self.pool_wait_time * 1000:.3f}, "
+            f"serialize;dur={self.serialization_time * 1000:.3f}"
+        )
+
+
+# Stats of the current request, None outside of the instrumented requests.
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats",
+    default=None,
+)
+
+
+def instrument_queries() -> None:
+    """
+    Attributing the queries of all engines to the current request.
+    :return: None.
+    """
+    event.listen(Engine, "before_cursor_execute", start_query_timer)
+    event.listen(Engine, "after_cursor_execute", count_query)
+
+
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    """
+    Remembering the start of a query of an instrumented request.
+    """
+    if request_stats.get() is not None:
+        conn.info[QUERY_STARTED_AT] = time.perf_counter()
+
+
+def count_query(conn, cursor, statement, parameters, context, executemany):
+    """
+    Adding a query and its duration to the stats of the request.
+    """
+    stats = request_stats.get()
+    started_at = conn.info.pop(QUERY_STARTED_AT, None)
+    if stats is not None and started_at is not None:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - started_at
@@ -0,0 +1,398 @@
+import itertools
+from collections import defaultdict
+from collections.abc import Sized
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+)
+
+from pydantic import BaseModel
+from sqlalchemy.exc import (
+    IntegrityError,
+    NoResultFound,
+)
+
+from src.utils.repository import (
+    FOREIGN_KEY_VIOLATION,
+    SCHEMA,
+)
+
+Row = dict[str, Any]
+
+
+class ForeignKeyViolation(Exception):
+    """
+    Driver error of a missing referenced row.
+    """
+
+    sqlstate = FOREIGN_KEY_VIOLATION
+
+
+class MemoryTable:
+    """
+    Rows of a table by ID with an ID sequence
+    and indexes of the columns with lookups by value.
+    Rows are kept in the order of IDs, as IDs only grow.
+    """
+
+    def __init__(self, name: str, indexes: tuple[str, ...] = ()):
+        """
+        Initialization the table.
+        :param name: Table name.
+        :param indexes: Indexed columns.
+        """
+        self.name = name
+        self.rows: dict[int, Row] = {}
+        self.sequence = itertools.count(1)
+        self.indexes: dict[str, defaultdict[Any, dict[int, None]]] = {
+            column: defaultdict(dict) for column in indexes
+        }
+
+    def insert(self, row: Row) -> None:
+        """
+        Inserting a row, restored rows are put back in the order of IDs.
+        :param row: Row with ID.
+        :return: None.
+        """
+        restored = self.rows and row["id"] < next(reversed(self.rows))
+        self.rows[row["id"]] = row
+        if restored:
+            self.rows = dict(sorted(self.rows.items()))
+        for column, index in self.indexes.items():
+            index[row[column]][row["id"]] = None
+
+    def delete(self, obj_id: int) -> Row:
+        """
+        Deleting a row.
+        :param obj_id: Row ID.
+        :return: Deleted row.
+        """
+        row = self.rows.pop(obj_id)
+        for column, index in self.indexes.items():
+            index[row[column]].pop(obj_id, None)
+        return row
+
+    def update(self, obj_id: int, values: Row) -> Row:
+        """
+        Updating columns of a row.
+        :param obj_id: Row ID.
+        :param values: New values of the columns.
+        :return: Old values of the columns.
+        """
+        row = self.rows[obj_id]
+        old_values = {column: row[column] for column in values}
+        for column, index in self.indexes.items():
+            if column in values:
+                index[row[column]].pop(obj_id, None)
+                index[values[column]][obj_id] = None
+        row.update(values)
+        return old_values
+
+    def lookup(self, column: str, value: Any) -> list[Row]:
+        """
+        Getting the rows with a value of an indexed column.
+        :param column: Indexed column.
+        :param value: Column value.
+        :return: Rows ordered by ID.
+        """
+        return [
+            self.rows[obj_id] for obj_id in sorted(self.indexes[column].get(value, ()))
+        ]
+
+
+class MemoryStorage:
+    """
+    Tables of the in-memory database, shared by the sessions
+    of the process like the database is.
+    """
+
+    def __init__(self):
+        """
+        Initialization the storage.
+        """
+        self.tables = {
+            "students": MemoryTable("students"),
+            "scores": MemoryTable("scores", indexes=("student_id",)),
+        }
+
+    def clear(self) -> None:
+        """
+        Deleting all rows and restarting the sequences.
+        :return: None.
+        """
+        self.__init__()
+
+
+memory_storage = MemoryStorage()
+
+
+class MemorySession:
+    """
+    Session of the in-memory database.
+    Changes are applied to the tables at once and journaled,
+    so that a rollback undoes them. There is no isolation,
+    concurrent sessions see uncommitted changes.
+    """
+
+    def __init__(self, storage: MemoryStorage = memory_storage):
+        """
+        Initialization the session.
+        :param storage: Tables of the database.
+        """
+        self.storage = storage
+        self._undo: list[Callable[[], Any]] = []
+
+    def table(self, name: str) -> MemoryTable:
+        return self.storage.tables[name]
+
+    def insert(self, name: str, values: Row) -> int:
+        """
+        Inserting a row with an ID from the table sequence.
+        :param name: Table name.
+        :param values: Row values.
+        :return: ID of the row.
+        """
+        table = self.table(name)
+        row = {"id": next(table.sequence), "version": 1, **values}
+        table.insert(row)
+        self._undo.append(lambda: table.delete(row["id"]))
+        return row["id"]
+
+    def update(self, name: str, obj_id: int, values: Row) -> None:
+        """
+        Updating a row and incrementing its version.
+        :param name: Table name.
+        :param obj_id: Row ID.
+        :param values: New values of the columns.
+        :return: None.
+        """
+        table = self.table(name)
+        row = table.rows.get(obj_id)
+        if row is None:
+            raise NoResultFound
+        old_values = table.update(
+            obj_id,
+            {**values, "version": row["version"] + 1},
+        )
+        self._undo.append(lambda: table.update(obj_id, old_values))
+
+    def delete(self, name: str, obj_id: int) -> Row | None:
+        """
+        Deleting a row.
+        :param name: Table name.
+        :param obj_id: Row ID.
+        :return: Deleted row or None if there is no such row.
+        """
+        table = self.table(name)
+        if obj_id not in table.rows:
+            return None
+        row = table.delete(obj_id)
+        self._undo.append(lambda: table.insert(row))
+        return row
+
+    def check_exists(self, name: str, obj_id: int) -> None:
+        """
+        Checking a foreign key.
+        :param name: Referenced table name.
+        :param obj_id: Referenced row ID.
+        :return: None.
+        """
+        if obj_id not in self.table(name).rows:
+            raise IntegrityError(
+                f"Key (id)=({obj_id}) is not present in table {name}",
+                None,
+                ForeignKeyViolation(),
+            )
+
+    def in_transaction(self) -> bool:
+        return bool(self._undo)
+
+    async def commit(self) -> None:
+        self._undo.clear()
+
+    async def rollback(self) -> None:
+        while self._undo:
+            self._undo.pop()()
+
+    async def close(self) -> None:
+        await self.rollback()
+
+
+class InMemoryRepository:
+    """
+    Repository over a table of the in-memory database
+    with the contract of the database repositories.
+    """
+
+    table_name: str = None
+    schema: type[SCHEMA] = None
+    cache = None
+
+    def __init__(self, session: MemorySession):
+        """
+        Initialization the repository.
+        :param session: In-memory database session.
+        """
+        self.session = session
+
+    @property
+    def table(self) -> MemoryTable:
+        return self.session.table(self.table_name)
+
+    async def add_one(self, data: dict) -> int:
+        """
+        Adding an object.
+        :param data: Object data.
+        :return: ID of the created object.
+        """
+        return self.session.insert(self.table_name, data)
+
+    async def add_many(self, data: list[dict]) -> list[int]:
+        """
+        Adding objects.
+        :param data: Objects data.
+        :return: IDs of the created objects in the order of the data.
+        """
+        return [await self.add_one(obj_data) for obj_data in data]
+
+    async def find_existing_ids(self, ids: set[int]) -> set[int]:
+        """
+        Search for the existing IDs among the given ones.
+        :param ids: Objects IDs.
+        :return: Existing objects IDs.
+        """
+        return ids & self.table.rows.keys()
+
+    async def delete_one(self, obj_id: int) -> None:
+        """
+        Deleting an object by ID.
+        :param obj_id: Object ID.
+        :return: None.
+        """
+        self.session.delete(self.table_name, obj_id)
+
+    async def edit_one(self, obj_id: int, data: dict) -> int:
+        """
+        Updating an object.
+        :param obj_id: Object ID.
+        :param data: Object data.
+        :return: ID of the updated object.
+        """
+        self.session.update(self.table_name, obj_id, data)
+        return obj_id
+
+    async def find_one(self, **filter_by) -> SCHEMA:
+        """
+        Search for an object by filters.
+        :param filter_by: Filters.
+        :return: Object model.
+        """
+        if filter_by.keys() == {"id"}:
+            row = self.table.rows.get(filter_by["id"])
+            rows = [] if row is None else [row]
+        else:
+            rows = list(self._filter_by(self.table.rows.values(), filter_by))
+        if len(rows) != 1:
+            raise NoResultFound
+        return self._to_read_model(rows[0])
+
+    async def find_many(self, ids: list[int]) -> dict[int, SCHEMA]:
+        """
+        Getting objects by IDs.
+        :param ids: Objects IDs.
+        :return: Objects models by ID, the missing IDs are absent.
+        """
+        return {
+            obj_id: self._to_read_model(self.table.rows[obj_id])
+            for obj_id in ids
+            if obj_id in self.table.rows
+        }
+
+    async def find_all(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        after_id: int | None = None,
+        filters: BaseModel | None = None,
+    ) -> list[SCHEMA]:
+        """
+        Getting objects ordered by ID.
+        :param offset: Quantity of objects to skip.
+        :param limit: Maximum quantity of objects.
+        :param after_id: Return only objects with a greater ID.
+        :param filters: Filter params.
+        :return: List of objects models.
+        """
+        rows = self._rows(filters)
+        if after_id is not None:
+            rows = (row for row in rows if row["id"] > after_id)
+        return [self._to_read_model(row) for row in self._slice(rows, offset, limit)]
+
+    async def count(self, filters: BaseModel | None = None) -> int:
+        """
+        Counting objects.
+        :param filters: Filter params.
+        :return: Quantity of objects.
+        """
+        rows = self._rows(filters)
+        if isinstance(rows, Sized):
+            return len(rows)
+        return sum(1 for _ in rows)
+
+    async def stream_all(
+        self,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[SCHEMA]:
+        """
+        Streaming all objects ordered by ID.
+        :param chunk_size: Unused, kept for the contract.
+        :return: Asynchronous iterator over objects models.
+        """
+        for row in list(self.table.rows.values()):
+            yield self._to_read_model(row)
+
+    def _rows(self, filters: BaseModel | None) -> Iterable[Row]:
+        """
+        Rows matching the filter params, each set param
+        is compared for equality with the column of the same name.
+        :param filters: Filter params.
+        :return: Rows ordered by ID.
+        """
+        rows = self.table.rows.values()
+        filter_by = (
+            {}
+            if filters is None
+            else filters.model_dump(
+                exclude_none=True,
+            )
+        )
+        if not filter_by:
+            return rows
+        return self._filter_by(rows, filter_by)
+
+    def _to_read_model(self, row: Row) -> SCHEMA:
+        """
+        Conversion of a row to a pydantic model.
+        :param row: Row.
+        :return: Pydantic model.
+        """
+        return self.schema.model_validate(row)
+
+    @staticmethod
+    def _filter_by(rows: Iterable[Row], filter_by: dict) -> Iterable[Row]:
+        return (
+            row
+            for row in rows
+            if all(row[name] == value for name, value in filter_by.items())
+        )
+
+    @staticmethod
+    def _slice(
+        rows: Iterable[Row],
+        offset: int,
+        limit: int | None,
+    ) -> Iterable[Row]:
+        stop = None if limit is None else offset + limit
+        return itertools.islice(rows, offset, stop)
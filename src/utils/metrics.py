@@ -0,0 +1,144 @@
+import functools
+import os
+import time
+from contextvars import ContextVar
+from typing import (
+    Awaitable,
+    Callable,
+    TypeVar,
+)
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+from sqlalchemy import (
+    Engine,
+    event,
+)
+
+T = TypeVar("T")
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Under gunicorn every worker writes its values to files in this
+# directory and a scrape of any worker merges all of them.
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests.",
+    ["method", "route"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being processed.",
+    multiprocess_mode="livesum",
+)
+RESPONSES = Counter(
+    "http_responses_total",
+    "HTTP responses by status code.",
+    ["method", "route", "status"],
+)
+
+POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts_total",
+    "Connections checked out from the pool.",
+    ["pool"],
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out from the pool.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections opened over the pool size.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time waiting for a free connection of the pool, without opening one.",
+    ["pool"],
+)
+
+REPOSITORY_QUERY_DURATION = Histogram(
+    "repository_query_duration_seconds",
+    "Duration of the queries of the repositories methods.",
+    ["repository", "method"],
+)
+
+# Repository and method the executed queries are attributed to.
+query_source: ContextVar[tuple[str, str] | None] = ContextVar(
+    "query_source",
+    default=None,
+)
+
+QUERY_STARTED_AT = "query_started_at"
+
+
+def get_metrics() -> bytes:
+    """
+    Rendering the metrics in the Prometheus text format.
+    :return: Metrics of all the workers.
+    """
+    if MULTIPROC_DIR is None:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def measure_queries(
+    repository: str,
+    method: str,
+    func: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """
+    Attributing the queries executed by a repository method to it.
+    :param repository: Repository name.
+    :param method: Method name.
+    :param func: Method.
+    :return: Wrapped method.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> T:
+        token = query_source.set((repository, method))
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            query_source.reset(token)
+
+    wrapper.measured = True
+    return wrapper
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    """
+    Remembering the start of a query on its connection.
+    """
+    conn.info[QUERY_STARTED_AT] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def observe_query(conn, cursor, statement, parameters, context, executemany):
+    """
+    Observing the duration of a query for the repository method
+    that executed it.
+    """
+    started_at = conn.info.pop(QUERY_STARTED_AT)
+    source = query_source.get()
+    if source is not None:
+        REPOSITORY_QUERY_DURATION.labels(*source).observe(
+            time.perf_counter() - started_at,
+        )
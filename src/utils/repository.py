@@ -1,16 +1,53 @@
-from typing import TypeVar
+import inspect
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    TypeVar,
+)
 
+from asyncpg.exceptions import IntegrityConstraintViolationError
 from pydantic import BaseModel
 from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Integer,
+    Row,
+    any_,
+    bindparam,
     delete,
+    event,
+    func,
     insert,
     select,
     update,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-
+from src.config.config import settings
 from src.db.db import Base
+from src.db.replicas import REPLICA
+from src.utils.cache import (
+    LRUCache,
+    MISSING,
+    repository_cache,
+)
+from src.utils.metrics import measure_queries
+
+# Batches of at least this size are loaded with COPY instead of INSERT.
+COPY_THRESHOLD = 1000
+
+# Session info key of the cache invalidations repeated after commit.
+PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+# SQLSTATE of the PostgreSQL foreign_key_violation error.
+FOREIGN_KEY_VIOLATION = "23503"
 
 SCHEMA = TypeVar(
     "SCHEMA",
@@ -22,8 +59,75 @@ MODEL = TypeVar(
 )
 
 
+def invalidate_cache(
+    cache: LRUCache,
+    namespace: str,
+    ids: tuple[int, ...],
+) -> None:
+    """
+    Invalidating cached objects and lists of a table.
+    :param cache: Cache.
+    :param namespace: Table name.
+    :param ids: IDs of the changed objects.
+    :return: None.
+    """
+    for obj_id in ids:
+        cache.delete((namespace, "one", obj_id))
+    cache.invalidate(namespace)
+
+
+def is_foreign_key_violation(exc: IntegrityError) -> bool:
+    """
+    Checking whether an integrity error is a foreign key violation,
+    not a violation of another constraint.
+    :param exc: Integrity error.
+    :return: Whether a referenced row is missing.
+    """
+    return getattr(exc.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_cache_after_commit(session: Session) -> None:
+    """
+    Repeating the invalidations of the committed transaction,
+    so that values read concurrently before the commit are dropped.
+    :param session: Database session.
+    :return: None.
+    """
+    for cache, namespace, ids in session.info.pop(PENDING_INVALIDATIONS, ()):
+        invalidate_cache(cache, namespace, ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_cache_invalidations(session: Session) -> None:
+    """
+    Discarding the invalidations of the rolled back transaction.
+    :param session: Database session.
+    :return: None.
+    """
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+
 class BaseRepository:
     model: MODEL = None
+    schema: type[SCHEMA] = None
+    cache: LRUCache | None = repository_cache
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Attributing the queries of the public methods of a repository
+        to the method in the metrics.
+        """
+        super().__init_subclass__(**kwargs)
+        for name in dir(cls):
+            method = getattr(cls, name)
+            if (
+                name.startswith("_")
+                or not inspect.iscoroutinefunction(method)
+                or getattr(method, "measured", False)
+            ):
+                continue
+            setattr(cls, name, measure_queries(cls.__name__, name, method))
 
     def __init__(self, session: AsyncSession):
         """
@@ -40,8 +144,106 @@ class BaseRepository:
         """
         statement = insert(self.model).values(**data).returning(self.model.id)
         result = await self.session.execute(statement)
+        self._invalidate()
         return result.scalar_one()
 
+    async def add_many(self, data: list[dict]) -> list[int]:
+        """
+        Adding objects to the database in one batch.
+        Small batches use a multi-row INSERT, large ones use COPY
+        with IDs allocated from the sequence beforehand.
+        :param data: Objects data with the same keys.
+        :return: IDs of the created objects in the order of the data.
+        """
+        if not data:
+            return []
+        self._invalidate()
+        if len(data) < COPY_THRESHOLD:
+            statement = insert(self.model).returning(
+                self.model.id,
+                sort_by_parameter_order=True,
+            )
+            result = await self.session.execute(statement, data)
+            return list(result.scalars())
+        ids = await self._allocate_ids(len(data))
+        columns = list(data[0])
+        # COPY bypasses SQLAlchemy types, enums are stored by name.
+        records = [
+            (
+                obj_id,
+                *(
+                    value.name if isinstance(value, Enum) else value
+                    for value in (row[column] for column in columns)
+                ),
+            )
+            for obj_id, row in zip(ids, data)
+        ]
+        await self._copy_records(
+            self.model.__tablename__,
+            ["id", *columns],
+            records,
+        )
+        return ids
+
+    async def find_existing_ids(self, ids: set[int]) -> set[int]:
+        """
+        Search for the existing IDs among the given ones.
+        Found rows are locked against deletion until the end
+        of the transaction.
+        :param ids: Objects IDs.
+        :return: Existing objects IDs.
+        """
+        statement = (
+            select(self.model.id)
+            .where(self.model.id.in_(ids))
+            .with_for_update(read=True, key_share=True)
+        )
+        result = await self.session.execute(statement)
+        return set(result.scalars())
+
+    async def _allocate_ids(self, quantity: int) -> list[int]:
+        """
+        Reserving IDs from the primary key sequence.
+        :param quantity: Quantity of IDs.
+        :return: Reserved IDs.
+        """
+        sequence = func.pg_get_serial_sequence(
+            self.model.__tablename__,
+            "id",
+        )
+        statement = select(func.nextval(sequence)).select_from(
+            func.generate_series(1, quantity)
+        )
+        result = await self.session.execute(statement)
+        return list(result.scalars())
+
+    async def _copy_records(
+        self,
+        table_name: str,
+        columns: list[str],
+        records: list[tuple],
+    ) -> None:
+        """
+        Loading records into a table with COPY
+        within the current transaction.
+        :param table_name: Table name.
+        :param columns: Columns names.
+        :param records: Records in the order of the columns.
+        :return: None.
+        :raises IntegrityError: If a constraint is violated,
+        as for the statements executed through SQLAlchemy.
+        """
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        try:
+            await raw_connection.driver_connection.copy_records_to_table(
+                table_name,
+                records=records,
+                columns=columns,
+            )
+        except IntegrityConstraintViolationError as exc:
+            raise IntegrityError(f"COPY {table_name}", None, exc) from exc
+
     async def delete_one(self, obj_id: int) -> None:
         """
         Deleting an object from the database by ID.
@@ -50,6 +252,7 @@ class BaseRepository:
         """
         statement = delete(self.model).filter_by(id=obj_id)
         await self.session.execute(statement)
+        self._invalidate(obj_id)
 
     async def edit_one(self, obj_id: int, data: dict) -> int:
         """
@@ -60,29 +263,289 @@ class BaseRepository:
         """
         statement = (
             update(self.model)
-            .values(**data)
+            .values(**data, version=self.model.version + 1)
             .filter_by(id=obj_id)
             .returning(self.model.id)
         )
         result = await self.session.execute(statement)
+        self._invalidate(obj_id)
         return result.scalar_one()
 
     async def find_one(self, **filter_by) -> SCHEMA:
+        """
+        Search for an object by filters.
+        Lookups by ID are served from the cache.
+        :param filter_by: Filters.
+        :return: Object model.
+        """
+        if filter_by.keys() != {"id"}:
+            return await self._find_one(**filter_by)
+        return await self._read_through(
+            ("one", filter_by["id"]),
+            lambda: self._find_one(**filter_by),
+        )
+
+    async def find_many(self, ids: list[int]) -> dict[int, SCHEMA]:
+        """
+        Getting objects by IDs, those cached are taken from the cache
+        and the rest are loaded with one query.
+        :param ids: Objects IDs.
+        :return: Objects models by ID, the missing IDs are absent.
+        """
+        if self.cache is None:
+            return await self._find_many(ids)
+        namespace = self.model.__tablename__
+        generation = self.cache.generation(namespace)
+        found = {}
+        missing_ids = []
+        for obj_id in ids:
+            value = self.cache.get((namespace, "one", obj_id))
+            if value is MISSING:
+                missing_ids.append(obj_id)
+            else:
+                found[obj_id] = value
+        if missing_ids:
+            loaded = await self._find_many(missing_ids)
+            if self._can_store(namespace, generation):
+                for obj_id, value in loaded.items():
+                    self.cache.set((namespace, "one", obj_id), value)
+            found.update(loaded)
+        return found
+
+    async def find_all(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        after_id: int | None = None,
+        filters: BaseModel | None = None,
+    ) -> list[SCHEMA]:
+        """
+        Getting objects ordered by ID through the cache.
+        :param offset: Quantity of objects to skip.
+        :param limit: Maximum quantity of objects.
+        :param after_id: Return only objects with a greater ID.
+        :param filters: Filter params.
+        :return: List of objects models.
+        """
+        return await self._read_through(
+            ("all", offset, limit, after_id, filters),
+            lambda: self._find_all(offset, limit, after_id, filters),
+            per_generation=True,
+        )
+
+    async def count(self, filters: BaseModel | None = None) -> int:
+        """
+        Counting objects through the cache.
+        :param filters: Filter params.
+        :return: Quantity of objects.
+        """
+        return await self._read_through(
+            ("count", filters),
+            lambda: self._count(filters),
+            per_generation=True,
+        )
+
+    async def _find_one(self, **filter_by) -> SCHEMA:
         """
         Search for an object by filters in the database.
         :param filter_by: Filters.
         :return: Object model.
         """
-        statement = select(self.model).filter_by(**filter_by)
+        statement = select(*self._read_columns()).filter_by(**filter_by)
         result = await self.session.execute(statement)
-        return result.scalar_one().to_read_model()
+        return self._to_read_model(result.keys(), result.one())
 
-    async def find_all(self) -> list[SCHEMA]:
+    async def _find_many(self, ids: list[int]) -> dict[int, SCHEMA]:
+        """
+        Getting objects by IDs from the database.
+        :param ids: Objects IDs.
+        :return: Objects models by ID.
         """
-        Getting all objects from the database.
+        statement = select(*self._read_columns()).where(
+            self.model.id == self._any_id(ids),
+        )
+        result = await self.session.execute(statement)
+        keys = result.keys()
+        return {
+            obj.id: obj for obj in (self._to_read_model(keys, row) for row in result)
+        }
+
+    @staticmethod
+    def _any_id(ids: list[int]):
+        """
+        Comparison operand matching any of the IDs.
+        The IDs are bound as one array, so the statement text
+        and its prepared statement do not depend on their quantity.
+        :param ids: IDs.
+        :return: ANY expression.
+        """
+        return any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+
+    async def _find_all(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        after_id: int | None = None,
+        filters: BaseModel | None = None,
+    ) -> list[SCHEMA]:
+        """
+        Getting objects from the database ordered by ID.
+        :param offset: Quantity of objects to skip.
+        :param limit: Maximum quantity of objects.
+        :param after_id: Return only objects with a greater ID.
+        :param filters: Filter params.
         :return: List of objects models.
         """
-        statement = select(self.model)
+        statement = (
+            select(*self._read_columns())
+            .where(*self._where(filters))
+            .order_by(self.model.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        if after_id is not None:
+            statement = statement.where(self.model.id > after_id)
         result = await self.session.execute(statement)
-        result = [row[0].to_read_model() for row in result.all()]
-        return result
+        keys = result.keys()
+        return [self._to_read_model(keys, row) for row in result]
+
+    def _read_columns(self) -> list[Column]:
+        """
+        Columns selected instead of the mapped entity,
+        those of the schema fields.
+        :return: List of columns.
+        """
+        columns = self.model.__table__.c
+        return [columns[name] for name in self.schema.model_fields if name in columns]
+
+    def _to_read_model(self, keys, row: Row) -> SCHEMA:
+        """
+        Conversion of a projected row to a pydantic model.
+        :param keys: Names of the row columns.
+        :param row: Row.
+        :return: Pydantic model.
+        """
+        return self.schema.model_validate(dict(zip(keys, row)))
+
+    async def _count(self, filters: BaseModel | None = None) -> int:
+        """
+        Counting objects in the database.
+        :param filters: Filter params.
+        :return: Quantity of objects.
+        """
+        statement = (
+            select(func.count()).select_from(self.model).where(*self._where(filters))
+        )
+        result = await self.session.execute(statement)
+        return result.scalar_one()
+
+    def _where(self, filters: BaseModel | None) -> list[ColumnElement]:
+        """
+        Conditions of the filter params, each set param
+        is compared for equality with the column of the same name.
+        :param filters: Filter params.
+        :return: List of conditions.
+        """
+        if filters is None:
+            return []
+        return [
+            self.model.__table__.c[name] == value
+            for name, value in filters.model_dump(exclude_none=True).items()
+        ]
+
+    async def _read_through(
+        self,
+        key: tuple[Hashable, ...],
+        loader: Callable[[], Awaitable[Any]],
+        per_generation: bool = False,
+    ) -> Any:
+        """
+        Getting a value from the cache, loading it on a miss.
+        A loaded value is not stored if the table was written meanwhile.
+        :param key: Key within the table namespace.
+        :param loader: Loader of the value.
+        :param per_generation: Whether the key is dropped on any
+        write to the table, as for lists.
+        :return: Value.
+        """
+        if self.cache is None:
+            return await loader()
+        namespace = self.model.__tablename__
+        generation = self.cache.generation(namespace)
+        key = (namespace, *key)
+        if per_generation:
+            key = (*key, generation)
+        value = self.cache.get(key)
+        if value is MISSING:
+            value = await loader()
+            if self._can_store(namespace, generation):
+                self.cache.set(key, value)
+        return value
+
+    def _can_store(self, namespace: str, generation: int) -> bool:
+        """
+        Checking whether a value loaded at a generation may be cached.
+        :param namespace: Table name.
+        :param generation: Generation of the table before the loading.
+        :return: Whether the value is still current.
+        """
+        if self.cache.generation(namespace) != generation:
+            return False
+        # A lagging replica may still return the overwritten value.
+        return not (
+            self.session.info.get(REPLICA)
+            and self.cache.invalidated_within(
+                namespace,
+                settings.db.REPLICA_MAX_LAG,
+            )
+        )
+
+    def _invalidate(
+        self,
+        *ids: int,
+        model: type[MODEL] | None = None,
+    ) -> None:
+        """
+        Invalidating cached objects and lists of a table
+        now and once more after commit.
+        :param ids: IDs of the changed objects.
+        :param model: Changed model, the repository model by default.
+        :return: None.
+        """
+        if self.cache is None:
+            return
+        namespace = (model or self.model).__tablename__
+        invalidate_cache(self.cache, namespace, ids)
+        self.session.info.setdefault(PENDING_INVALIDATIONS, []).append(
+            (self.cache, namespace, ids),
+        )
+
+    async def stream_all(
+        self,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[SCHEMA]:
+        """
+        Streaming all objects from the database ordered by ID
+        using a server-side cursor.
+        A cursor lives only in a transaction, so an autocommit
+        read-only session opens a READ ONLY one for the stream.
+        :param chunk_size: Quantity of rows fetched per round trip.
+        :return: Asynchronous iterator over objects models.
+        """
+        bind_options = self.session.get_bind().get_execution_options()
+        if bind_options.get("isolation_level") == "AUTOCOMMIT":
+            await self.session.connection(
+                execution_options={
+                    "isolation_level": "READ COMMITTED",
+                    "postgresql_readonly": True,
+                },
+            )
+        statement = (
+            select(*self._read_columns())
+            .order_by(self.model.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.session.stream(statement)
+        keys = result.keys()
+        async for row in result:
+            yield self._to_read_model(keys, row)
@@ -0,0 +1,117 @@
+import asyncio
+import functools
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from src.db.replicas import primary_pinned
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalescing of identical concurrent calls within the worker.
+    The first caller of a key starts the call, the callers arriving
+    while it is in flight await the same call and share its result.
+    """
+
+    def __init__(self):
+        """
+        Initialization the single-flight group.
+        """
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Calling a function or joining its call in flight.
+        The call runs in its own task, so a cancelled caller
+        does not cancel it for the others.
+        :param key: Key of identical calls.
+        :param func: Function.
+        :return: Result of the function.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(functools.partial(self._forget, key))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(call)
+
+    def coalesce(
+        self,
+        service_method: Callable[..., Awaitable[T]],
+    ) -> Callable[..., Awaitable[T]]:
+        """
+        Decorator coalescing the calls of a read-only service method.
+        The key is the method and its arguments except the transaction,
+        the transaction of the first caller is used.
+        Calls of the clients that wrote recently are not coalesced,
+        they must see their own writes.
+        :param service_method: Service method.
+        :return: Decorated service method.
+        """
+
+        @functools.wraps(service_method)
+        async def wrapper(transaction, *args, **kwargs) -> T:
+            if primary_pinned.get():
+                return await service_method(transaction, *args, **kwargs)
+            key = (
+                service_method.__qualname__,
+                *(self._key_part(arg) for arg in args),
+                *(
+                    (name, self._key_part(value))
+                    for name, value in sorted(kwargs.items())
+                ),
+            )
+            return await self.do(
+                key,
+                lambda: service_method(transaction, *args, **kwargs),
+            )
+
+        return wrapper
+
+    def _forget(self, key: Hashable, call: asyncio.Future) -> None:
+        """
+        Removing a finished call, so that later callers start a new one.
+        :param key: Key of the call.
+        :param call: Finished call.
+        :return: None.
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            # Retrieved for the case all the callers were cancelled.
+            call.exception()
+
+    @staticmethod
+    def _key_part(arg: Any) -> Hashable:
+        """
+        Hashable representation of an argument.
+        :param arg: Argument.
+        :return: Key part.
+        """
+        if isinstance(arg, BaseModel):
+            return type(arg).__name__, arg.model_dump_json()
+        return arg
+
+
+single_flight = SingleFlight()
@@ -3,9 +3,20 @@ from abc import (
     abstractmethod,
 )
 
-from src.db.db import async_session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.db import (
+    async_session,
+    read_only_session,
+)
+from src.db.replicas import replica_router
+from src.repositories.memory import (
+    InMemoryScoresRepository,
+    InMemoryStudentsRepository,
+)
 from src.repositories.scores import ScoresRepository
 from src.repositories.students import StudentsRepository
+from src.utils.memory import MemorySession
 
 
 class BaseManager(ABC):
@@ -39,17 +50,88 @@ class BaseManager(ABC):
 
 
 class TransactionManager(BaseManager):
+    """
+    Manager of a database transaction.
+    The session and the repositories are created on first access,
+    so a request that never reaches the database takes no connection.
+    """
+
     def __init__(self):
         self.session_factory = async_session
+        self._session: AsyncSession | None = None
+        self._scores_repo: ScoresRepository | None = None
+        self._students_repo: StudentsRepository | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    @property
+    def scores_repo(self) -> ScoresRepository:
+        if self._scores_repo is None:
+            self._scores_repo = ScoresRepository(self.session)
+        return self._scores_repo
+
+    @property
+    def students_repo(self) -> StudentsRepository:
+        if self._students_repo is None:
+            self._students_repo = StudentsRepository(self.session)
+        return self._students_repo
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        if self._session is None:
+            return
+        # After a commit there is nothing left to roll back.
+        if self._session.in_transaction():
+            await self.rollback()
+        await self._session.close()
+        self._session = None
+        self._scores_repo = None
+        self._students_repo = None
+
+    async def commit(self):
+        if self._session is not None:
+            await self._session.commit()
+
+    async def rollback(self):
+        if self._session is not None:
+            await self._session.rollback()
+
+
+class ReadOnlyTransactionManager(TransactionManager):
+    """
+    Manager for the requests that only read.
+    The queries run in autocommit mode without BEGIN and ROLLBACK,
+    each one sees its own snapshot.
+    A read replica is used if there is one and the client
+    is not pinned to the primary after a write.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.session_factory = replica_router.choose() or read_only_session
+
+
+class InMemoryManager(BaseManager):
+    """
+    Manager of a transaction of the in-memory database,
+    changes not committed are undone on exit.
+    """
+
+    def __init__(self):
+        self.session = MemorySession()
+        self.scores_repo = InMemoryScoresRepository(self.session)
+        self.students_repo = InMemoryStudentsRepository(self.session)
 
     async def __aenter__(self):
-        self.session = self.session_factory()
-        self.scores_repo = ScoresRepository(self.session)
-        self.students_repo = StudentsRepository(self.session)
         return self
 
     async def __aexit__(self, *args):
-        await self.rollback()
         await self.session.close()
 
     async def commit(self):